@@ -1,11 +1,20 @@
 # -*- mode: python ; coding: utf-8 -*-
+import os
 
+# Mit icons.rcc (build.ps1 bzw. tools/prepare_valo_icons_downloader.py --pack-rcc) stecken Icon-Ordner und
+# PNG-Logos darin – lose nicht nochmal mitliefern (auch keinen alten icons.atlas), nur .ico + icons.rcc.
+RES = os.path.join('app', 'resources')
+if os.path.isfile(os.path.join(RES, 'icons.rcc')):
+    res_datas = [(os.path.join(RES, f), RES) for f in os.listdir(RES)
+                 if os.path.isfile(os.path.join(RES, f)) and os.path.splitext(f)[1].lower() not in ('.png', '.qrc', '.atlas')]
+else:
+    res_datas = [(RES, RES)]
 
 a = Analysis(
     ['app\\__main__.py'],
     pathex=[],
     binaries=[],
-    datas=[('app\\resources', 'app\\resources')],
+    datas=res_datas,
     hiddenimports=[],
     hookspath=[],
     hooksconfig={},
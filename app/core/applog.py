@@ -0,0 +1,53 @@
+"""
+Datei-Logging über eine Queue: Aufrufer (GUI-Thread, Worker) legen Records nur in eine
+In-Process-Queue; ein Listener-Thread formatiert (inkl. Tracebacks) und schreibt/rotiert.
+Strukturierte Felder kommen über extra=…, z. B. log.info("…", extra={"event": "rank", "duration_ms": 120}).
+"""
+from __future__ import annotations
+import atexit, copy, logging, logging.handlers, queue
+from typing import Optional
+
+LOGGER_NAME = "CValoMgr"
+STRUCT_FIELDS = ("event", "account", "duration_ms")
+_listener: Optional[logging.handlers.QueueListener] = None
+
+class StructuredFormatter(logging.Formatter):
+    """Standard-Format + angehängte Felder 'event=… account=… duration_ms=…' (nur gesetzte)."""
+    def formatMessage(self, record: logging.LogRecord) -> str:
+        s = super().formatMessage(record)
+        extras = [f"{k}={getattr(record, k)}" for k in STRUCT_FIELDS if getattr(record, k, None) is not None]
+        return f"{s} | {' '.join(extras)}" if extras else s
+
+class _LazyQueueHandler(logging.handlers.QueueHandler):
+    """
+    Wie QueueHandler, formatiert aber nichts im aufrufenden Thread: exc_info bleibt am Record
+    und wird erst vom Listener formatiert (Queue ist in-process, kein Pickling nötig).
+    """
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        if record.args:
+            record = copy.copy(record); record.msg = record.getMessage(); record.args = None
+        return record
+
+def setup_file_logging(log_path: str, level: int = logging.INFO) -> logging.Logger:
+    """Richtet den App-Logger einmalig ein (idempotent) und startet den Listener-Thread."""
+    global _listener
+    logger = logging.getLogger(LOGGER_NAME); logger.setLevel(level)
+    if _listener is not None: return logger
+    fh = logging.handlers.RotatingFileHandler(log_path, maxBytes=2_000_000, backupCount=3, encoding="utf-8")
+    fh.setFormatter(StructuredFormatter("%(asctime)s [%(levelname)s] [%(threadName)s] %(message)s"))
+    q: "queue.SimpleQueue[logging.LogRecord]" = queue.SimpleQueue()
+    for h in list(logger.handlers):   # alte, direkt schreibende Handler ersetzen
+        logger.removeHandler(h); h.close()
+    logger.addHandler(_LazyQueueHandler(q)); logger.propagate = False
+    _listener = logging.handlers.QueueListener(q, fh, respect_handler_level=True); _listener.start()
+    atexit.register(shutdown_logging)
+    return logger
+
+def shutdown_logging():
+    """Leert die Queue und stoppt den Listener (bei Programmende)."""
+    global _listener
+    if _listener is None: return
+    listener, _listener = _listener, None
+    try: listener.stop()
+    finally:
+        for h in listener.handlers: h.close()
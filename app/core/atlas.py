@@ -0,0 +1,140 @@
+"""
+Gepackte Icon-Ressourcen (ein File statt dutzender PNGs).
+
+Format (alle Zahlen big-endian):
+  MAGIC (8 Byte) | count u32 | count × [name_len u16 | name utf-8 | offset u64 | length u32] | Daten
+Namen sind relativ zu app/resources mit '/' als Trenner, z. B. 'menu_icons/add.png'.
+Erzeugt wird die Datei von tools/prepare_valo_icons_downloader.py --pack-atlas.
+
+Der Build (build.ps1) liefert stattdessen icons.rcc aus – dieselben Icons als binäre Qt-Ressource (--pack-rcc).
+Einmal per register_rcc() beim Start registriert, liegen sie unter ':/res/<name>' im Speicher. Der Atlas ist die
+Variante ohne Qt-Tools; ausgeliefert wird immer nur eines von beiden.
+Lookup-Reihenfolge: .rcc → Atlas → lose Dateien.
+"""
+from __future__ import annotations
+import os, mmap, struct
+from functools import lru_cache
+from typing import Dict, Iterable, Optional, Tuple, List
+
+ATLAS_MAGIC = b"VMATLAS1"
+ATLAS_NAME = "icons.atlas"
+RCC_NAME = "icons.rcc"
+RCC_ROOT = "/res"                  # Map-Root der registrierten .rcc → ':/res/menu_icons/add.png'
+_HDR = struct.Struct(">I"); _NAME = struct.Struct(">H"); _LOC = struct.Struct(">QI")
+
+def resources_dir() -> str:
+    return os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "resources"))
+
+class AtlasError(Exception): pass
+
+_rcc_file: Optional[str] = None   # registrierte .rcc (None = keine)
+
+def register_rcc(path: Optional[str] = None) -> bool:
+    """Registriert icons.rcc (falls gebaut) einmalig bei Qt. Qt-Import erst hier – core bleibt ohne Qt nutzbar."""
+    global _rcc_file
+    if _rcc_file is not None: return True
+    p = path or os.path.join(resources_dir(), RCC_NAME)
+    if not os.path.isfile(p): return False
+    from PySide6.QtCore import QResource
+    if not QResource.registerResource(p, RCC_ROOT): return False
+    _rcc_file = p; resource_names.cache_clear()
+    return True
+
+def rcc_path(name: str) -> Optional[str]:
+    """Qt-Pfad ':/res/<name>', falls die .rcc registriert ist und den Eintrag enthält – sonst None."""
+    if _rcc_file is None: return None
+    from PySide6.QtCore import QFile
+    p = f":{RCC_ROOT}/{name}"
+    return p if QFile.exists(p) else None
+
+def write_atlas(path: str, entries: Iterable[Tuple[str, bytes]]) -> int:
+    """Schreibt (name, bytes)-Paare als Atlas; Rückgabe: Anzahl Einträge."""
+    items = sorted({n.replace("\\", "/"): b for n, b in entries}.items())
+    table_len = sum(_NAME.size + len(n.encode("utf-8")) + _LOC.size for n, _ in items)
+    offset = len(ATLAS_MAGIC) + _HDR.size + table_len
+    table = bytearray()
+    for name, blob in items:
+        raw = name.encode("utf-8")
+        table += _NAME.pack(len(raw)) + raw + _LOC.pack(offset, len(blob)); offset += len(blob)
+    tmp = path + ".tmp"
+    with open(tmp, "wb") as f:
+        f.write(ATLAS_MAGIC); f.write(_HDR.pack(len(items))); f.write(table)
+        for _, blob in items: f.write(blob)
+    os.replace(tmp, path)
+    return len(items)
+
+class IconAtlas:
+    """Memory-mapped Atlas; Icons werden erst bei Zugriff aus der Map geschnitten."""
+    def __init__(self, path: str):
+        self.path = path
+        self._f = open(path, "rb")
+        try:
+            self._mm = mmap.mmap(self._f.fileno(), 0, access=mmap.ACCESS_READ)
+            self._index = self._read_index()
+        except Exception as e:
+            self._f.close(); raise AtlasError(f"Ungültiger Atlas: {path} ({e})") from e
+    def _read_index(self) -> Dict[str, Tuple[int, int]]:
+        mm = self._mm; pos = len(ATLAS_MAGIC)
+        if mm[:pos] != ATLAS_MAGIC: raise AtlasError("Magic stimmt nicht")
+        (count,) = _HDR.unpack_from(mm, pos); pos += _HDR.size
+        index: Dict[str, Tuple[int, int]] = {}
+        for _ in range(count):
+            (n,) = _NAME.unpack_from(mm, pos); pos += _NAME.size
+            name = bytes(mm[pos:pos+n]).decode("utf-8"); pos += n
+            off, ln = _LOC.unpack_from(mm, pos); pos += _LOC.size
+            if off + ln > len(mm): raise AtlasError(f"Eintrag außerhalb der Datei: {name}")
+            index[name] = (off, ln)
+        return index
+    def __contains__(self, name: str) -> bool: return name in self._index
+    def __len__(self) -> int: return len(self._index)
+    def names(self, prefix: str = "") -> List[str]:
+        return [n for n in self._index if n.startswith(prefix)]
+    def get(self, name: str) -> Optional[bytes]:
+        loc = self._index.get(name)
+        if loc is None: return None
+        off, ln = loc; return self._mm[off:off+ln]
+    def close(self):
+        try: self._mm.close()
+        finally: self._f.close()
+
+@lru_cache(maxsize=1)
+def default_atlas() -> Optional[IconAtlas]:
+    """Atlas neben den Ressourcen (falls gebaut) – sonst None (Fallback: lose Dateien)."""
+    p = os.path.join(resources_dir(), ATLAS_NAME)
+    if not os.path.isfile(p): return None
+    try: return IconAtlas(p)
+    except AtlasError: return None
+
+def read_resource(name: str) -> Optional[bytes]:
+    """Ressource aus der .rcc, dem Atlas oder – falls nicht gepackt – als lose Datei lesen."""
+    qp = rcc_path(name)
+    if qp is not None:
+        from PySide6.QtCore import QFile
+        f = QFile(qp)
+        if f.open(QFile.ReadOnly):
+            try: return bytes(f.readAll())
+            finally: f.close()
+    atlas = default_atlas()
+    if atlas is not None:
+        blob = atlas.get(name)
+        if blob is not None: return blob
+    p = os.path.join(resources_dir(), *name.split("/"))
+    try:
+        with open(p, "rb") as f: return f.read()
+    except OSError:
+        return None
+
+@lru_cache(maxsize=None)
+def resource_names(folder: str) -> Tuple[str, ...]:
+    """Dateinamen (ohne Ordner) eines Ressourcen-Ordners – einmalig ermittelt."""
+    folder = folder.rstrip("/"); prefix = folder + "/"
+    if _rcc_file is not None:
+        from PySide6.QtCore import QDir
+        names = QDir(f":{RCC_ROOT}/{folder}").entryList(QDir.Files)
+        if names: return tuple(sorted(names))
+    atlas = default_atlas()
+    if atlas is not None:
+        names = [n[len(prefix):] for n in atlas.names(prefix)]
+        if names: return tuple(sorted(names))
+    try: return tuple(sorted(os.listdir(os.path.join(resources_dir(), folder))))
+    except OSError: return ()
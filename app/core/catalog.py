@@ -0,0 +1,79 @@
+"""
+Metadaten-Katalog (Valorant Competitive Tiers + DataDragon-Versionen).
+
+Wird einmal geladen und mit TTL im Disk-Cache abgelegt. Lookups aus dem GUI-Thread
+(fetch=False) lesen nur Speicher/Disk – das Netzwerk wird nur über refresh() bzw.
+fetch=True (Worker-Thread) angefasst. Ist nichts erreichbar, liefern die Lookups None
+und die Aufrufer greifen auf ihre Defaults zurück.
+"""
+from __future__ import annotations
+import time
+from typing import Any, Callable, Dict, Optional, Tuple
+from . import cache
+from .http import request
+from .settings import Settings
+from .tiers import Tier, parse_tier
+
+CATALOG_TTL = 24 * 3600          # danach wird (im Hintergrund) neu geladen
+STALE_TTL = 365 * 24 * 3600      # veraltete Daten sind besser als gar keine
+_mem: Dict[str, Tuple[float, Any]] = {}
+
+def _valorant_tiers_url(settings: Settings) -> str:
+    return f"{settings.valorant_api_base.rstrip('/')}/competitivetiers"
+
+def _ddragon_versions_url(settings: Settings) -> str:
+    base = settings.ddragon_cdn_base.rstrip("/")
+    if base.endswith("/cdn"): base = base[:-4]
+    return f"{base}/api/versions.json"
+
+def _parse_valorant_tiers(j: Any) -> Dict[str, list]:
+    """Letzte (aktuelle) Episode → {'gold|2': [tier_id, largeIcon-URL]}."""
+    seasons = (j or {}).get("data") or []
+    out: Dict[str, list] = {}
+    for t in (seasons[-1].get("tiers") or []) if seasons else []:
+        tier = parse_tier("valorant", t.get("tierName") or "")
+        icon = t.get("largeIcon") or t.get("smallIcon")
+        if tier.ranked and icon:
+            out[f"{tier.tier}|{tier.division}"] = [int(t.get("tier") or 0), icon]
+    return out
+
+def _parse_versions(j: Any) -> Optional[str]:
+    return j[0] if isinstance(j, list) and j and isinstance(j[0], str) else None
+
+def _load(url: str, parse: Callable[[Any], Any], fetch: bool) -> Any:
+    key = f"catalog:{url}"
+    hit = _mem.get(key)
+    if hit and (not fetch or time.time() - hit[0] <= CATALOG_TTL):
+        return hit[1]
+    data = cache.get(key, ttl=CATALOG_TTL)
+    if data is None and fetch:
+        try:
+            r = request("GET", url, timeout=10)
+            if r is not None and r.status_code == 200:
+                data = parse(r.json())
+                if data: cache.set(key, data)
+        except Exception:
+            data = None
+    if not data:
+        data = cache.get(key, ttl=STALE_TTL)
+    if data:
+        _mem[key] = (time.time() if fetch else (hit[0] if hit else 0.0), data)
+    return data or None
+
+def valorant_tiers(settings: Settings, fetch: bool = False) -> Dict[str, list]:
+    return _load(_valorant_tiers_url(settings), _parse_valorant_tiers, fetch) or {}
+
+def valorant_tier_info(tier: Tier, settings: Settings, fetch: bool = False) -> Optional[Tuple[int, str]]:
+    """(Tier-ID der Valorant-API, Icon-URL) oder None."""
+    if not tier.ranked: return None
+    hit = valorant_tiers(settings, fetch).get(f"{tier.tier}|{tier.division}")
+    return (hit[0], hit[1]) if hit else None
+
+def ddragon_version(settings: Settings, fetch: bool = False) -> str:
+    """Aktuelle DataDragon-Version; Fallback: settings.ddragon_version."""
+    return _load(_ddragon_versions_url(settings), _parse_versions, fetch) or settings.ddragon_version
+
+def refresh(settings: Settings) -> None:
+    """Lädt abgelaufene Katalogteile neu (blockierend – nur aus Worker-Threads aufrufen)."""
+    valorant_tiers(settings, fetch=True)
+    ddragon_version(settings, fetch=True)
@@ -1,7 +1,8 @@
 
 from __future__ import annotations
-import time, requests
+import time
 def request(method, url, *, headers=None, params=None, json=None, data=None, timeout=10, retries=3, backoff=0.6):
+    import requests   # erst beim ersten Abruf (Worker-Thread) – hält den App-Start schlank
     last=None
     for i in range(retries):
         try:
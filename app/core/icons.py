@@ -1,30 +1,68 @@
-
 from __future__ import annotations
-import os, requests, hashlib
-from typing import Optional
+import os, hashlib
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional, Iterable, Dict, Tuple
 from .settings import Settings
+from .tiers import parse_tier
+from . import catalog
 def icon_cache_dir(settings: Settings)->str:
     d=settings.icon_cache_dir or os.path.join(os.path.expanduser("~"), ".riot_acct_mgr", "icon_cache"); os.makedirs(d, exist_ok=True); return d
 def _safe(url:str)->str:
     h=hashlib.sha256(url.encode()).hexdigest()[:16]; name=url.split("/")[-1].split("?")[0]; return f"{h}_{name or 'icon'}.png"
 LOL_TIER_MAP={"iron":"Emblem_Iron.png","bronze":"Emblem_Bronze.png","silver":"Emblem_Silver.png","gold":"Emblem_Gold.png","platinum":"Emblem_Platinum.png","emerald":"Emblem_Emerald.png","diamond":"Emblem_Diamond.png","master":"Emblem_Master.png","grandmaster":"Emblem_Grandmaster.png","challenger":"Emblem_Challenger.png"}
 def lol_rank_icon_url(tier:str, settings:Settings)->Optional[str]:
-    key=(tier or "").lower()
-    for k in LOL_TIER_MAP:
-        if k in key: return f"{settings.ddragon_cdn_base}/{settings.ddragon_version}/img/ranked/{LOL_TIER_MAP[k]}"
-    return None
-def valorant_tier_icon_url(tier:str)->Optional[str]:
-    key=(tier or "").lower(); ids={"iron":"0","bronze":"3","silver":"6","gold":"9","platinum":"12","diamond":"15","ascendant":"18","immortal":"21","radiant":"24"}
-    for k,v in ids.items():
-        if k in key: return f"https://media.valorant-api.com/competitivetiers/ef7ec5e8-3e00-4a2f-9a1a-74314f33aee7/{v}/largeicon.png"
+    fn=LOL_TIER_MAP.get(parse_tier("lol", tier).tier)
+    return f"{settings.ddragon_cdn_base}/{catalog.ddragon_version(settings)}/img/ranked/{fn}" if fn else None
+# Nur falls der Katalog (valorant-api) noch nie erreichbar war
+_VALO_FALLBACK_IDS={"iron":"0","bronze":"3","silver":"6","gold":"9","platinum":"12","diamond":"15","ascendant":"18","immortal":"21","radiant":"24"}
+def valorant_tier_icon_url(tier:str, settings:Optional[Settings]=None)->Optional[str]:
+    t=parse_tier("valorant", tier)
+    info=catalog.valorant_tier_info(t, settings) if settings is not None else None
+    if info: return info[1]
+    v=_VALO_FALLBACK_IDS.get(t.tier)
+    return f"https://media.valorant-api.com/competitivetiers/ef7ec5e8-3e00-4a2f-9a1a-74314f33aee7/{v}/largeicon.png" if v else None
+def rank_icon_url(game:str, tier:str, settings:Settings)->Optional[str]:
+    return valorant_tier_icon_url(tier, settings) if "valorant" in game.lower() else lol_rank_icon_url(tier, settings)
+def _download(url:str, target:str)->Optional[str]:
+    import requests   # nur im Worker gebraucht
+    try:
+        r=requests.get(url,timeout=10)
+        if r.status_code==200:
+            tmp=target+".part"; open(tmp,"wb").write(r.content); os.replace(tmp,target); return target
+    except Exception: pass
     return None
+def cached_rank_icon(game:str, tier:str, settings:Settings)->Optional[str]:
+    """Nur Cache-Lookup (kein Netzwerk) – sicher im GUI-Thread."""
+    url=rank_icon_url(game, tier, settings)
+    if not url: return None
+    target=os.path.join(icon_cache_dir(settings), _safe(url))
+    return target if os.path.exists(target) else None
 def get_rank_icon(game:str, tier:str, settings:Settings)->Optional[str]:
-    url=valorant_tier_icon_url(tier) if "valorant" in game.lower() else lol_rank_icon_url(tier, settings)
+    url=rank_icon_url(game, tier, settings)
     if not url: return None
     target=os.path.join(icon_cache_dir(settings), _safe(url))
     if os.path.exists(target): return target
-    try:
-        r=requests.get(url,timeout=10); 
-        if r.status_code==200: open(target,"wb").write(r.content); return target
+    return _download(url, target)
+def prefetch_rank_icons(pairs:Iterable[Tuple[str,str]], settings:Settings, max_workers:int=6)->Dict[Tuple[str,str],Optional[str]]:
+    """
+    Lädt fehlende Rank-Icons für (game, tier)-Paare parallel in den Cache.
+    Mehrere Tiers mit derselben URL (z. B. 'Gold I'/'Gold II' bei LoL) werden nur einmal geladen.
+    Aktualisiert vorher den Metadaten-Katalog (blockierend → nur im Worker-Thread aufrufen).
+    Rückgabe: {(game, tier): pfad_oder_None}
+    """
+    try: catalog.refresh(settings)
     except Exception: pass
-    return None
+    by_url: Dict[str, list] = {}; out: Dict[Tuple[str,str],Optional[str]] = {}
+    for game, tier in set(pairs):
+        url=rank_icon_url(game, tier, settings)
+        if not url: out[(game,tier)]=None; continue
+        by_url.setdefault(url, []).append((game,tier))
+    if not by_url: return out
+    cache=icon_cache_dir(settings)
+    def _one(url:str)->Optional[str]:
+        target=os.path.join(cache, _safe(url))
+        return target if os.path.exists(target) else _download(url, target)
+    with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(by_url)))) as ex:
+        for url, path in zip(by_url, ex.map(_one, by_url)):
+            for p in by_url[url]: out[p]=path
+    return out
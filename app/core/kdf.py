@@ -0,0 +1,86 @@
+"""
+KDF-Parameter des Vaults: stehen im Meta-Header (kdf + kdf_params) und werden je Maschine auf
+eine Ziel-Entsperrzeit kalibriert (Ergebnis gecacht). scrypt immer, Argon2id mit cryptography >= 44.
+"""
+from __future__ import annotations
+import json, os, secrets, time
+from typing import Any, Dict
+
+Params = Dict[str, Any]
+
+LEGACY_SCRYPT: Params = {"name": "scrypt", "n": 2**15, "r": 8, "p": 1}   # Vaults ohne kdf_params
+DEFAULT_TARGET_MS = 500
+SCRYPT_MIN_N, SCRYPT_MAX_N = 2**14, 2**17         # 16 … 128 MiB Speicher bei r=8 (auch ältere Rechner im Sync-Ordner)
+ARGON2_MEMORY_KIB = 64 * 1024
+ARGON2_MIN_T, ARGON2_MAX_T = 2, 64
+REKEY_FACTOR = 2.0                                 # automatisch erst ab Faktor 2 stärker neu verschlüsseln
+CACHE_PATH = os.path.join(os.path.expanduser("~"), ".riot_acct_mgr", "kdf_calibration.json")
+
+def argon2_available() -> bool:
+    try: from cryptography.hazmat.primitives.kdf.argon2 import Argon2id  # noqa: F401
+    except ImportError: return False
+    return True
+
+def derive(password: str, salt: bytes, params: Params) -> bytes:
+    pw = password.encode("utf-8"); name = params.get("name", "scrypt")
+    if name == "scrypt":
+        from cryptography.hazmat.primitives.kdf.scrypt import Scrypt
+        return Scrypt(salt=salt, length=32, n=int(params["n"]), r=int(params["r"]), p=int(params["p"])).derive(pw)
+    if name == "argon2id":
+        try: from cryptography.hazmat.primitives.kdf.argon2 import Argon2id
+        except ImportError as e: raise ValueError("Argon2id benötigt cryptography >= 44.") from e
+        return Argon2id(salt=salt, length=32, iterations=int(params["t"]), lanes=int(params["p"]),
+                        memory_cost=int(params["m"])).derive(pw)
+    raise ValueError(f"Unbekannte KDF: {name}")
+
+def cost(params: Params) -> float:
+    """Relativer Aufwand (nur innerhalb derselben KDF vergleichbar)."""
+    if params.get("name") == "argon2id": return float(params["t"]) * params["m"] * params["p"]
+    return float(params["n"]) * params["r"] * params["p"]
+
+def needs_rekey(current: Params, desired: Params) -> bool:
+    """
+    Automatischer Re-Key beim Entsperren nur aufwärts (andere KDF oder > REKEY_FACTOR teurer): teilen sich
+    unterschiedlich schnelle Rechner ein Vault, würde es sonst bei jedem Entsperren hin- und herwechseln.
+    Schwächere Parameter übernimmt erst ein Passwortwechsel.
+    """
+    if current.get("name") != desired.get("name"): return True
+    return cost(desired) > cost(current) * REKEY_FACTOR
+
+def _time_ms(params: Params) -> float:
+    t0 = time.perf_counter(); derive("calibrate", secrets.token_bytes(16), params)
+    return (time.perf_counter() - t0) * 1000
+
+def calibrate(name: str = "scrypt", target_ms: int = DEFAULT_TARGET_MS) -> Params:
+    """Misst einen Lauf mit Minimalparametern und skaliert (Laufzeit ~ linear in n bzw. t)."""
+    if name == "argon2id" and argon2_available():
+        params = {"name": "argon2id", "t": ARGON2_MIN_T, "m": ARGON2_MEMORY_KIB, "p": max(1, min(4, os.cpu_count() or 1))}
+        per_pass = _time_ms(params) / ARGON2_MIN_T
+        params["t"] = max(ARGON2_MIN_T, min(ARGON2_MAX_T, round(target_ms / max(per_pass, 1e-3))))
+        return params
+    params = {"name": "scrypt", "n": SCRYPT_MIN_N, "r": 8, "p": 1}
+    base = _time_ms(params); n = SCRYPT_MIN_N
+    while n < SCRYPT_MAX_N and base * (2 * n / SCRYPT_MIN_N) <= target_ms * 2 ** 0.5:   # nächste Zweierpotenz (log. Mitte)
+        n *= 2
+    params["n"] = n
+    return params
+
+def calibrated(name: str = "scrypt", target_ms: int = DEFAULT_TARGET_MS, cache_path: str = CACHE_PATH) -> Params:
+    """Kalibrierte Parameter dieser Maschine (einmal messen, danach aus dem Cache)."""
+    if name == "argon2id" and not argon2_available(): name = "scrypt"
+    key = f"{name}:{int(target_ms)}"
+    try:
+        with open(cache_path, "r", encoding="utf-8") as f: cache = json.load(f)
+    except (OSError, ValueError):
+        cache = {}
+    if isinstance(cache.get(key), dict):
+        params = dict(cache[key])
+        if params.get("name") == "scrypt": params["n"] = min(int(params.get("n", SCRYPT_MIN_N)), SCRYPT_MAX_N)   # ältere Caches
+        return params
+    params = calibrate(name, target_ms); cache[key] = params
+    try:
+        os.makedirs(os.path.dirname(cache_path), exist_ok=True)
+        with open(cache_path, "w", encoding="utf-8") as f: json.dump(cache, f)
+    except OSError:
+        pass
+    return params
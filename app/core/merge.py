@@ -0,0 +1,53 @@
+"""Import/Merge: fremde Accounts per stabilem Schlüssel mit dem Store zusammenführen (mit Konfliktregel)."""
+from __future__ import annotations
+from dataclasses import dataclass, field
+from typing import Dict, Iterable, List, Set, Tuple
+from .models import Account, AccountStore
+
+KEEP, REPLACE, NEWER = "keep", "replace", "newer"
+POLICIES = {KEEP: "Bestehende behalten", REPLACE: "Import überschreibt", NEWER: "Neuerer Rank-Stand gewinnt"}
+_STATS = ("rank_updated", "wins", "losses")   # lässt AccountStore.update() stehen – beim Merge mit übernehmen
+
+def merge_key(acc: Account) -> Tuple[str, str]:
+    """Riot-ID je Spiel (ohne Groß/Klein), ohne Riot-ID der Alias; die uid passt nur bei Re-Import eigener Exporte."""
+    rid = acc.riot_id.strip().lower()
+    return (acc.game.value, "id:" + rid) if rid else (acc.game.value, "alias:" + acc.alias.strip().lower())
+
+@dataclass
+class MergePlan:
+    added: List[Account] = field(default_factory=list)
+    updated: List[Tuple[Account, Account]] = field(default_factory=list)   # (bestehend, importiert)
+    unchanged: int = 0
+    kept: int = 0          # Konflikt, bestehender Stand bleibt (Regel)
+    duplicates: int = 0    # mehrfach im Import → nur der erste zählt
+
+    def summary(self) -> str:
+        return (f"{len(self.added)} neu, {len(self.updated)} aktualisiert, {self.unchanged} unverändert, "
+                f"{self.kept} Konflikte behalten" + (f", {self.duplicates} Duplikate" if self.duplicates else ""))
+
+def plan_merge(store: AccountStore, incoming: Iterable[Account], policy: str = KEEP) -> MergePlan:
+    """Ordnet importierte Accounts zu (erst uid, dann merge_key); ändert den Store nicht."""
+    if policy not in POLICIES: raise ValueError(f"Unbekannte Konfliktregel: {policy}")
+    by_key: Dict[Tuple[str, str], Account] = {}
+    for a in store: by_key.setdefault(merge_key(a), a)
+    plan = MergePlan(); seen: Set[Tuple[str, str]] = set()
+    for inc in incoming:
+        key = merge_key(inc)
+        if key in seen: plan.duplicates += 1; continue
+        seen.add(key)
+        cur = store.get(inc.uid) or by_key.get(key)
+        if cur is None: plan.added.append(inc)
+        elif cur == inc: plan.unchanged += 1
+        elif policy == REPLACE or (policy == NEWER and (inc.rank_updated or 0) > (cur.rank_updated or 0)):
+            plan.updated.append((cur, inc))
+        else: plan.kept += 1
+    return plan
+
+def apply_merge(store: AccountStore, plan: MergePlan):
+    """Übernimmt den Plan in einem Batch – die Tabellen bekommen nur added/changed-Events, keinen Reset."""
+    with store.batch():
+        for cur, inc in plan.updated:
+            for k in _STATS:
+                if getattr(inc, k) is not None: setattr(cur, k, getattr(inc, k))
+            store.update(cur, inc)
+        if plan.added: store.add(*plan.added)   # freie uids bleiben erhalten (Re-Import erkennt sie wieder)
@@ -1,8 +1,11 @@
 
 from __future__ import annotations
-from dataclasses import dataclass, field
+import uuid
+from contextlib import contextmanager
+from dataclasses import dataclass, field, fields
 from enum import Enum
-from typing import Optional, List
+from typing import Any, Optional, List, Callable, Iterable, Iterator, Dict, Tuple
+from .tiers import Tier, parse_tier
 
 class Game(str, Enum):
     valorant = "Valorant"
@@ -15,7 +18,9 @@ class Queue(str, Enum):
     tft = "TFT Ranked"
     tft_pairs = "TFT Pairs"
 
-@dataclass
+ACCOUNT_SCHEMA = 2   # Version der Account-Dicts im Vault ("v"); fehlt = 1 (wins/losses undeklariert, freie Enum-Texte)
+
+@dataclass(slots=True)
 class Account:
     alias: str
     game: Game
@@ -27,7 +32,167 @@ class Account:
     elo: Optional[int] = None
     kpxc_entry: str = ""
     notes: str = ""
+    wins: Optional[int] = None
+    losses: Optional[int] = None
+    rank_updated: Optional[float] = None   # Unix-Zeit des letzten erfolgreichen Rank-Abrufs
+    uid: str = field(default="", compare=False, repr=False)   # stabile ID; vergibt der AccountStore
+
+    @property
+    def rank(self) -> Tier:
+        """Geparster Rang (gecacht pro (Spiel, Tier-Text)) – für Icons, Sortierung, Filter, Deltas."""
+        return parse_tier(self.game.value, self.tier)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Persistierte Form (aktuelles Schema); 'id' ist die uid."""
+        return {"v": ACCOUNT_SCHEMA, "id": self.uid, "alias": self.alias, "game": self.game.value, "region": self.region,
+                "riot_id": self.riot_id, "queue": self.queue.value if self.queue else None, "tier": self.tier,
+                "rr": self.rr, "elo": self.elo, "kpxc_entry": self.kpxc_entry, "notes": self.notes,
+                "wins": self.wins, "losses": self.losses, "rank_updated": self.rank_updated}
+
+    @classmethod
+    def from_dict(cls, d: Dict[str, Any]) -> "Account":
+        """Liest ein Account-Dict beliebiger bekannter Schema-Version (migriert vorher); ValueError bei ungültigen Daten."""
+        if d.get("v") != ACCOUNT_SCHEMA: d = migrate_account(d)
+        q = d.get("queue")
+        try:
+            return cls(alias=d.get("alias") or "", game=_GAMES[d["game"]], region=d.get("region") or "",
+                       riot_id=d.get("riot_id") or "", queue=_QUEUES[q] if q else None, tier=d.get("tier") or "",
+                       rr=d.get("rr"), elo=d.get("elo"), kpxc_entry=d.get("kpxc_entry") or "", notes=d.get("notes") or "",
+                       wins=d.get("wins"), losses=d.get("losses"), rank_updated=d.get("rank_updated"), uid=d.get("id") or "")
+        except KeyError as e:
+            raise ValueError(f"Account '{d.get('alias', '?')}': unbekannter Wert {e}") from None
+
+_GAMES: Dict[str, Game] = {g.value: g for g in Game}
+_QUEUES: Dict[str, Queue] = {q.value: q for q in Queue}
+
+def _enum_value(enum, v: Any) -> Any:
+    """v1 speicherte teils Namen ('valorant') oder andere Schreibweisen statt der Werte."""
+    if v is None or v == "": return v
+    for e in enum:
+        if v in (e.value, e.name) or str(v).casefold() in (e.value.casefold(), e.name.casefold()): return e.value
+    return v
+
+def _int_or_none(v: Any) -> Optional[int]:
+    try: return None if v is None or v == "" else int(v)
+    except (TypeError, ValueError): return None
+
+def _migrate_v1(d: Dict[str, Any]) -> Dict[str, Any]:
+    d = dict(d); d["v"] = 2
+    d["game"] = _enum_value(Game, d.get("game") or Game.valorant.value)
+    d["queue"] = _enum_value(Queue, d.get("queue")) or None
+    for k in ("rr", "elo", "wins", "losses"): d[k] = _int_or_none(d.get(k))
+    if not d.get("id") and d.get("uid"): d["id"] = d.pop("uid")
+    return d
+
+_MIGRATIONS: Dict[int, Callable[[Dict[str, Any]], Dict[str, Any]]] = {1: _migrate_v1}
+
+def migrate_account(d: Dict[str, Any]) -> Dict[str, Any]:
+    """Hebt ein Account-Dict schrittweise auf ACCOUNT_SCHEMA (das Original bleibt unverändert)."""
+    v = d.get("v", 1)
+    if not isinstance(v, int) or v > ACCOUNT_SCHEMA:
+        raise ValueError(f"Account-Schema v{v} wird von dieser Version nicht unterstützt (max. v{ACCOUNT_SCHEMA}).")
+    while v < ACCOUNT_SCHEMA:
+        d = _MIGRATIONS[v](d); v = d["v"]
+    return d
+
+# Änderungsarten für AccountStore-Listener: (kind, betroffene Accounts)
+ACCOUNTS_ADDED = "added"
+ACCOUNTS_CHANGED = "changed"
+ACCOUNTS_REMOVED = "removed"
+ACCOUNTS_REORDERED = "reordered"
+ACCOUNTS_RESET = "reset"
+_EVENT_ORDER = (ACCOUNTS_REMOVED, ACCOUNTS_ADDED, ACCOUNTS_CHANGED, ACCOUNTS_REORDERED)
+_KEEP_ON_UPDATE = {"uid", "rank_updated", "wins", "losses"}   # verwaltet Store/Rank-Abruf, nicht der Bearbeiten-Dialog
+AccountListener = Callable[[str, List[Account]], None]
+
+def new_account_id() -> str: return uuid.uuid4().hex
+
+class AccountStore:
+    """
+    Accounts mit stabiler ID (Account.uid): Lookup per dict, Reihenfolge als eigene ID-Liste.
+    Verhält sich beim Lesen wie eine Liste (iter/len/[i]); Änderungen nur über die Methoden,
+    die Listener benachrichtigen. Innerhalb von batch() werden Events gesammelt und gebündelt gemeldet.
+    """
+    def __init__(self, accounts: Iterable[Account] = ()):
+        self._by_id: Dict[str, Account] = {}; self._order: List[str] = []
+        self._pos: Optional[Dict[str, int]] = None
+        self._listeners: List[AccountListener] = []
+        self._batch = 0; self._pending: List[Tuple[str, List[Account]]] = []
+        self._put_all(accounts)
+
+    # ---- Lesen ----
+    def __iter__(self) -> Iterator[Account]: return (self._by_id[i] for i in self._order)
+    def __len__(self) -> int: return len(self._order)
+    def __getitem__(self, i: int) -> Account: return self._by_id[self._order[i]]
+    def __contains__(self, acc: object) -> bool:
+        return isinstance(acc, Account) and self._by_id.get(acc.uid) is acc
+    def get(self, uid: Optional[str]) -> Optional[Account]: return self._by_id.get(uid) if uid else None
+    def ids(self) -> List[str]: return list(self._order)
+    def index_of(self, uid: str) -> int:
+        if self._pos is None: self._pos = {u: i for i, u in enumerate(self._order)}
+        return self._pos.get(uid, -1)
+
+    # ---- Events ----
+    def subscribe(self, fn: AccountListener): self._listeners.append(fn)
+    def _emit(self, kind: str, accounts: Iterable[Account] = ()):
+        accs = list(accounts)
+        if self._batch: self._pending.append((kind, accs)); return
+        for fn in list(self._listeners): fn(kind, accs)
+    @contextmanager
+    def batch(self):
+        """Sammelt Änderungen und meldet sie am Ende je Art einmal (bei Reset nur den Reset)."""
+        self._batch += 1
+        try: yield self
+        finally:
+            self._batch -= 1
+            if not self._batch and self._pending: self._flush_pending()
+    def _flush_pending(self):
+        pending, self._pending = self._pending, []
+        if any(k == ACCOUNTS_RESET for k, _ in pending):
+            self._emit(ACCOUNTS_RESET); return
+        for kind in _EVENT_ORDER:
+            hits = [accs for k, accs in pending if k == kind]
+            if hits: self._emit(kind, {id(a): a for accs in hits for a in accs}.values())
+
+    # ---- Mutationen ----
+    def _put_all(self, accounts: Iterable[Account]) -> int:
+        assigned = 0
+        for acc in accounts:
+            if not acc.uid or acc.uid in self._by_id: acc.uid = new_account_id(); assigned += 1   # fehlende/doppelte IDs
+            self._by_id[acc.uid] = acc; self._order.append(acc.uid)
+        self._pos = None
+        return assigned
+    def set_all(self, accounts: Iterable[Account]) -> int:
+        """Ersetzt alle Accounts (ein Reset-Event); gibt die Anzahl neu vergebener IDs zurück."""
+        self._by_id.clear(); self._order.clear(); assigned = self._put_all(accounts); self._emit(ACCOUNTS_RESET)
+        return assigned
+    def add(self, *accounts: Account):
+        self._put_all(accounts); self._emit(ACCOUNTS_ADDED, accounts)
+    def remove(self, *accounts: Account):
+        gone = [a for a in accounts if a in self]
+        if not gone: return
+        ids = {a.uid for a in gone}
+        for uid in ids: del self._by_id[uid]
+        self._order = [u for u in self._order if u not in ids]; self._pos = None
+        self._emit(ACCOUNTS_REMOVED, gone)
+    def update(self, acc: Account, values: Account):
+        """Übernimmt die Felder (außer ID/Rank-Zeitstempel) aus 'values' in 'acc' – die Zeile wird nur aktualisiert."""
+        for f in fields(Account):
+            if f.name not in _KEEP_ON_UPDATE: setattr(acc, f.name, getattr(values, f.name))
+        self._emit(ACCOUNTS_CHANGED, [acc])
+    def touch(self, *accounts: Account):
+        """Meldet in-place geänderte Accounts (z. B. nach einem Rank-Abruf)."""
+        self._emit(ACCOUNTS_CHANGED, accounts)
+    def reorder(self, uids: Iterable[str]):
+        """Neue Reihenfolge; unbekannte IDs werden ignoriert, fehlende hinten angehängt."""
+        seen: set = set(); order: List[str] = []
+        for u in uids:
+            if u in self._by_id and u not in seen: seen.add(u); order.append(u)
+        order += [u for u in self._order if u not in seen]
+        if order == self._order: return
+        self._order = order; self._pos = None
+        self._emit(ACCOUNTS_REORDERED)
 
 @dataclass
 class AppState:
-    accounts: List[Account] = field(default_factory=list)
+    accounts: AccountStore = field(default_factory=AccountStore)
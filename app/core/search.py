@@ -0,0 +1,217 @@
+"""
+Suche/Filter über Accounts.
+
+Freitext wird gegen einen Token-Index (Token → Account-IDs, sortierte Token-Liste für
+Präfix-Suche) aufgelöst; der Index hängt am AccountStore und wird pro Event nur für die
+betroffenen Accounts nachgeführt. Strukturierte Filter werden pro Kandidat geprüft:
+
+  gold euw            alle Begriffe müssen (als Wortanfang) vorkommen
+  region:euw          Feld enthält Wert (alias, riot, region, tier, kpxc, notes, game, queue)
+  tier>=plat          Rang-Vergleich (>, >=, <, <=, =/:), Division optional
+  stale:>1d           Rang länger als 1 Tag nicht aktualisiert (s/m/h/d/w; '<' = frisch)
+  -smurf, -region:na  Negation
+"""
+from __future__ import annotations
+import re, time
+from bisect import bisect_left, insort
+from dataclasses import dataclass
+from typing import Callable, Dict, FrozenSet, Iterable, List, Optional, Set, Tuple
+from .models import (
+    Account, AccountStore, ACCOUNTS_ADDED, ACCOUNTS_CHANGED, ACCOUNTS_REMOVED, ACCOUNTS_RESET
+)
+from .tiers import UNRANKED, parse_tier
+
+_WORD = re.compile(r"\w+")
+_TERM = re.compile(r"^([a-z_]+)(>=|<=|>|<|=|:)(.*)$")
+_CMP = re.compile(r"^(>=|<=|>|<|=)?(.*)$")
+_DURATION = re.compile(r"^(\d+(?:\.\d+)?)\s*([smhdw]?)$")
+_UNITS = {"": 86400, "s": 1, "m": 60, "h": 3600, "d": 86400, "w": 7 * 86400}
+_HAS_DIVISION = re.compile(r"(\d|\s(i|ii|iii|iv))$")
+
+# Feldname (inkl. Kurzformen) → Getter für Textfilter
+_TEXT_FIELDS: Dict[str, Callable[[Account], str]] = {
+    "alias": lambda a: a.alias, "riot": lambda a: a.riot_id, "riot_id": lambda a: a.riot_id, "id": lambda a: a.riot_id,
+    "region": lambda a: a.region, "kpxc": lambda a: a.kpxc_entry, "kpxc_entry": lambda a: a.kpxc_entry,
+    "notes": lambda a: a.notes, "note": lambda a: a.notes, "game": lambda a: a.game.value,
+    "queue": lambda a: a.queue.value if a.queue else "",
+}
+
+class QueryError(ValueError): pass
+
+def tokenize(text: str) -> List[str]:
+    return _WORD.findall((text or "").lower())
+
+def account_tokens(acc: Account) -> FrozenSet[str]:
+    """Such-Tokens eines Accounts (inkl. kanonischem Tier-Namen, z. B. 'plat 2' → 'platinum')."""
+    toks = set()
+    for text in (acc.alias, acc.riot_id, acc.region, acc.tier, acc.kpxc_entry, acc.notes):
+        toks.update(tokenize(text))
+    if acc.rank.tier: toks.add(acc.rank.tier)
+    return frozenset(toks)
+
+def parse_duration(text: str) -> float:
+    m = _DURATION.match(text.strip().lower())
+    if not m: raise QueryError(f"Ungültige Dauer: {text!r} (z. B. 12h, 1d, 2w)")
+    return float(m.group(1)) * _UNITS[m.group(2)]
+
+@dataclass(frozen=True)
+class Term:
+    field: str          # "" = Freitext
+    op: str             # ":" | "=" | ">" | ">=" | "<" | "<="
+    value: str
+    negate: bool = False
+
+@dataclass(frozen=True)
+class Query:
+    terms: Tuple[Term, ...]
+    @property
+    def words(self) -> List[str]:
+        """Positive Freitext-Tokens – werden über den Index aufgelöst."""
+        return [t.value for t in self.terms if not t.field and not t.negate]
+
+def parse_query(text: str) -> Optional[Query]:
+    """Zerlegt die Eingabe; None = kein Filter. Ungültige Filter → QueryError."""
+    terms: List[Term] = []
+    for part in (text or "").lower().split():
+        neg = part.startswith("-") and len(part) > 1
+        if neg: part = part[1:]
+        m = _TERM.match(part)
+        if m and (m.group(1) in _TEXT_FIELDS or m.group(1) in ("tier", "stale")) and m.group(3):
+            field, op, value = m.groups()
+            if field in ("tier", "stale") and op == ":":   # tier:>=plat, stale:>1d
+                inner, value = _CMP.match(value).groups(); op = inner or ":"
+            terms.append(_check(Term(field, op, value.strip(), neg)))
+        else:
+            terms += [Term("", ":", w, neg) for w in tokenize(part)]
+    return Query(tuple(terms)) if terms else None
+
+def _check(t: Term) -> Term:
+    if t.field == "tier" and t.value not in UNRANKED and not any(
+            parse_tier(g, t.value).ranked for g in ("valorant", "lol")):
+        raise QueryError(f"Unbekannter Rang: {t.value!r}")
+    if t.field == "stale": parse_duration(t.value)
+    if t.field in _TEXT_FIELDS and t.op not in (":", "="):
+        raise QueryError(f"'{t.field}' unterstützt nur ':'")
+    return t
+
+def _compare(a: float, op: str, b: float) -> bool:
+    return {">": a > b, ">=": a >= b, "<": a < b, "<=": a <= b}.get(op, a == b)
+
+def _match_term(acc: Account, t: Term, tokens: FrozenSet[str], now: float) -> bool:
+    if not t.field:
+        hit = any(tok.startswith(t.value) for tok in tokens)
+    elif t.field == "tier":
+        rank = acc.rank
+        if t.value in UNRANKED:
+            hit = not rank.ranked
+        elif not rank.ranked:
+            hit = False
+        else:
+            target = parse_tier(acc.game.value, t.value)
+            if t.op in (":", "=") and not _HAS_DIVISION.search(t.value):
+                hit = rank.tier == target.tier
+            else:
+                hit = target.ranked and _compare(rank.ordinal, t.op, target.ordinal)
+    elif t.field == "stale":
+        age = now - acc.rank_updated if acc.rank_updated else float("inf")
+        hit = _compare(age, "<=" if t.op in ("<", "<=") else ">", parse_duration(t.value))
+    else:
+        hit = t.value in _TEXT_FIELDS[t.field](acc).lower()
+    return hit != t.negate
+
+class SearchIndex:
+    """
+    Token-Index über einen AccountStore. set_query() berechnet die erlaubten IDs (allowed);
+    Store-Events aktualisieren Index und allowed nur für die betroffenen Accounts.
+    Muss vor den Tabellen-Models am Store registriert werden, damit diese beim
+    Einfügen/Ändern schon das aktuelle Ergebnis sehen.
+    """
+    def __init__(self, store: AccountStore):
+        self.store = store
+        self._tokens: Dict[str, FrozenSet[str]] = {}     # uid → Tokens
+        self._postings: Dict[str, Set[str]] = {}          # Token → uids
+        self._sorted: List[str] = []                      # alle Tokens, sortiert (Präfix-Suche)
+        self.query: Optional[Query] = None
+        self.allowed: Optional[Set[str]] = None           # None = alles sichtbar
+        self._rebuild()
+        store.subscribe(self._on_store_changed)
+
+    # ---- Index ----
+    def _rebuild(self):
+        self._tokens.clear(); self._postings.clear()
+        for acc in self.store:
+            toks = account_tokens(acc); self._tokens[acc.uid] = toks
+            for t in toks: self._postings.setdefault(t, set()).add(acc.uid)
+        self._sorted = sorted(self._postings)
+
+    def _drop(self, uid: str):
+        for t in self._tokens.pop(uid, ()):
+            ids = self._postings.get(t)
+            if ids is None: continue
+            ids.discard(uid)
+            if not ids:
+                del self._postings[t]
+                i = bisect_left(self._sorted, t)
+                if i < len(self._sorted) and self._sorted[i] == t: del self._sorted[i]
+
+    def _index(self, acc: Account):
+        toks = account_tokens(acc)
+        if self._tokens.get(acc.uid) == toks: return
+        self._drop(acc.uid); self._tokens[acc.uid] = toks
+        for t in toks:
+            ids = self._postings.get(t)
+            if ids is None: self._postings[t] = ids = set(); insort(self._sorted, t)
+            ids.add(acc.uid)
+
+    def _prefix(self, word: str) -> Set[str]:
+        out: Set[str] = set(); i = bisect_left(self._sorted, word)
+        while i < len(self._sorted) and self._sorted[i].startswith(word):
+            out |= self._postings[self._sorted[i]]; i += 1
+        return out
+
+    def _on_store_changed(self, kind: str, accounts: List[Account]):
+        if kind == ACCOUNTS_RESET:
+            self._rebuild()
+            if self.query is not None: self.allowed = self._evaluate(self.query)
+        elif kind == ACCOUNTS_REMOVED:
+            for acc in accounts:
+                self._drop(acc.uid)
+                if self.allowed is not None: self.allowed.discard(acc.uid)
+        elif kind in (ACCOUNTS_ADDED, ACCOUNTS_CHANGED):
+            now = time.time()
+            for acc in accounts:
+                if acc not in self.store: continue
+                self._index(acc)
+                if self.query is not None:
+                    if self.matches(acc, self.query, now): self.allowed.add(acc.uid)
+                    else: self.allowed.discard(acc.uid)
+
+    # ---- Abfrage ----
+    def matches(self, acc: Account, query: Query, now: Optional[float] = None) -> bool:
+        toks = self._tokens.get(acc.uid) or account_tokens(acc); now = time.time() if now is None else now
+        return all(_match_term(acc, t, toks, now) for t in query.terms)
+
+    def _evaluate(self, query: Query) -> Set[str]:
+        words = query.words
+        if words:
+            cand = self._prefix(words[0])
+            for w in words[1:]:
+                if not cand: break
+                cand &= self._prefix(w)
+            rest = [t for t in query.terms if t.field or t.negate]
+            if not rest: return cand
+            accs: Iterable[Account] = (self.store.get(u) for u in cand)
+        else:
+            rest = list(query.terms); accs = self.store
+        now = time.time()
+        return {a.uid for a in accs if a is not None and all(_match_term(a, t, self._tokens.get(a.uid, frozenset()), now) for t in rest)}
+
+    def set_query(self, text: str) -> Optional[Set[str]]:
+        """Neue Suche (QueryError bei ungültigen Filtern – der alte Filter bleibt dann aktiv)."""
+        query = parse_query(text)
+        self.query = query
+        self.allowed = None if query is None else self._evaluate(query)
+        return self.allowed
+
+    def accepts(self, acc: Account) -> bool:
+        return self.allowed is None or acc.uid in self.allowed
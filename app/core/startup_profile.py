@@ -0,0 +1,102 @@
+"""
+Start-Profiler (aktiv nur mit --profile-startup): Phasen-Marken + Importzeiten je Modul.
+
+Nur Standardbibliothek, damit er vor allen schweren Importen (Qt, pydantic, …) aktiviert
+werden kann. Ohne enable() ist mark() ein No-op.
+"""
+from __future__ import annotations
+import json, sys, time
+from importlib.abc import MetaPathFinder
+from typing import Dict, List, Optional, Tuple
+
+class StartupProfiler:
+    def __init__(self):
+        self.t0 = time.perf_counter()
+        self.marks: List[Tuple[str, float]] = []
+        self.imports: Dict[str, Tuple[float, float]] = {}   # Modul → (kumuliert, selbst) in s
+        self._stack: List[List[float]] = []                  # je laufendem Import: [Zeit der Kind-Importe]
+
+    def mark(self, name: str): self.marks.append((name, time.perf_counter() - self.t0))
+
+    def _timed_exec(self, name: str, exec_module):
+        def run(module):
+            self._stack.append([0.0]); t = time.perf_counter()
+            try: exec_module(module)
+            finally:
+                dt = time.perf_counter() - t; children = self._stack.pop()[0]
+                self.imports[name] = (dt, dt - children)
+                if self._stack: self._stack[-1][0] += dt
+        return run
+
+    def by_package(self) -> List[Tuple[str, float]]:
+        agg: Dict[str, float] = {}
+        for name, (_, own) in self.imports.items():
+            root = name.split(".")[0]; agg[root] = agg.get(root, 0.0) + own
+        return sorted(agg.items(), key=lambda kv: -kv[1])
+
+    def report(self, top: int = 12) -> str:
+        lines = ["== Startup-Profil =="]; prev = 0.0
+        for name, t in self.marks:
+            lines.append(f"  {t*1000:8.1f} ms  (+{(t-prev)*1000:7.1f})  {name}"); prev = t
+        total_imp = sum(own for _, own in self.imports.values())
+        lines.append(f"-- Importe: {len(self.imports)} Module, {total_imp*1000:.1f} ms (eigene Zeit) --")
+        for root, own in self.by_package()[:top]:
+            lines.append(f"  {own*1000:8.1f} ms  {root}")
+        lines.append("-- langsamste Module (kumuliert) --")
+        for name, (cum, _) in sorted(self.imports.items(), key=lambda kv: -kv[1][0])[:top]:
+            lines.append(f"  {cum*1000:8.1f} ms  {name}")
+        return "\n".join(lines)
+
+    def to_json(self) -> str:
+        return json.dumps({
+            "ts": time.time(), "marks": {n: round(t*1000, 1) for n, t in self.marks},
+            "imports_ms": {n: round(own*1000, 1) for n, own in self.by_package()},
+        }, ensure_ascii=False)
+
+class _TimedLoader:
+    """Proxy je Spec: misst exec_module und setzt danach den echten Loader wieder ein (geteilte Loader bleiben unangetastet)."""
+    def __init__(self, loader, name: str, spec, prof: StartupProfiler):
+        self._loader, self._name, self._spec, self._prof = loader, name, spec, prof
+    def __getattr__(self, attr): return getattr(self._loader, attr)   # create_module, get_data, is_package, …
+    def exec_module(self, module):
+        try: self._prof._timed_exec(self._name, self._loader.exec_module)(module)
+        finally: self.restore(module)
+    def restore(self, module=None):
+        if self._spec.loader is self: self._spec.loader = self._loader
+        if module is not None and getattr(module, "__loader__", None) is self: module.__loader__ = self._loader
+
+class _TimingFinder(MetaPathFinder):
+    """Misst exec_module der gefundenen Loader; Suche selbst delegiert an die übrigen Finder."""
+    def __init__(self, prof: StartupProfiler):
+        self.prof = prof; self.proxies: List[_TimedLoader] = []
+    def find_spec(self, name, path, target=None):
+        for finder in sys.meta_path:
+            if finder is self or not hasattr(finder, "find_spec"): continue
+            spec = finder.find_spec(name, path, target)
+            if spec is None: continue
+            if spec.loader is not None and hasattr(spec.loader, "exec_module"):
+                spec.loader = _TimedLoader(spec.loader, name, spec, self.prof); self.proxies.append(spec.loader)
+            return spec
+        return None
+
+_active: Optional[StartupProfiler] = None
+
+def enable() -> StartupProfiler:
+    global _active
+    if _active is None:
+        _active = StartupProfiler(); sys.meta_path.insert(0, _TimingFinder(_active))
+    return _active
+
+def disable():
+    """Finder entfernen und noch nicht ausgeführte Proxies (find_spec ohne Import) zurückdrehen."""
+    global _active
+    for f in [f for f in sys.meta_path if isinstance(f, _TimingFinder)]:
+        sys.meta_path.remove(f)
+        for proxy in f.proxies: proxy.restore()
+        f.proxies.clear()
+    _active = None
+
+def active() -> Optional[StartupProfiler]: return _active
+
+def mark(name: str):
+    if _active is not None: _active.mark(name)
@@ -0,0 +1,80 @@
+"""Rang-Parsing: freie Tier-Texte ('Gold 2', 'GOLD II', 'Silber 3') → Tier mit Ordinalzahl."""
+from __future__ import annotations
+import re
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Optional
+
+VALORANT_LADDER = ("iron","bronze","silver","gold","platinum","diamond","ascendant","immortal","radiant")
+LOL_LADDER = ("iron","bronze","silver","gold","platinum","emerald","diamond","master","grandmaster","challenger")
+VALORANT_DIVISIONS = 3
+LOL_DIVISIONS = 4
+APEX = {"radiant","master","grandmaster","challenger"}
+UNRANKED = {"unrated","unranked","ungewertet","none",""}
+
+# DE-Namen, Kürzel und häufige Tippfehler → kanonischer Name
+_ALIASES = {
+    "eisen":"iron", "silber":"silver", "platin":"platinum", "plat":"platinum", "plati":"platinum", "platum":"platinum",
+    "smaragd":"emerald", "diamant":"diamond", "dia":"diamond", "asc":"ascendant", "ascandant":"ascendant", "aufgestiegen":"ascendant",
+    "imm":"immortal", "immotal":"immortal", "unsterblich":"immortal", "rad":"radiant", "strahlend":"radiant",
+    "meister":"master", "gm":"grandmaster", "großmeister":"grandmaster", "grossmeister":"grandmaster", "herausforderer":"challenger",
+}
+_ROMAN = {"i":1, "ii":2, "iii":3, "iv":4}
+_COMPACT = re.compile(r"([a-zäöüß]+?)(iv|iii|ii|i|\d)?")
+_NAMES = set(VALORANT_LADDER) | set(LOL_LADDER) | set(_ALIASES) | UNRANKED   # ganze Namen nicht als 'Name+Division' zerlegen
+
+def _ladder(game: str):
+    return (VALORANT_LADDER, VALORANT_DIVISIONS) if "valorant" in (game or "").lower() else (LOL_LADDER, LOL_DIVISIONS)
+
+@dataclass(frozen=True)
+class Tier:
+    game: str           # "valorant" | "lol" (LoL und TFT teilen die Leiter)
+    tier: str           # kanonisch, z. B. "gold"; "" = ungewertet/unbekannt
+    division: int       # Valorant 1..3, LoL 1..4 (I = 1), 0 = keine
+    ordinal: int        # aufsteigend vergleichbar; -1 = ungewertet/unbekannt
+    @property
+    def ranked(self) -> bool: return self.ordinal >= 0
+    @property
+    def label(self) -> str:
+        if not self.tier: return "Unranked"
+        if not self.division: return self.tier.title()
+        div = str(self.division) if self.game == "valorant" else {1:"I",2:"II",3:"III",4:"IV"}[self.division]
+        return f"{self.tier.title()} {div}"
+
+_UNRANKED_VALO = Tier("valorant", "", 0, -1)
+_UNRANKED_LOL = Tier("lol", "", 0, -1)
+
+def _split(text: str) -> tuple[str, str]:
+    """(Name, Division) – Division ist das erste passende Token nach dem Namen; Zusätze wie '(45 LP)' zählen nicht."""
+    parts = text.strip().lower().replace("-", " ").replace("_", " ").split()
+    if not parts: return "", ""
+    base, div = parts[0], ""
+    if base not in _NAMES:   # 'gold2', 'plativ'
+        m = _COMPACT.fullmatch(base)
+        if m: base, div = m.group(1), m.group(2) or ""
+    if not div: div = next((p for p in parts[1:] if p in _ROMAN or p.isdigit()), "")
+    return base, div
+
+@lru_cache(maxsize=1024)
+def parse_tier(game: str, text: Optional[str]) -> Tier:
+    """
+    Parst einen Tier-Text einmalig (gecacht). Unbekanntes → ordinal -1.
+    Ohne Division wird die niedrigste angenommen ('plat' == 'Platinum 1' bzw. 'Platinum IV').
+    """
+    ladder, divs = _ladder(game)
+    g = "valorant" if ladder is VALORANT_LADDER else "lol"
+    unranked = _UNRANKED_VALO if g == "valorant" else _UNRANKED_LOL
+    base, div_s = _split(str(text or ""))
+    base = _ALIASES.get(base, base)
+    if base in UNRANKED or base not in ladder: return unranked
+    idx = ladder.index(base)
+    if base in APEX: return Tier(g, base, 0, idx * divs)
+    div = _ROMAN.get(div_s) or (int(div_s) if div_s.isdigit() else 0)
+    if not 1 <= div <= divs: div = 1 if g == "valorant" else divs   # fehlende Division → niedrigste
+    step = div - 1 if g == "valorant" else divs - div                # Valorant: 3 > 1, LoL: I > IV
+    return Tier(g, base, div, idx * divs + step)
+
+def rank_delta(old: Tier, new: Tier) -> Optional[int]:
+    """Differenz in Divisionen; None wenn einer der beiden Ränge fehlt."""
+    if not old.ranked or not new.ranked or old.game != new.game: return None
+    return new.ordinal - old.ordinal
@@ -1,49 +1,477 @@
 
 from __future__ import annotations
-import os, json, base64, secrets
-from typing import Dict, Any
-from cryptography.hazmat.primitives.kdf.scrypt import Scrypt
-from cryptography.hazmat.primitives.ciphers.aead import AESGCM
+import os, json, base64, hmac, secrets, threading, time, zlib, lzma
+from typing import Dict, Any, List, NamedTuple, Optional, Tuple
+from . import kdf
 
 DEFAULT_VAULT_PATH = os.path.join(os.path.expanduser("~"), ".riot_acct_mgr", "vault.dat")
 APP_DIR = os.path.dirname(DEFAULT_VAULT_PATH)
 
+# Format v3: [meta_len u32][meta JSON][Header][Records][Journal]
+#   Header:  AES-GCM(JSON ohne Accounts + Index [[id, off, len], …]), AAD = meta
+#   Records: je Account [nonce 12][AES-GCM(JSON)], AAD = id + Header-Nonce – einzeln versiegelt, damit Saves ohne
+#            Account-Änderung und der Passwortwechsel sie nicht entschlüsseln müssen; gelesen werden immer alle
+#            (beim ersten Zugriff auf data/get_accounts, in der App schon im Entsperr-Task)
+#   Journal: [len u32][nonce 12][AES-GCM(Delta-JSON), AAD = b"VJ" + Header-Nonce + seq u32] …
+# Header, Records und Journal nutzen eigene, per HKDF aus dem Master-Key abgeleitete Schlüssel.
+# Ein Save hängt nur das Delta zum zuletzt geschriebenen Stand an; compact() schreibt einen neuen Snapshot.
+# v1 (ein Blob) und v2 (Snapshot-Blob + Journal, Master-Key) werden weiterhin gelesen.
+# Meta: kdf + kdf_params (Parameter des Master-Keys), kdf_pref (gewünschte KDF + Zielzeit, siehe core/kdf.py),
+#   compression ("none"/"zlib"/"lzma"; fehlt = none): Klartext von Header, Records und Journal wird vor dem
+#   Verschlüsseln komprimiert. Bei zlib nutzen Records/Journal ein Preset-Dictionary aus Beispiel-Records
+#   (Header-Feld "zdict"), damit auch kurze Einzel-Records von den wiederholten Feldnamen profitieren.
+FORMAT_VERSION = 3
+COMPRESSION = "zlib"              # für neue Snapshots; ältere Vaults werden beim nächsten Kompaktieren umgestellt
+ZDICT_SAMPLE = 16                 # so viele Records bilden das Preset-Dictionary …
+ZDICT_MAX = 4 * 1024              # … höchstens so viele Bytes davon
+_LZMA_FILTERS = [{"id": lzma.FILTER_LZMA2, "preset": 6, "dict_size": 1 << 20}]   # roh, ohne xz-Container je Record
+COMPACT_MAX_RECORDS = 64          # spätestens nach so vielen Journal-Einträgen kompaktieren
+COMPACT_MIN_BYTES = 64 * 1024     # … oder wenn das Journal größer als max(dies, Snapshot) ist
+_U32 = 4
+
 def ensure_parent(path: str):
     os.makedirs(os.path.dirname(path), exist_ok=True)
 
 class VaultError(Exception): pass
+class VaultConflict(VaultError):
+    """Die Datei wurde seit dem letzten Lesen/Schreiben extern geändert – erst reload(), dann speichern."""
+
+def _copy(obj: Any) -> Any: return json.loads(json.dumps(obj, ensure_ascii=False))
+
+def _fsync_dir(path: str):
+    if os.name == "nt": return   # Verzeichnis-fsync gibt es unter Windows nicht
+    fd = os.open(os.path.dirname(os.path.abspath(path)), os.O_RDONLY)
+    try: os.fsync(fd)
+    finally: os.close(fd)
+
+def _compress(data: bytes, codec: str, zdict: bytes = b"") -> bytes:
+    if codec == "zlib":
+        c = zlib.compressobj(6, zdict=zdict) if zdict else zlib.compressobj(6)
+        return c.compress(data) + c.flush()
+    if codec == "lzma": return lzma.compress(data, format=lzma.FORMAT_RAW, filters=_LZMA_FILTERS)
+    return data
+
+def _decompress(data: bytes, codec: str, zdict: bytes = b"") -> bytes:
+    if codec == "zlib":
+        d = zlib.decompressobj(zdict=zdict) if zdict else zlib.decompressobj()
+        out = d.decompress(data) + d.flush()
+        if not d.eof: raise VaultError("Komprimierte Daten unvollständig.")
+        return out
+    if codec == "lzma": return lzma.decompress(data, format=lzma.FORMAT_RAW, filters=_LZMA_FILTERS)
+    if codec != "none": raise VaultError(f"Unbekannte Kompression: {codec}")
+    return data
+
+def _make_zdict(accs: List[Dict[str, Any]]) -> bytes:
+    """Preset-Dictionary: die ersten Records (Feldnamen, typische Werte); zlib nutzt das Ende am stärksten."""
+    return b"".join(json.dumps(a, ensure_ascii=False).encode() for a in accs[:ZDICT_SAMPLE])[-ZDICT_MAX:]
+
+def _hkdf(key: bytes, purpose: str) -> bytes:
+    from cryptography.hazmat.primitives import hashes
+    from cryptography.hazmat.primitives.kdf.hkdf import HKDF
+    return HKDF(algorithm=hashes.SHA256(), length=32, salt=None, info=f"CValoMgr/vault/{purpose}".encode()).derive(key)
+
+def _aesgcm(key: bytes):
+    from cryptography.hazmat.primitives.ciphers.aead import AESGCM
+    return AESGCM(key)
+
+class _Sealed(NamedTuple):
+    """Fertig verschlüsselter Snapshot in der Temp-Datei, noch nicht an die Stelle der Vault-Datei gesetzt."""
+    tmp: str
+    nonce: bytes
+    end: int
+    snap_len: int
+    records: bytes
+    index: List[List[Any]]
+    codec: str
+    zdict: bytes
+
+class _LazyRecord(dict):
+    """
+    Platzhalter für einen noch verschlüsselten Account: enthält nur 'id' und die per Journal
+    geänderten Felder; entfernte Felder merkt er sich in .unset (apply_delta arbeitet unverändert darauf).
+    """
+    def __init__(self, rid: str):
+        super().__init__(id=rid); self.unset: set = set()
+    def update(self, *a, **kw):
+        super().update(*a, **kw); self.unset.difference_update(self.keys())
+    def pop(self, k, *default):
+        self.unset.add(k); return super().pop(k, *default)
+
+# ---------- Deltas ----------
+def _acc_ids(accs: Any) -> Optional[List[str]]:
+    """IDs der Accounts in Reihenfolge – None, wenn nicht jeder Account eine eindeutige 'id' hat."""
+    if not isinstance(accs, list) or not all(isinstance(a, dict) and a.get("id") for a in accs): return None
+    ids = [a["id"] for a in accs]
+    return ids if len(set(ids)) == len(ids) else None
+
+def diff_state(old: Dict[str, Any], new: Dict[str, Any]) -> Dict[str, Any]:
+    """Delta old → new: Top-Level-Keys als Ganzes, Accounts feldweise je 'id' ({} = keine Änderung)."""
+    delta: Dict[str, Any] = {}
+    sets = {k: v for k, v in new.items() if k != "accounts" and old.get(k, object()) != v}
+    dels = [k for k in old if k not in new]
+    oa, na = old.get("accounts"), new.get("accounts")
+    if oa != na:
+        oids, nids = _acc_ids(oa), _acc_ids(na)
+        if oids is None or nids is None:
+            sets["accounts"] = na
+        else:
+            before = dict(zip(oids, oa)); acc: Dict[str, Any] = {}
+            nset = set(nids); added = [a for a in na if a["id"] not in before]
+            removed = [i for i in oids if i not in nset]; gone = set(removed)
+            patch: Dict[str, Dict[str, Any]] = {}; unset: Dict[str, List[str]] = {}
+            for a in na:
+                b = before.get(a["id"])
+                if b is None or a == b: continue
+                p = {k: v for k, v in a.items() if b.get(k, object()) != v}
+                u = [k for k in b if k not in a]
+                if p: patch[a["id"]] = p
+                if u: unset[a["id"]] = u
+            if added: acc["add"] = added
+            if removed: acc["del"] = removed
+            if patch: acc["patch"] = patch
+            if unset: acc["unset"] = unset
+            if [i for i in oids if i not in gone] + [a["id"] for a in added] != nids: acc["order"] = nids
+            if acc: delta["acc"] = acc
+    if sets: delta["set"] = sets
+    if dels: delta["del"] = dels
+    return delta
+
+def apply_delta(state: Dict[str, Any], delta: Dict[str, Any]):
+    """Wendet ein diff_state()-Delta in place an."""
+    for k in delta.get("del", ()): state.pop(k, None)
+    state.update(delta.get("set", {}))
+    acc = delta.get("acc")
+    if not acc: return
+    accs = state.setdefault("accounts", [])
+    gone = set(acc.get("del", ())); accs[:] = [a for a in accs if a.get("id") not in gone]
+    by_id = {a.get("id"): a for a in accs}
+    for i, p in acc.get("patch", {}).items():
+        if i in by_id: by_id[i].update(p)
+    for i, keys in acc.get("unset", {}).items():
+        for k in keys: by_id.get(i, {}).pop(k, None)
+    for a in acc.get("add", ()): accs.append(a); by_id[a["id"]] = a
+    if "order" in acc:
+        order = set(acc["order"])
+        accs[:] = [by_id[i] for i in acc["order"] if i in by_id] + [a for a in accs if a.get("id") not in order]
 
 class Vault:
     def __init__(self, path: str = DEFAULT_VAULT_PATH):
         self.path = path; ensure_parent(self.path)
         self._plaintext: Dict[str, Any] = {}; self._key=None; self._salt=None
+        self._persisted: Optional[Dict[str, Any]] = {}  # Stand von Snapshot + Journal (None = Accounts noch lazy)
+        self._persisted_header: Dict[str, Any] = {}     # dasselbe ohne Accounts (Deltas solange lazy)
+        self._snap_nonce: Optional[bytes] = None        # None = Datei ist (noch) kein v2/v3-Snapshot
+        self._snap_len = 0; self._end = 0               # Snapshot-Größe / Ende des gültigen Journals
+        self._journal = 0; self._journal_bytes = 0
+        self._keys: Dict[str, bytes] = {}               # abgeleitete Schlüssel (v3); leer = Master-Key (v2)
+        self._records: bytes = b""; self._index: Dict[str, Tuple[int, int]] = {}
+        self._lazy = False
+        self._lock = threading.RLock()                  # save()/compact() können aus Worker-Threads kommen
+        self.kdf: kdf.Params = dict(kdf.LEGACY_SCRYPT)  # Parameter des aktuellen Master-Keys
+        self.kdf_pref: Dict[str, Any] = {"name": "scrypt", "target_ms": kdf.DEFAULT_TARGET_MS}
+        self._rekey: Optional[Tuple[bytes, bytes, kdf.Params]] = None   # (Key, Salt, Params) für den nächsten Snapshot
+        self._meta_dirty = False
+        self.compression = COMPRESSION                  # gewünschte Kompression für den nächsten Snapshot
+        self._codec = "none"; self._zdict = b""         # Kompression der aktuellen Datei (Journal schreibt damit weiter)
+        self.timings: Dict[str, float] = {}            # Phasen (ms) des letzten open()/save()/compact()
+        self._file_sig: Optional[Tuple[int, int]] = None   # (Größe, mtime_ns) der zuletzt gelesenen/geschriebenen Fassung
+    def _tick(self, phase: str, t0: float) -> float:
+        t = time.perf_counter(); self.timings[phase] = round(self.timings.get(phase, 0.0) + (t - t0) * 1000, 1)
+        return t
     def exists(self)->bool: return os.path.exists(self.path)
-    def _derive_key(self, password: str, salt: bytes)->bytes:
-        return Scrypt(salt=salt, length=32, n=2**15, r=8, p=1).derive(password.encode("utf-8"))
+    def _derive_key(self, password: str, salt: bytes, params: Optional[kdf.Params] = None)->bytes:
+        return kdf.derive(password, salt, params or self.kdf)   # cryptography wird erst dort geladen
+    def _target_kdf(self) -> kdf.Params:
+        return kdf.calibrated(self.kdf_pref.get("name", "scrypt"), int(self.kdf_pref.get("target_ms", kdf.DEFAULT_TARGET_MS)))
+    @property
+    def rekey_pending(self) -> bool: return self._rekey is not None
+    @property
+    def pending_kdf(self) -> Optional[kdf.Params]: return self._rekey[2] if self._rekey else None
+    def set_kdf_preference(self, name: str, target_ms: int):
+        """Gewünschte KDF/Zielzeit; wird im Meta gespeichert und beim nächsten Entsperren angewandt (braucht das Passwort)."""
+        with self._lock:
+            pref = {"name": name, "target_ms": int(target_ms)}
+            if pref != self.kdf_pref: self.kdf_pref = pref; self._meta_dirty = True
+    def _subkey(self, purpose: str) -> bytes:
+        k = self._keys.get(purpose)
+        if k is None: k = self._keys[purpose] = _hkdf(self._key, purpose)
+        return k
+    def _aes(self, purpose: str):
+        return _aesgcm(self._subkey(purpose) if self._keys is not None else self._key)
     def create(self, password: str):
         if self.exists(): raise VaultError("Vault existiert bereits.")
-        self._salt = secrets.token_bytes(16); self._key=self._derive_key(password,self._salt)
+        self.kdf = self._target_kdf()
+        self._salt = secrets.token_bytes(16); self._key=self._derive_key(password,self._salt); self._keys={}
         self._plaintext={"version":1,"settings":{},"accounts":[]}; self._save_internal()
-    def open(self, password: str):
+    def _read(self) -> Tuple[bytes, int, bytes, Dict[str, Any], Tuple[int, int]]:
+        """Datei lesen: (Daten, meta_len, Meta-Bytes, Meta, Signatur (Größe, mtime) der gelesenen Fassung)."""
+        with open(self.path, "rb") as f:
+            data = f.read(); st = os.fstat(f.fileno())
+        meta_len = int.from_bytes(data[:_U32], "big"); m = data[_U32:_U32+meta_len]
+        return data, meta_len, m, json.loads(m.decode()), (st.st_size, st.st_mtime_ns)
+    def open(self, password: str, *, rekey: bool = True):
+        """Entschlüsselt Header + Journal; Accounts (v3) erst bei Bedarf. rekey=False: nur lesen (z. B. Import)."""
         if not self.exists(): raise VaultError("Vault-Datei nicht gefunden.")
-        data=open(self.path,"rb").read(); meta_len=int.from_bytes(data[:4],"big")
-        meta=json.loads(data[4:4+meta_len].decode()); ciphertext=data[4+meta_len:]
-        self._salt=base64.b64decode(meta["salt"]); nonce=base64.b64decode(meta["nonce"])
-        self._key=self._derive_key(password,self._salt); aes=AESGCM(self._key)
-        try: pt=aes.decrypt(nonce,ciphertext,None)
-        except Exception as e: self._key=None; raise VaultError("Entschlüsselung fehlgeschlagen (Passwort?)") from e
-        self._plaintext=json.loads(pt.decode())
+        self.timings = {}; t = time.perf_counter()
+        data, meta_len, m, meta, sig = self._read(); t = self._tick("read", t)
+        salt = base64.b64decode(meta["salt"]); params = dict(meta.get("kdf_params") or kdf.LEGACY_SCRYPT)
+        key = self._derive_key(password, salt, params); t = self._tick("kdf", t)
+        with self._lock:
+            self._key = None; self._rekey = None
+            t = self._load(data, meta_len, m, meta, sig, key, t)
+            # Meta ist erst nach dem Entschlüsseln des Headers authentisch (AAD) – vorher nichts daraus übernehmen
+            if isinstance(meta.get("kdf_pref"), dict): self.kdf_pref = dict(meta["kdf_pref"])
+            self._salt = salt; self.kdf = params; self._meta_dirty = self._codec != self.compression   # Umstellung beim nächsten Snapshot
+        if rekey: self._prepare_rekey(password); self._tick("rekey_kdf", t)
+    def changed_on_disk(self) -> bool:
+        """True, wenn die Datei nicht mehr die zuletzt gelesene/geschriebene Fassung ist (anderer Rechner, Sync-Tool)."""
+        if self._file_sig is None: return False
+        try: st = os.stat(self.path)
+        except OSError: return False   # Sync-Tools ersetzen Dateien kurzzeitig – erst die neue Fassung zählt
+        return (st.st_size, st.st_mtime_ns) != self._file_sig
+    def reload(self):
+        """
+        Extern geänderte Datei mit dem gecachten Key neu einlesen (keine KDF; darf im Hintergrund laufen).
+        Nicht gespeicherte Änderungen im Speicher gehen verloren – der Aufrufer wendet seine danach neu an.
+        """
+        with self._lock:
+            if self._key is None or self._salt is None: raise VaultError("Vault ist nicht geöffnet.")
+            self.timings = {}; t = time.perf_counter()
+            data, meta_len, m, meta, sig = self._read(); t = self._tick("read", t)
+            if (base64.b64decode(meta["salt"]) != self._salt or dict(meta.get("kdf_params") or kdf.LEGACY_SCRYPT) != self.kdf):
+                raise VaultError("Vault wurde extern mit anderem Passwort/KDF neu verschlüsselt – bitte sperren und neu entsperren.")
+            self._load(data, meta_len, m, meta, sig, self._key, t)
+            if not self._meta_dirty and isinstance(meta.get("kdf_pref"), dict): self.kdf_pref = dict(meta["kdf_pref"])
+            self._meta_dirty = self._meta_dirty or self._codec != self.compression
+    def _load(self, data: bytes, meta_len: int, m: bytes, meta: Dict[str, Any], sig: Tuple[int, int], key: bytes, t: float) -> float:
+        """Header entschlüsseln und erst bei Erfolg den Zustand übernehmen (Journal, Lazy-Stubs); unter self._lock."""
+        from cryptography.hazmat.primitives.ciphers.aead import AESGCM
+        body = data[_U32+meta_len:]; nonce = base64.b64decode(meta["nonce"])
+        version = meta.get("version", 1); codec = meta.get("compression", "none")
+        snap_len = int(meta.get("header_len", meta.get("snapshot_len", len(body))))
+        try: pt = AESGCM(_hkdf(key, "header") if version >= 3 else key).decrypt(nonce, body[:snap_len], m if version >= 2 else None)
+        except Exception as e: raise VaultError("Entschlüsselung fehlgeschlagen (Passwort?)") from e
+        state = json.loads(_decompress(pt, codec).decode()); t = self._tick("decrypt", t)
+        self._key = key; self._keys = {} if version >= 3 else None
+        self._codec = codec; self._zdict = base64.b64decode(state.pop("zdict", ""))
+        rec_len = int(meta.get("records_len", 0))
+        self._records = body[snap_len:snap_len+rec_len]
+        index = state.pop("index", None)
+        self._index = {rid: (off, ln) for rid, off, ln in index or ()}
+        if index is not None: state["accounts"] = [_LazyRecord(rid) for rid, _, _ in index]
+        self._lazy = bool(self._index)
+        self._snap_nonce = nonce if version >= 2 else None; self._snap_len = snap_len + rec_len
+        self._journal = 0; self._journal_bytes = 0; self._end = _U32 + meta_len + snap_len + rec_len
+        if version >= 2: self._replay(data, state)
+        t = self._tick("journal", t)
+        self._plaintext = state; self._file_sig = sig
+        self._persisted = None if self._lazy else _copy(state)
+        self._persisted_header = _copy({k: v for k, v in state.items() if k != "accounts"})
+        return t
+    def _prepare_rekey(self, password: str):
+        """Sind die KDF-Parameter schwächer als Vorgabe/Kalibrierung dieser Maschine, neuen Key für den nächsten Snapshot ableiten."""
+        try:
+            desired = self._target_kdf()
+            if not kdf.needs_rekey(self.kdf, desired): return
+            salt = secrets.token_bytes(16)
+            self._rekey = (self._derive_key(password, salt, desired), salt, desired)
+        except Exception:
+            self._rekey = None   # Re-Key ist optional; Entsperren bleibt gültig
+    def _replay(self, data: bytes, state: Dict[str, Any]):
+        """Journal nach dem Snapshot anwenden; ein unvollständiger/ungültiger Rest (Absturz beim Anhängen) wird ignoriert."""
+        pos = self._end; aes = self._aes("journal")
+        while pos + _U32 <= len(data):
+            n = int.from_bytes(data[pos:pos+_U32], "big"); rec = data[pos+_U32:pos+_U32+n]
+            if n <= 12 or len(rec) < n: break
+            try: delta = json.loads(_decompress(aes.decrypt(rec[:12], rec[12:], self._journal_aad(self._journal)),
+                                                self._codec, self._zdict).decode())
+            except Exception: break
+            apply_delta(state, delta)
+            pos += _U32 + n; self._journal += 1; self._journal_bytes += _U32 + n
+        self._end = pos   # nächstes Anhängen überschreibt einen evtl. kaputten Rest
+    def _journal_aad(self, seq: int) -> bytes: return b"VJ" + (self._snap_nonce or b"") + seq.to_bytes(_U32, "big")
+
+    # ---------- Einzel-Records (lazy) ----------
+    def _decrypt_record(self, rid: str, aes=None) -> Dict[str, Any]:
+        off, ln = self._index[rid]; blob = self._records[off:off+ln]; aes = aes or self._aes("record")
+        try: return json.loads(_decompress(aes.decrypt(blob[:12], blob[12:], rid.encode() + self._snap_nonce),
+                                           self._codec, self._zdict).decode())
+        except Exception as e: raise VaultError(f"Account-Record {rid} beschädigt") from e
+    def _resolve(self, a: Dict[str, Any], aes=None) -> Dict[str, Any]:
+        if not isinstance(a, _LazyRecord): return a
+        rec = self._decrypt_record(a["id"], aes)
+        for k in a.unset: rec.pop(k, None)
+        rec.update(a); return rec
+    def _materialize(self):
+        """Alle Accounts entschlüsseln (erster Zugriff auf data/get_accounts, vor Saves mit Account-Änderungen)."""
+        with self._lock:
+            if not self._lazy: return
+            t = time.perf_counter(); accs = self._plaintext.get("accounts", [])
+            accs[:] = [self._resolve(a) for a in accs]; self._tick("records", t)
+            # Basis fürs nächste Delta: gespeicherter Header (nicht evtl. ungespeicherte Settings) + Accounts
+            self._persisted = dict(_copy(self._persisted_header), accounts=_copy(accs))
+            self._lazy = False
+
+    # ---------- Schreiben ----------
     def _save_internal(self):
-        if self._key is None or self._salt is None: raise VaultError("Vault ist nicht geöffnet.")
-        aes=AESGCM(self._key); nonce=secrets.token_bytes(12)
-        pt=json.dumps(self._plaintext,ensure_ascii=False).encode(); ct=aes.encrypt(nonce,pt,None)
-        meta={"version":1,"kdf":"scrypt","salt":base64.b64encode(self._salt).decode(),"nonce":base64.b64encode(nonce).decode()}
-        m=json.dumps(meta).encode(); out=len(m).to_bytes(4,"big")+m+ct; open(self.path,"wb").write(out)
-    def save(self): self._save_internal()
-    def lock(self): self._key=None; self._plaintext={}
+        """Neuen Snapshot schreiben (temp + fsync + rename); leert das Journal."""
+        with self._lock:
+            if self._key is None or self._salt is None: raise VaultError("Vault ist nicht geöffnet.")
+            self._materialize(); self._write_snapshot(_copy(self._plaintext))
+    def _check_disk(self):
+        if self.changed_on_disk(): raise VaultConflict("Vault-Datei wurde extern geändert – bitte neu laden.")
+    def _write_snapshot(self, state: Dict[str, Any]):
+        self._check_disk()   # weder fremde Änderungen überschreiben noch an eine fremde Datei anhängen
+        if self._rekey is None: return self._write_snapshot_file(state)
+        old = (self._key, self._salt, self.kdf, self._keys)
+        src = self._aes("record") if self._keys is not None else None   # Lazy-Records noch mit dem alten Schlüssel lesen
+        self._key, self._salt, self.kdf = self._rekey; self._keys = {}
+        try: self._write_snapshot_file(state, src)
+        except Exception:
+            self._key, self._salt, self.kdf, self._keys = old; raise
+        self._rekey = None
+    def _write_snapshot_file(self, state: Dict[str, Any], src=None):
+        """Schreibt state als neuen Snapshot; noch verschlüsselte Accounts werden einzeln (mit src) umgeschlüsselt."""
+        if self._keys is None: self._keys = {}    # v1/v2 → ab jetzt v3 mit abgeleiteten Schlüsseln
+        sealed = self._seal_snapshot(state, self._aes, self._salt, self.kdf, self.kdf_pref, self.compression, src)
+        self._install_snapshot(sealed, state)
+    def _seal_snapshot(self, state: Dict[str, Any], aes, salt: bytes, params: kdf.Params, pref: Dict[str, Any],
+                       codec: str, src=None, tmp: str = "") -> "_Sealed":
+        """Serialisiert/komprimiert/verschlüsselt state in eine Temp-Datei (mit fsync); ändert am Vault nichts außer timings."""
+        t = time.perf_counter()
+        nonce=secrets.token_bytes(12); header={k: v for k, v in state.items() if k != "accounts"}
+        accs=state.get("accounts") or []; records=bytearray(); index=[]
+        # Preset-Dictionary aus Klartext, nicht aus Lazy-Stubs (change_password ohne _materialize)
+        zdict=_make_zdict([self._resolve(a,src) for a in accs[:ZDICT_SAMPLE]]) if codec == "zlib" else b""
+        if _acc_ids(accs) is None:
+            header["accounts"]=accs   # ohne eindeutige IDs: Accounts im Header (nicht lazy)
+        else:
+            rec_aes=aes("record")
+            for a in accs:
+                a=self._resolve(a,src); rn=secrets.token_bytes(12)
+                blob=rn+rec_aes.encrypt(rn,_compress(json.dumps(a,ensure_ascii=False).encode(),codec,zdict),a["id"].encode()+nonce)
+                index.append([a["id"],len(records),len(blob)]); records+=blob
+            header["index"]=index
+        if zdict: header["zdict"]=base64.b64encode(zdict).decode()
+        pt=_compress(json.dumps(header,ensure_ascii=False).encode(),codec)
+        meta={"version":FORMAT_VERSION,"kdf":params.get("name","scrypt"),"kdf_params":params,"kdf_pref":pref,
+              "compression":codec,"salt":base64.b64encode(salt).decode(),
+              "nonce":base64.b64encode(nonce).decode(),"header_len":len(pt)+16,"records_len":len(records)}
+        m=json.dumps(meta).encode(); ct=aes("header").encrypt(nonce,pt,m)
+        t = self._tick("encrypt", t); tmp=tmp or self.path+".tmp"
+        with open(tmp,"wb") as f:
+            f.write(len(m).to_bytes(_U32,"big")); f.write(m); f.write(ct); f.write(records); f.flush(); os.fsync(f.fileno())
+        self._tick("write", t)
+        return _Sealed(tmp, nonce, _U32+len(m)+len(ct)+len(records), len(ct)+len(records), bytes(records), index, codec, zdict)
+    def _install_snapshot(self, sealed: "_Sealed", state: Dict[str, Any]):
+        """Temp-Datei atomar an die Stelle der Vault-Datei setzen und den Zustand auf den neuen Snapshot umstellen."""
+        t = time.perf_counter()
+        os.replace(sealed.tmp,self.path); _fsync_dir(self.path); self._tick("write", t)
+        st=os.stat(self.path); self._file_sig=(st.st_size,st.st_mtime_ns)
+        self._snap_nonce=sealed.nonce; self._snap_len=sealed.snap_len; self._end=sealed.end
+        self._records=sealed.records; self._index={rid: (off, ln) for rid, off, ln in sealed.index}
+        self._codec=sealed.codec; self._zdict=sealed.zdict
+        self._journal=0; self._journal_bytes=0; self._meta_dirty=False
+        self._persisted=None if self._lazy else state   # lazy: Stubs bleiben gültig, Records sind jetzt vollständig
+        self._persisted_header={k: v for k, v in state.items() if k != "accounts"}
+    def _append(self, delta: Dict[str, Any]):
+        t=time.perf_counter(); nonce=secrets.token_bytes(12)
+        pt=_compress(json.dumps(delta,ensure_ascii=False).encode(),self._codec,self._zdict)
+        ct=self._aes("journal").encrypt(nonce,pt,self._journal_aad(self._journal))
+        rec=(len(ct)+12).to_bytes(_U32,"big")+nonce+ct; t=self._tick("encrypt", t)
+        self._check_disk()
+        with open(self.path,"r+b") as f:
+            f.seek(self._end); f.write(rec); f.truncate(); f.flush(); os.fsync(f.fileno())
+            st=os.fstat(f.fileno()); self._file_sig=(st.st_size,st.st_mtime_ns)
+        self._tick("write", t)
+        self._end+=len(rec); self._journal+=1; self._journal_bytes+=len(rec)
+    def save(self):
+        """Schreibt nur das Delta seit dem letzten Save ins Journal (No-op ohne Änderungen); alte Formate → Snapshot."""
+        with self._lock:
+            if self._key is None or self._salt is None: raise VaultError("Vault ist nicht geöffnet.")
+            self.timings = {}
+            if self._snap_nonce is None or self._keys is None or self._rekey or self._meta_dirty or not os.path.isfile(self.path):
+                self._save_internal(); return
+            if self._lazy:   # Accounts unangetastet → nur Header-Felder vergleichen
+                t = time.perf_counter(); old = self._persisted_header
+                new = _copy({k: v for k, v in self._plaintext.items() if k != "accounts"})
+                delta = diff_state(old, new); self._tick("diff", t)
+                if delta: self._append(delta); self._persisted_header = new
+                return
+            t=time.perf_counter(); state=_copy(self._plaintext); delta=diff_state(self._persisted,state); self._tick("diff", t)
+            if not delta: return
+            self._append(delta); self._persisted=state
+            self._persisted_header={k: v for k, v in state.items() if k != "accounts"}
+    def needs_compaction(self) -> bool:
+        return self._rekey is not None or self._meta_dirty or self._journal >= COMPACT_MAX_RECORDS or self._journal_bytes > max(COMPACT_MIN_BYTES, self._snap_len)
+    def compact(self) -> bool:
+        """
+        Snapshot + Journal zu einem neuen Snapshot zusammenfassen (darf im Hintergrund laufen). Unter dem Vault-Lock
+        nur Stand übernehmen und am Ende Datei/Zustand tauschen – Serialisieren, Verschlüsseln und fsync laufen ohne,
+        damit Saves nicht warten. Wurde inzwischen gespeichert, ist der neue Snapshot veraltet (False, später erneut).
+        """
+        with self._lock:
+            if self._key is None or (self._journal == 0 and self._rekey is None and not self._meta_dirty): return False
+            self.timings = {}
+            if self._lazy: self._materialize()
+            self._check_disk()
+            state, key, rekey = self._persisted, self._key, self._rekey   # _persisted wird nur ersetzt, nie verändert
+            mark, pref, codec = (self._snap_nonce, self._journal), dict(self.kdf_pref), self.compression
+            new_key, salt, params = rekey if rekey else (key, self._salt, dict(self.kdf))
+        keys: Dict[str, bytes] = {}
+        def aes(purpose: str):
+            if purpose not in keys: keys[purpose] = _hkdf(new_key, purpose)
+            return _aesgcm(keys[purpose])
+        sealed = self._seal_snapshot(state, aes, salt, params, pref, codec, tmp=self.path + ".compact.tmp")   # Saves nutzen .tmp
+        with self._lock:
+            try:
+                if (self._key is not key or self._rekey is not rekey or self._persisted is not state
+                        or (self._snap_nonce, self._journal) != mark):
+                    return False   # gesperrt, neu geladen, Passwort gewechselt oder inzwischen gespeichert
+                self._check_disk()
+                self._key, self._salt, self.kdf = new_key, salt, params; self._keys = keys; self._rekey = None
+                self._install_snapshot(sealed, state)
+            finally:
+                if os.path.exists(sealed.tmp): os.remove(sealed.tmp)
+            if self.kdf_pref != pref: self._meta_dirty = True   # Vorgabe inzwischen geändert → nächstes Kompaktieren
+            return True
+    def change_password(self, current: str, new: str):
+        """
+        Neues Master-Passwort: neuer Salt, Key mit der aktuellen KDF-Vorgabe, alles neu verschlüsselt
+        (noch gesperrte Records einzeln, ohne das ganze Vault zu entschlüsseln) und atomar ersetzt.
+        Die KDF läuft außerhalb des Vault-Locks; darf im Hintergrund laufen. Phasen in self.timings.
+        """
+        with self._lock:
+            if self._key is None or self._salt is None: raise VaultError("Vault ist nicht geöffnet.")
+            key, salt, params = self._key, self._salt, dict(self.kdf)
+        self.timings = {}; t = time.perf_counter()
+        if not hmac.compare_digest(self._derive_key(current, salt, params), key):
+            raise VaultError("Aktuelles Passwort ist falsch.")
+        t = self._tick("verify", t)
+        new_params = self._target_kdf(); new_salt = secrets.token_bytes(16)
+        rekey = (self._derive_key(new, new_salt, new_params), new_salt, new_params); self._tick("kdf", t)
+        with self._lock:
+            if self._key is not key: raise VaultError("Vault wurde währenddessen gesperrt.")
+            plain = self._plaintext
+            state = {k: _copy(v) for k, v in plain.items() if k != "accounts"}
+            accs = plain.get("accounts") or []
+            state["accounts"] = accs if self._lazy else _copy(accs)   # Stubs werden beim Schreiben einzeln aufgelöst
+            prev, self._rekey = self._rekey, rekey   # ein anstehender Re-Key gilt dem alten Passwort
+            try: self._write_snapshot(state)
+            except Exception:
+                self._rekey = prev; raise
+    def update_data(self, values: Dict[str, Any]):
+        """Top-Level-Bereiche ersetzen – unter dem Vault-Lock, damit ein laufendes save() einen konsistenten Stand kopiert."""
+        with self._lock: self.data.update(values)
+    def journal_info(self) -> Tuple[int, int]: return self._journal, self._journal_bytes
+    def lock(self):
+        with self._lock:
+            self._key=None; self._keys={}; self._rekey=None; self._plaintext={}; self._persisted={}; self._snap_nonce=None
+            self._records=b""; self._index={}; self._lazy=False; self._zdict=b""; self._file_sig=None
     @property
-    def data(self)->Dict[str,Any]: return self._plaintext
+    def data(self)->Dict[str,Any]:
+        self._materialize(); return self._plaintext
     def set_settings(self, s:Dict[str,Any]): self._plaintext["settings"]=s
     def get_settings(self)->Dict[str,Any]: return self._plaintext.get("settings",{})
-    def get_accounts(self)->list[dict]: return list(self._plaintext.get("accounts",[]))
-    def replace_accounts(self, a:list[dict]): self._plaintext["accounts"]=a
+    def get_accounts(self)->list[dict]: return list(self.data.get("accounts",[]))
+    def replace_accounts(self, a:list[dict]): self.data["accounts"]=a
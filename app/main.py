@@ -5,6 +5,7 @@ Start der App mit robustem Windows-Taskleisten-Icon:
 - High-DPI/Scaling Setup vor QApplication.
 - Windows Taskbar Icon: AppUserModelID + WM_SETICON + SetClassLongPtrW (small/big/class icon) auf allen Top-Level-Fenstern.
 - Lädt Settings/Vault, öffnet MainWindow und triggert startup_unlock().
+- --profile-startup: Import- und Phasenzeiten bis zum Entsperr-Prompt ausgeben (und in logs/startup_profile.jsonl anhängen).
 """
 
 from __future__ import annotations
@@ -14,6 +15,12 @@ import ctypes
 from ctypes import wintypes
 import traceback
 
+# Profiler so früh wie möglich (vor Qt/pydantic), damit die Importzeiten mitgemessen werden
+from app.core import startup_profile
+if "--profile-startup" in sys.argv:
+    sys.argv.remove("--profile-startup")
+    startup_profile.enable()
+
 # ------------------ Persistenter Vault-Pfad (OneFile-sicher) ------------------
 
 def _is_temp_path(p: str) -> bool:
@@ -187,8 +194,8 @@ def _apply_icon_to_all_windows(ico_path: str, app: QApplication):
         pass
 
 # ------------------ Eigene Module (absolute Importe) ------------------
+# MainWindow (und damit Tabellen, Dialoge, Icons …) wird erst in run() importiert.
 
-from app.ui.main_window import MainWindow
 from app.core.vault import Vault
 from app.core.settings import Settings
 from app.core.models import AppState
@@ -223,7 +230,24 @@ def _settings_save_if_possible(settings: Settings) -> None:
 
 # ------------------ App-Start ------------------
 
+def _finish_startup_profile():
+    """Nach dem ersten Event-Loop-Durchlauf: Profil ausgeben und für Vergleiche anhängen."""
+    prof = startup_profile.active()
+    if prof is None:
+        return
+    prof.mark("erstes Event (Fenster/Entsperr-Prompt sichtbar)")
+    startup_profile.disable()
+    print(prof.report(), flush=True)
+    try:
+        log_dir = os.path.join(os.path.dirname(os.path.abspath(__file__)), "logs")
+        os.makedirs(log_dir, exist_ok=True)
+        with open(os.path.join(log_dir, "startup_profile.jsonl"), "a", encoding="utf-8") as f:
+            f.write(prof.to_json() + "\n")
+    except Exception:
+        pass
+
 def run():
+    startup_profile.mark("Module geladen")
     # Eigene AppID (per EXE-Name) für saubere Taskleisten-Gruppierung/Pinning
     exe_name = os.path.splitext(os.path.basename(sys.executable if getattr(sys, "frozen", False) else "dev"))[0]
     app_id = os.environ.get("CVALOMGR_APPID") or f"AccountMgr.{exe_name}"
@@ -233,6 +257,15 @@ def run():
     app.setApplicationName("AccountMgr")
     app.setOrganizationName("AccountMgr")
     app.setApplicationDisplayName("AccountMgr")
+    startup_profile.mark("QApplication")
+
+    # Gebündelte Icons (icons.rcc, falls gebaut) einmalig registrieren – danach aus dem Speicher statt lose Dateien
+    try:
+        from app.core.atlas import register_rcc
+        register_rcc()
+    except Exception:
+        traceback.print_exc()
+    startup_profile.mark("Ressourcen registriert")
 
     # App-Icon (OneDir & Dev kompatibel)
     res_dir = os.path.join(_exe_dir(), "app", "resources")
@@ -254,6 +287,7 @@ def run():
         _settings_save_if_possible(settings)
     except Exception:
         pass
+    startup_profile.mark("Settings")
 
     # Vault & State
     try:
@@ -263,9 +297,13 @@ def run():
         raise
 
     state = AppState()
+    startup_profile.mark("Vault-Objekt")
 
     # Hauptfenster
+    from app.ui.main_window import MainWindow
+    startup_profile.mark("Import MainWindow")
     win = MainWindow(vault, settings, state)
+    startup_profile.mark("MainWindow gebaut")
 
     # Fenster-Icon (zusätzlich zu app.setWindowIcon)
     if ico_path:
@@ -274,6 +312,10 @@ def run():
         except Exception:
             pass
 
+    # Profil erst nach dem ersten Event-Durchlauf abschließen (bei neuem Vault: im Passwort-Dialog)
+    if startup_profile.active() is not None:
+        QTimer.singleShot(0, _finish_startup_profile)
+
     # Beim Start entsperren
     try:
         win.startup_unlock()
@@ -281,6 +323,7 @@ def run():
         traceback.print_exc()
 
     win.show()
+    startup_profile.mark("Fenster angezeigt")
 
     # --- Icons auf ALLE Top-Level-Fenster forcieren (Timing-Varianten) ---
     if ico_path:
@@ -0,0 +1,263 @@
+"""Model/View für die Account-Tabellen (statt QTableWidget + QTableWidgetItem je Zelle)."""
+from __future__ import annotations
+from typing import Callable, Dict, Iterable, List, Optional, Sequence, Set, Tuple
+from PySide6.QtCore import Qt, QAbstractTableModel, QSortFilterProxyModel, QModelIndex, QRect, Signal
+from PySide6.QtGui import QPixmap, QPalette
+from PySide6.QtWidgets import (
+    QTableView, QAbstractItemView, QStyledItemDelegate, QStyleOptionViewItem, QStyle, QApplication, QHeaderView
+)
+from ..core.models import (
+    Account, AppState, Game, ACCOUNTS_ADDED, ACCOUNTS_CHANGED, ACCOUNTS_REMOVED, ACCOUNTS_REORDERED, ACCOUNTS_RESET
+)
+
+KEY_ROLE = Qt.UserRole + 1
+ACCOUNT_ROLE = Qt.UserRole + 2
+
+# (Überschrift, Getter) je Spalte; die Tier-Spalte bekommt das Rank-Icon
+Column = Tuple[str, Callable[[Account], str]]
+VALORANT_COLUMNS: List[Column] = [
+    ("Alias", lambda a: a.alias), ("Spiel", lambda a: a.game.value), ("Region", lambda a: a.region),
+    ("Riot ID", lambda a: a.riot_id), ("Tier", lambda a: a.tier),
+    ("RR", lambda a: "" if a.rr is None else str(a.rr)), ("KeePassXC Entry", lambda a: a.kpxc_entry),
+]
+LOL_COLUMNS: List[Column] = [
+    ("Alias", lambda a: a.alias), ("Spiel", lambda a: a.game.value), ("Region", lambda a: a.region),
+    ("Riot ID", lambda a: a.riot_id), ("Queue", lambda a: a.queue.value if a.queue else ""),
+    ("Tier", lambda a: a.tier), ("KeePassXC Entry", lambda a: a.kpxc_entry),
+]
+
+
+class AccountTableModel(QAbstractTableModel):
+    """
+    Zeilen = Accounts aus dem AccountStore (AppState.accounts), gefiltert nach Spiel(en); Reihenfolge wie im Store.
+    Hört auf Store-Events und aktualisiert nur betroffene Zeilen (insert/remove/dataChanged).
+    """
+
+    def __init__(self, state: AppState, games: Iterable[Game], columns: Sequence[Column], parent=None):
+        super().__init__(parent)
+        self.state = state
+        self.games: Set[Game] = set(games)
+        self.columns = list(columns)
+        self.tier_column = next(i for i, (h, _) in enumerate(self.columns) if h == "Tier")
+        self._rows: List[Account] = []
+        self._pos: Optional[Dict[str, int]] = None   # uid → Zeile; lazy neu aufgebaut nach Struktur-Änderungen
+        state.accounts.subscribe(self._on_store_changed)
+
+    # ---- Qt-API ----
+    def rowCount(self, parent=QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self._rows)
+
+    def columnCount(self, parent=QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self.columns)
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if role == Qt.DisplayRole and orientation == Qt.Horizontal and 0 <= section < len(self.columns):
+            return self.columns[section][0]
+        return None
+
+    def data(self, index: QModelIndex, role=Qt.DisplayRole):
+        if not index.isValid() or not 0 <= index.row() < len(self._rows):
+            return None
+        acc = self._rows[index.row()]
+        if role == Qt.DisplayRole or role == Qt.ToolTipRole:
+            return self.columns[index.column()][1](acc)
+        if role == KEY_ROLE:
+            return acc.uid
+        if role == ACCOUNT_ROLE:
+            return acc
+        return None
+
+    def flags(self, index: QModelIndex):
+        if not index.isValid():
+            return Qt.ItemIsDropEnabled   # Drop zwischen Zeilen
+        return Qt.ItemIsEnabled | Qt.ItemIsSelectable | Qt.ItemIsDragEnabled
+
+    def supportedDropActions(self):
+        return Qt.MoveAction
+
+    # ---- Zugriff ----
+    def account(self, row: int) -> Optional[Account]:
+        return self._rows[row] if 0 <= row < len(self._rows) else None
+
+    def accounts(self) -> List[Account]:
+        return list(self._rows)
+
+    def accepts(self, acc: Account) -> bool:
+        return acc.game in self.games
+
+    def row_of(self, acc: Account) -> int:
+        if self._pos is None:
+            self._pos = {a.uid: i for i, a in enumerate(self._rows)}
+        return self._pos.get(acc.uid, -1)
+
+    def _wanted_rows(self) -> List[Account]:
+        return [a for a in self.state.accounts if self.accepts(a)]
+
+    # ---- Änderungen ----
+    def reset(self):
+        self.beginResetModel()
+        self._rows = self._wanted_rows(); self._pos = None
+        self.endResetModel()
+
+    def _on_store_changed(self, kind: str, accounts: List[Account]):
+        if kind == ACCOUNTS_RESET:
+            self.reset()
+        elif kind == ACCOUNTS_REORDERED:
+            self._relayout(self._wanted_rows())
+        elif kind == ACCOUNTS_REMOVED:
+            for acc in accounts: self._remove(acc)
+        elif kind in (ACCOUNTS_ADDED, ACCOUNTS_CHANGED):
+            for acc in accounts:
+                row = self.row_of(acc)
+                if row >= 0 and not self.accepts(acc):
+                    self._remove(acc)                       # Spiel gewechselt → andere Tabelle
+                elif row >= 0:
+                    self.dataChanged.emit(self.index(row, 0), self.index(row, len(self.columns) - 1))
+                elif self.accepts(acc):
+                    self._insert(acc)
+
+    def _insert(self, acc: Account):
+        """Fügt an der Position ein, die der Reihenfolge im Store entspricht."""
+        at = 0
+        for a in self.state.accounts:
+            if a is acc: break
+            r = self.row_of(a)
+            if r >= 0: at = r + 1
+        self.beginInsertRows(QModelIndex(), at, at)
+        self._rows.insert(at, acc); self._pos = None
+        self.endInsertRows()
+
+    def _remove(self, acc: Account):
+        row = self.row_of(acc)
+        if row < 0: return
+        self.beginRemoveRows(QModelIndex(), row, row)
+        del self._rows[row]; self._pos = None
+        self.endRemoveRows()
+
+    def _relayout(self, new: List[Account]):
+        """Neue Reihenfolge derselben Zeilen; Selektion bleibt über persistente Indizes erhalten."""
+        if len(new) != len(self._rows) or {a.uid for a in new} != {a.uid for a in self._rows}:
+            self.reset(); return
+        if all(a is b for a, b in zip(new, self._rows)):
+            return
+        self.layoutAboutToBeChanged.emit()
+        new_pos = {a.uid: i for i, a in enumerate(new)}
+        old_idx = self.persistentIndexList()
+        new_idx = [self.index(new_pos[self._rows[ix.row()].uid], ix.column()) for ix in old_idx]
+        self._rows = new; self._pos = None
+        self.changePersistentIndexList(old_idx, new_idx)
+        self.layoutChanged.emit()
+
+    def rank_icons_changed(self, pairs: Set[Tuple[str, str]]):
+        """dataChanged nur für Tier-Zellen, deren (Spiel, Tier) ein neues Icon hat."""
+        c = self.tier_column
+        for r, acc in enumerate(self._rows):
+            if (acc.game.value, acc.tier) in pairs:
+                ix = self.index(r, c); self.dataChanged.emit(ix, ix, [Qt.DecorationRole])
+
+    def move_rows(self, rows: Iterable[int], dest: int) -> bool:
+        """Verschiebt Zeilen vor 'dest' (Drag&Drop); Selektion bleibt über persistente Indizes erhalten."""
+        src = sorted({r for r in rows if 0 <= r < len(self._rows)})
+        if not src:
+            return False
+        dest = max(0, min(dest, len(self._rows)))
+        moving = [self._rows[r] for r in src]
+        taken = set(src)
+        rest = [a for i, a in enumerate(self._rows) if i not in taken]
+        at = dest - sum(1 for r in src if r < dest)
+        new = rest[:at] + moving + rest[at:]
+        if all(a is b for a, b in zip(new, self._rows)):
+            return False
+        self._relayout(new)
+        return True
+
+
+class AccountFilterProxy(QSortFilterProxyModel):
+    """Blendet Zeilen anhand eines Prädikats aus (Suche); das Quell-Model wird dabei nicht neu aufgebaut."""
+
+    def __init__(self, source: AccountTableModel, accepts: Callable[[Account], bool], parent=None):
+        super().__init__(parent)
+        self._accepts = accepts
+        self.setSourceModel(source)
+
+    def filterAcceptsRow(self, row: int, parent: QModelIndex) -> bool:
+        acc = self.sourceModel().account(row)
+        return acc is not None and self._accepts(acc)
+
+    def refilter(self):
+        self.invalidateFilter()
+
+
+class RankIconDelegate(QStyledItemDelegate):
+    """Zeichnet Rank-Icon + Text der Tier-Spalte; Pixmaps kommen vorskaliert aus einem Cache."""
+
+    def __init__(self, pixmap_for: Callable[[Account], Optional[QPixmap]], icon_px: int, parent=None):
+        super().__init__(parent)
+        self._pixmap_for = pixmap_for
+        self._icon_px = icon_px
+
+    def paint(self, painter, option, index):
+        opt = QStyleOptionViewItem(option)
+        self.initStyleOption(opt, index)
+        acc = index.data(ACCOUNT_ROLE)
+        pm = self._pixmap_for(acc) if acc is not None else None
+        if pm is None:
+            return super().paint(painter, option, index)
+        widget = opt.widget
+        style = widget.style() if widget else QApplication.style()
+        text = opt.text; opt.text = ""
+        style.drawControl(QStyle.CE_ItemViewItem, opt, painter, widget)   # Hintergrund/Selektion
+        r = opt.rect; s = self._icon_px
+        painter.drawPixmap(QRect(r.left() + 4, r.top() + (r.height() - s) // 2, s, s), pm)
+        text_rect = r.adjusted(s + 10, 0, -4, 0)
+        painter.save()
+        painter.setPen(opt.palette.color(QPalette.HighlightedText if opt.state & QStyle.State_Selected else QPalette.Text))
+        painter.drawText(text_rect, int(Qt.AlignVCenter | Qt.AlignLeft), opt.fontMetrics.elidedText(text, Qt.ElideRight, text_rect.width()))
+        painter.restore()
+
+
+class AccountTableView(QTableView):
+    """QTableView mit interner Zeilen-Umsortierung per Drag&Drop; meldet neue Reihenfolge via 'reordered'."""
+    reordered = Signal()
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.setDragEnabled(True)
+        self.setAcceptDrops(True)
+        self.setDragDropOverwriteMode(False)
+        self.setDropIndicatorShown(True)
+        self.setSelectionBehavior(QAbstractItemView.SelectRows)
+        self.setSelectionMode(QAbstractItemView.ExtendedSelection)
+        self.setDragDropMode(QAbstractItemView.InternalMove)
+        self.setDefaultDropAction(Qt.MoveAction)
+        self.setEditTriggers(QAbstractItemView.NoEditTriggers)
+        self.setWordWrap(False)
+        self.verticalHeader().setSectionResizeMode(QHeaderView.Fixed)
+
+    def source_model(self) -> Optional[AccountTableModel]:
+        model = self.model()
+        if isinstance(model, QSortFilterProxyModel): model = model.sourceModel()
+        return model if isinstance(model, AccountTableModel) else None
+
+    def _to_source_row(self, row: int) -> int:
+        model = self.model()
+        if not isinstance(model, QSortFilterProxyModel): return row
+        if row >= model.rowCount(): return model.sourceModel().rowCount()
+        return model.mapToSource(model.index(row, 0)).row()
+
+    def dropEvent(self, event):
+        model = self.source_model()
+        if event.source() is not self or model is None:
+            event.ignore(); return
+        ix = self.indexAt(event.position().toPoint())
+        pos = self.dropIndicatorPosition()
+        if not ix.isValid() or pos == QAbstractItemView.OnViewport:
+            dest = model.rowCount()
+        else:
+            dest = self._to_source_row(ix.row() + (1 if pos == QAbstractItemView.BelowItem else 0))
+        rows = [self._to_source_row(i.row()) for i in self.selectionModel().selectedRows()]
+        moved = model.move_rows(rows, dest)
+        # CopyAction: verhindert, dass die View die Quellzeilen anschließend selbst entfernt
+        event.setDropAction(Qt.CopyAction); event.accept()
+        if moved:
+            self.reordered.emit()
@@ -0,0 +1,109 @@
+"""Menü-Icons: Quelle je Name einmal laden (Atlas/Datei, sonst Style-Fallback), getönte Pixmaps je Größe cachen."""
+from __future__ import annotations
+from functools import lru_cache
+from typing import Dict, Iterable, List, Tuple
+from PySide6.QtCore import Qt, QSize
+from PySide6.QtGui import QColor, QIcon, QImage, QPainter, QPixmap
+from PySide6.QtWidgets import QApplication, QStyle
+from ..core.atlas import rcc_path, read_resource
+
+# Style-Fallback, falls menu_icons/<name>.png fehlt
+STYLE_FALLBACKS = {
+    "add": QStyle.SP_FileDialogNewFolder,
+    "edit": QStyle.SP_FileDialogDetailedView,
+    "delete": QStyle.SP_TrashIcon,
+    "refresh": QStyle.SP_BrowserReload,
+    "refresh_all": QStyle.SP_BrowserReload,
+    "sort": QStyle.SP_ArrowDown,
+    "login": QStyle.SP_DialogYesButton,
+    "export": QStyle.SP_DialogSaveButton,
+    "import": QStyle.SP_DialogOpenButton,
+    "settings": QStyle.SP_FileDialogInfoView,
+    "log": QStyle.SP_MessageBoxInformation,
+    "lock": QStyle.SP_DialogCloseButton,
+}
+
+
+def resource_pixmap(name: str) -> QPixmap:
+    """Pixmap aus der .rcc bzw. dem Icon-Atlas (falls gebaut) oder aus app/resources; name z. B. 'menu_icons/add.png'."""
+    qp = rcc_path(name)
+    if qp is not None:
+        return QPixmap(qp)   # direkt aus der registrierten Ressource, ohne Bytes-Kopie
+    pm = QPixmap()
+    data = read_resource(name)
+    if data:
+        pm.loadFromData(data)
+    return pm
+
+
+def tint_pixmap(pm: QPixmap, color: QColor = QColor(255, 255, 255)) -> QPixmap:
+    """Färbt alle deckenden Pixel ein (Alpha bleibt) – per Composition, nicht pixelweise."""
+    if pm.isNull():
+        return pm
+    img = pm.toImage().convertToFormat(QImage.Format_ARGB32_Premultiplied)
+    p = QPainter(img)
+    p.setCompositionMode(QPainter.CompositionMode_SourceIn)
+    p.fillRect(img.rect(), color)
+    p.end()
+    out = QPixmap.fromImage(img); out.setDevicePixelRatio(pm.devicePixelRatio())
+    return out
+
+
+class IconProvider:
+    """
+    Sidebar-/Menü-Icons. Die Quelle (PNG 1x/@2x oder Standard-Icon von QApplication.style())
+    wird pro Name genau einmal ermittelt; skalierte/getönte Pixmaps werden je (Name, px, dpr) gecacht.
+    """
+
+    def __init__(self, tint_png: bool = False, tint_color: QColor = QColor(255, 255, 255)):
+        self.tint_png = tint_png
+        self.tint_color = tint_color
+        self._sources: Dict[str, Tuple[List[QPixmap], bool]] = {}      # Name → (Quell-Pixmaps, tönen?)
+        self._pixmaps: Dict[Tuple[str, int, float], QPixmap] = {}
+        self._icons: Dict[Tuple[str, Tuple[int, ...]], QIcon] = {}
+
+    def _source(self, name: str) -> Tuple[List[QPixmap], bool]:
+        src = self._sources.get(name)
+        if src is None:
+            pms = [pm for pm in (resource_pixmap(f"menu_icons/{name}.png"), resource_pixmap(f"menu_icons/{name}@2x.png"))
+                   if not pm.isNull()]
+            if pms:
+                src = (pms, self.tint_png)
+            else:
+                ico = QApplication.style().standardIcon(STYLE_FALLBACKS.get(name, QStyle.SP_FileIcon))
+                src = ([ico.pixmap(QSize(64, 64))], True)   # Style-Icons immer hell tönen (dunkle Sidebar)
+            self._sources[name] = src
+        return src
+
+    def pixmap(self, name: str, px: int, dpr: float = 1.0) -> QPixmap:
+        key = (name, px, dpr)
+        pm = self._pixmaps.get(key)
+        if pm is None:
+            pms, tint = self._source(name)
+            target = int(round(px * dpr))
+            base = min((p for p in pms if p.width() >= target), key=lambda p: p.width(), default=pms[-1])
+            pm = base.scaled(target, target, Qt.KeepAspectRatio, Qt.SmoothTransformation) if base.width() != target else QPixmap(base)
+            pm.setDevicePixelRatio(dpr)
+            if tint: pm = tint_pixmap(pm, self.tint_color)
+            self._pixmaps[key] = pm
+        return pm
+
+    def icon(self, name: str, px: int, dprs: Iterable[float] = (1.0, 2.0)) -> QIcon:
+        dprs = tuple(dprs)
+        key = (name, (px,) + tuple(int(d * 100) for d in dprs))
+        ico = self._icons.get(key)
+        if ico is None:
+            ico = QIcon()
+            for d in dprs:
+                ico.addPixmap(self.pixmap(name, px, d))
+            self._icons[key] = ico
+        return ico
+
+    def clear(self):
+        self._sources.clear(); self._pixmaps.clear(); self._icons.clear()
+
+
+@lru_cache(maxsize=None)
+def icon_provider(tint_png: bool = False) -> IconProvider:
+    """Gemeinsamer Provider (erst nach Erzeugen der QApplication aufrufen)."""
+    return IconProvider(tint_png)
@@ -1,10 +1,86 @@
 
 from __future__ import annotations
-from PySide6.QtWidgets import QDialog, QVBoxLayout, QTextEdit, QPushButton, QHBoxLayout
+from collections import deque
+from typing import Callable, Deque, List, Optional, Tuple
+from PySide6.QtCore import QTimer
+from PySide6.QtWidgets import QDialog, QVBoxLayout, QPlainTextEdit, QPushButton, QHBoxLayout, QComboBox, QLineEdit, QLabel
+
+MAX_LINES = 5000          # Ringpuffer (Einträge) und Block-Limit der Ansicht
+FLUSH_MS = 150            # neue Zeilen werden gesammelt und höchstens so oft gezeichnet
+LEVELS = {"DEBUG": 10, "INFO": 20, "WARNING": 30, "ERROR": 40, "CRITICAL": 50}
+
+class LogBuffer:
+    """Ringpuffer der Log-Zeilen (level, text); besteht ab Start, die Ansicht erst beim ersten Öffnen."""
+    def __init__(self, maxlen: int = MAX_LINES):
+        self.lines: Deque[Tuple[int, str]] = deque(maxlen=maxlen)
+        self._listeners: List[Callable[[Tuple[int, str]], None]] = []
+    def append(self, msg: str, level: str = "INFO"):
+        entry = (LEVELS.get(level.upper(), 20), msg); self.lines.append(entry)
+        for fn in self._listeners: fn(entry)
+    def subscribe(self, fn: Callable[[Tuple[int, str]], None]): self._listeners.append(fn)
+    def clear(self): self.lines.clear()
+
 class LogDialog(QDialog):
-    def __init__(self, parent=None):
+    """
+    Protokoll-Ansicht über einem LogBuffer: neue Einträge werden gebündelt per Timer gezeichnet
+    und nur, solange der Dialog sichtbar ist (beim Öffnen Neuaufbau aus dem Puffer).
+    """
+    def __init__(self, parent=None, buffer: Optional[LogBuffer] = None):
         super().__init__(parent); self.setWindowTitle("Protokoll"); self.resize(700, 420)
-        self.text=QTextEdit(); self.text.setReadOnly(True)
+        self.buffer = buffer if buffer is not None else LogBuffer(); self._lines = self.buffer.lines
+        self._pending: List[Tuple[int, str]] = []
+        self._timer = QTimer(self); self._timer.setSingleShot(True); self._timer.setInterval(FLUSH_MS); self._timer.timeout.connect(self._flush)
+        self.text=QPlainTextEdit(); self.text.setReadOnly(True); self.text.setMaximumBlockCount(MAX_LINES)
+        self.text.setLineWrapMode(QPlainTextEdit.NoWrap); self.text.setUndoRedoEnabled(False)
+        self.level=QComboBox(); self.level.addItems(["Alle", "INFO", "WARNING", "ERROR"]); self.level.currentIndexChanged.connect(self._rebuild)
+        self.search=QLineEdit(); self.search.setPlaceholderText("Suchen …"); self.search.setClearButtonEnabled(True)
+        self.search.textChanged.connect(lambda _: self._timer.start())   # entprellt über den Flush-Timer
+        self._count=QLabel(""); self._query=("", 0); self._shown=0   # Treffer in der Ansicht (für _count)
+        btn_clear=QPushButton("Leeren"); btn_clear.clicked.connect(self.clear)
         btn=QPushButton("Schließen"); btn.clicked.connect(self.accept)
-        layout=QVBoxLayout(); layout.addWidget(self.text); hl=QHBoxLayout(); hl.addStretch(1); hl.addWidget(btn); layout.addLayout(hl); self.setLayout(layout)
-    def append(self, msg:str): self.text.append(msg); self.text.ensureCursorVisible()
+        top=QHBoxLayout(); top.addWidget(QLabel("Level:")); top.addWidget(self.level); top.addWidget(self.search, 1); top.addWidget(self._count)
+        layout=QVBoxLayout(); layout.addLayout(top); layout.addWidget(self.text)
+        hl=QHBoxLayout(); hl.addWidget(btn_clear); hl.addStretch(1); hl.addWidget(btn); layout.addLayout(hl); self.setLayout(layout)
+        self.buffer.subscribe(self._on_entry)
+
+    def append(self, msg: str, level: str = "INFO"): self.buffer.append(msg, level)
+
+    def _on_entry(self, entry: Tuple[int, str]):
+        if not self.isVisible(): return   # beim Öffnen wird aus dem Puffer neu aufgebaut
+        self._pending.append(entry)
+        if not self._timer.isActive(): self._timer.start()
+
+    def clear(self):
+        self.buffer.clear(); self._pending.clear(); self.text.clear(); self._shown = 0; self._count.setText("")
+
+    def _filter(self) -> Tuple[str, int]:
+        return self.search.text().strip().lower(), (0, 20, 30, 40)[max(0, self.level.currentIndex())]
+
+    def _visible(self, entries, query: Tuple[str, int]) -> List[str]:
+        needle, min_level = query
+        return [m for lvl, m in entries if lvl >= min_level and (not needle or needle in m.lower())]
+
+    def _flush(self):
+        if self._filter() != self._query:
+            self._rebuild(); return
+        batch, self._pending = self._pending, []
+        lines = self._visible(batch, self._query)
+        self._shown += len(lines); self._show_count()   # Gesamtzahl wächst auch bei ausgefilterten Einträgen
+        if not lines: return
+        bar = self.text.verticalScrollBar(); at_end = bar.value() >= bar.maximum() - 2
+        self.text.appendPlainText("\n".join(lines))   # ein Insert pro Batch
+        if at_end: bar.setValue(bar.maximum())
+
+    def _rebuild(self, *_):
+        self._pending.clear(); self._query = self._filter()
+        lines = self._visible(self._lines, self._query)
+        self.text.setPlainText("\n".join(lines))
+        self._shown = len(lines); self._show_count()
+        bar = self.text.verticalScrollBar(); bar.setValue(bar.maximum())
+
+    def _show_count(self):
+        # Ringpuffer verdrängt alte Einträge → Treffer höchstens so viele wie im Puffer
+        self._count.setText(f"{min(self._shown, len(self._lines))} / {len(self._lines)}" if self._query != ("", 0) else "")
+
+    def showEvent(self, e):
+        super().showEvent(e); self._rebuild()
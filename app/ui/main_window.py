@@ -1,180 +1,164 @@
 from __future__ import annotations
-import os, shutil, traceback, logging, logging.handlers
+import os, shutil, time, traceback, logging
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import replace
 from datetime import datetime
-from typing import Optional, Dict, List
-from PySide6.QtGui import QIcon, QPixmap, QPainter, QPalette, QImage, QColor
+from typing import Callable, Optional, Dict, List, Set, Tuple
+from PySide6.QtGui import QIcon, QPixmap, QPainter, QPalette, QColor, QKeySequence, QShortcut
 from PySide6.QtWidgets import (
-    QMainWindow, QWidget, QTableWidget, QTableWidgetItem, QAbstractItemView,
+    QMainWindow, QWidget,
     QVBoxLayout, QHBoxLayout, QFileDialog, QMessageBox, QProgressDialog, QDialog,
-    QHeaderView, QSizePolicy, QLabel, QFrame, QTabWidget, QToolButton, QStyle,
-    QStackedLayout, QLineEdit, QPushButton, QInputDialog
+    QHeaderView, QSizePolicy, QLabel, QFrame, QTabWidget, QToolButton,
+    QStackedLayout, QLineEdit, QPushButton, QInputDialog, QProgressBar
 )
-from PySide6.QtCore import Qt, QSize
+from PySide6.QtCore import Qt, QSize, QTimer, QFileSystemWatcher, QEventLoop
 
-from ..core.models import Account, AppState, Game, Queue
+from ..core.models import ACCOUNT_SCHEMA, Account, AppState, Game
+from ..core.tiers import Tier, rank_delta
+from ..core.search import SearchIndex, QueryError
 from ..core.settings import Settings
+from ..core.applog import setup_file_logging
 from ..core.vault import Vault
-from ..core.icons import get_rank_icon
-from ..core.riot import start_riot, focus_riot_login_window, ensure_login_only, focus_username_field
-from ..core.kpxc import trigger_autotype, autotype_entry
-from ..core.ranks import fetch_valorant_rank, fetch_lol_tft_rank
-from .add_edit_dialog import AddEditDialog
-from .settings_dialog import SettingsDialog
-from .log_dialog import LogDialog
-
-USER_ROLE_KEY = Qt.UserRole + 1
+from ..core.icons import cached_rank_icon, prefetch_rank_icons
+from ..core.atlas import resource_names
+from ..core import merge, startup_profile
+from .log_dialog import LogBuffer
+from .icon_provider import icon_provider, resource_pixmap
+# Schwere/plattformspezifische Module (requests, ctypes/windll, pyautogui/keyboard) und Dialoge
+# werden erst bei Bedarf importiert – siehe _fetch_rank, _login_flow und die Aktionen.
+from .tasks import Task, TaskRunner
+from .persistence import WriteBehind
+from .account_table import (
+    AccountTableModel, AccountTableView, AccountFilterProxy, RankIconDelegate, KEY_ROLE, VALORANT_COLUMNS, LOL_COLUMNS
+)
+
 ICON_SIZE = 28
 ROW_HEIGHT = 32
+SEARCH_DEBOUNCE_MS = 150
+RANK_FETCH_WORKERS = 4   # parallele Rank-Abrufe (Rate-Limits der APIs beachten)
+PERSIST_DELAY_MS = 800   # Ruhezeit, nach der gebündelte Änderungen ins Vault geschrieben werden
+PERSIST_MAX_DELAY_MS = 5000
+VAULT_RELOAD_DEBOUNCE_MS = 500   # Sync-Tools schreiben in mehreren Schritten – erst nach Ruhe neu laden
+VAULT_RELOAD_WAIT_MS = 5000      # so lange warten synchrone Saves (Lock, Beenden) auf einen laufenden Reload
 LEFT_ICON_PX = 20
 FORCE_WHITE_TINT = False
 
 
-def _row_key(acc: Account) -> str:
-    return f"{acc.game.value}|{acc.alias}|{acc.riot_id}"
-
-
-def _tint_pixmap_white(pm: QPixmap) -> QPixmap:
-    if pm.isNull():
-        return pm
-    img = pm.toImage().convertToFormat(QImage.Format_ARGB32)
-    out = QPixmap(pm.size()); out.fill(Qt.transparent)
-    p = QPainter(out)
-    p.setCompositionMode(QPainter.CompositionMode_Source)
-    p.drawImage(0, 0, img)
-    p.setCompositionMode(QPainter.CompositionMode_SourceIn)
-    p.fillRect(out.rect(), QColor(255,255,255))
-    p.end()
-    return out
-
-
-def _menu_icons_dir() -> str:
-    base_dir = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
-    return os.path.join(base_dir, "resources", "menu_icons")
-
-
-def _load_menu_icon(name: str) -> QIcon:
-    path_base = os.path.join(_menu_icons_dir(), name + ".png")
-    ico = QIcon()
-    if os.path.exists(path_base):
-        pm = QPixmap(path_base)
-        if not pm.isNull():
-            if FORCE_WHITE_TINT:
-                pm = _tint_pixmap_white(pm)
-            ico.addPixmap(pm)
-        path_2x = os.path.join(_menu_icons_dir(), name + "@2x.png")
-        if os.path.exists(path_2x):
-            pm2 = QPixmap(path_2x)
-            if not pm2.isNull():
-                if FORCE_WHITE_TINT:
-                    pm2 = _tint_pixmap_white(pm2)
-                ico.addPixmap(pm2)
-        if not ico.isNull():
-            return ico
-    # Fallback
-    style_map = {
-        "add": QStyle.SP_FileDialogNewFolder,
-        "edit": QStyle.SP_FileDialogDetailedView,
-        "delete": QStyle.SP_TrashIcon,
-        "refresh": QStyle.SP_BrowserReload,
-        "refresh_all": QStyle.SP_BrowserReload,
-        "login": QStyle.SP_DialogYesButton,
-        "export": QStyle.SP_DialogSaveButton,
-        "import": QStyle.SP_DialogOpenButton,
-        "settings": QStyle.SP_FileDialogInfoView,
-        "log": QStyle.SP_MessageBoxInformation,
-        "lock": QStyle.SP_DialogCloseButton,
-    }
-    sp = style_map.get(name, QStyle.SP_FileIcon)
-    base = QMainWindow().style().standardIcon(sp)
-    pm = base.pixmap(QSize(LEFT_ICON_PX, LEFT_ICON_PX))
-    pm = _tint_pixmap_white(pm)
-    ico.addPixmap(pm)
-    return ico
-
-
 # ---------- Valorant-Icon-Helper (Tracker-ähnliches Pack) ----------
-def _normalize_valo_tier(tier: str) -> str:
-    if tier is None:
-        return ""
-    t = str(tier).strip().lower().replace("-", " ").replace("_", " ")
-    # DE → EN
-    t = (t.replace("silber", "silver")
-           .replace("gold", "gold")
-           .replace("platin", "platinum")
-           .replace("diamant", "diamond")
-           .replace("strahlend", "radiant"))
-    t = " ".join(t.split())
-    # Tippfehler
-    t = (t.replace("platum", "platinum")
-           .replace("plati", "platinum")
-           .replace("immotal", "immortal")
-           .replace("ascandant", "ascendant"))
-    # Kürzungen
-    t = (t.replace("ascendant", "asc")
-           .replace("platinum", "plat")
-           .replace("diamond", "dia")
-           .replace("immortal", "imm")
-           .replace("radiant", "rad"))
-    # Römisch → arabisch
-    if t.endswith(" iii"): t = t[:-4] + "3"
-    elif t.endswith(" ii"): t = t[:-3] + "2"
-    elif t.endswith(" i"): t = t[:-2] + "1"
-    return t.replace(" ", "")
-
-def _valo_icons_folder(base_dir: str) -> str:
-    return os.path.join(base_dir, "resources", "valo_tracker_icons")
-
-def _search_fuzzy_icon(folder: str, key_noext: str) -> Optional[str]:
+VALO_ICON_FOLDER = "valo_tracker_icons"
+# Dateinamen-Stämme im Pack je kanonischem Tier (Kurzform zuerst; 'silber' = DE-Pack)
+VALO_ICON_STEMS = {
+    "silver": ("silver", "silber"), "platinum": ("plat", "platinum"), "diamond": ("dia", "diamond"),
+    "ascendant": ("asc", "ascendant"), "immortal": ("imm", "immortal"), "radiant": ("rad", "radiant"),
+}
+
+def _search_fuzzy_icon(key_noext: str) -> Optional[str]:
+    names = resource_names(VALO_ICON_FOLDER)
     for ext in (".png",".webp",".svg"):
-        p = os.path.join(folder, key_noext + ext)
-        if os.path.exists(p):
-            return p
-        low = key_noext.lower()
-        try:
-            for fn in os.listdir(folder):
-                if low in fn.lower():
-                    return os.path.join(folder, fn)
-        except Exception:
-            pass
+        if key_noext + ext in names:
+            return f"{VALO_ICON_FOLDER}/{key_noext}{ext}"
+    low = key_noext.lower()
+    for fn in names:
+        if low in fn.lower():
+            return f"{VALO_ICON_FOLDER}/{fn}"
     return None
 
-def _valorant_icon_path_for_tier(base_dir: str, tier: str) -> Optional[str]:
-    key = _normalize_valo_tier(tier)
-    folder = _valo_icons_folder(base_dir)
-    if not key:
+def _valorant_icon_name_for_tier(tier: Tier) -> Optional[str]:
+    """Ressourcenname im lokalen Valorant-Icon-Pack (Atlas oder Ordner), z. B. 'valo_tracker_icons/gold2.png'."""
+    if not tier.ranked:
         return None
-    # 1) direkt
-    p = _search_fuzzy_icon(folder, key)
-    if p:
-        return p
-    # 2) Fallbacks
-    num = key[-1] if key and key[-1] in "123" else ""
-    base = key[:-1] if num else key
-    if base.startswith(("platu", "plati")):
-        base = "plat"
-    candidates = []
-    if num:
-        if base.startswith("plat"):     candidates += [f"platinum{num}", f"plat{num}"]
-        if base.startswith("dia"):      candidates += [f"diamond{num}", f"dia{num}"]
-        if base.startswith("asc"):      candidates += [f"ascendant{num}", f"asc{num}"]
-        if base.startswith("imm"):      candidates += [f"immortal{num}", f"imm{num}"]
-    else:
-        if base in ("rad", "radiant"):  candidates += ["radiant", "rad"]
-        map_full = {"plat":"platinum", "dia":"diamond", "asc":"ascendant", "imm":"immortal"}
-        if base in map_full: candidates.append(map_full[base])
-    for cand in candidates:
-        p = _search_fuzzy_icon(folder, cand)
+    div = str(tier.division) if tier.division else ""
+    for stem in VALO_ICON_STEMS.get(tier.tier, (tier.tier,)):
+        p = _search_fuzzy_icon(stem + div)
         if p:
             return p
     return None
 
 
+def _rank_change_text(old: Tier, new: Tier) -> str:
+    delta = rank_delta(old, new)
+    if delta is None or delta == 0:
+        return new.label
+    return f"{old.label} → {new.label} ({'▲' if delta > 0 else '▼'}{abs(delta)})"
+
+
+# ---------- Blockierende Arbeit (läuft im TaskRunner, nie im GUI-Thread) ----------
+def _fetch_rank(acc: Account, settings: Settings) -> Tuple[str, Optional[int], Optional[int]]:
+    """Rank-Abruf für einen Account-Snapshot → (tier, rr, elo); ändert nichts am State."""
+    from ..core.ranks import fetch_valorant_rank, fetch_lol_tft_rank
+    if acc.game==Game.valorant:
+        tier, rr, *_ = fetch_valorant_rank(acc.riot_id, acc.region, settings)
+        return tier or "", rr, None
+    tier, lp = fetch_lol_tft_rank(acc, settings)
+    return tier, None, lp
+
+
+def _login_flow(task: Task, acc: Account, settings: Settings):
+    """Riot Client starten/fokussieren, KeePassXC Auto-Type, danach Login-Phase absichern (~8 s)."""
+    from ..core.riot import start_riot, focus_riot_login_window, ensure_login_only, focus_username_field
+    from ..core.kpxc import trigger_autotype, autotype_entry
+    log = task.log
+    # Riot Client sicher starten (nur Client, kein Spiel)
+    if settings.riot_client_path:
+        start_riot(settings.riot_client_path, acc.game.value, log=log)
+    focus_riot_login_window(log=log)
+
+    # Username-Feld fokussieren/prüfen
+    try:
+        ok_focus = focus_username_field(log=log)
+    except Exception as e:
+        ok_focus = False
+        log(f"focus_username_field() schlug fehl: {type(e).__name__}: {e}", "ERROR")
+    if not ok_focus:
+        log("Hinweis: Benutzername-Feld konnte nicht eindeutig fokussiert werden. "
+            "Falls Auto-Type nicht greift, klicke in das Feld und wiederhole den Login.")
+
+    # KeePassXC Auto-Type
+    try:
+        if acc.kpxc_entry and acc.kpxc_entry.strip():
+            log(f"KeePassXC: gezielter Auto-Type für Eintrag: {acc.kpxc_entry}")
+            autotype_entry(settings.auto_type_hotkey, acc.kpxc_entry.strip())
+        else:
+            log("KeePassXC: globaler Auto-Type")
+            trigger_autotype(settings.auto_type_hotkey)
+    except Exception as e:
+        raise RuntimeError(f"KeePassXC Auto-Type fehlgeschlagen:\n{e}") from e
+
+    # Sicherheit: nur Login-Phase, kein Spielstart
+    try:
+        ensure_login_only(duration=8.0, kill=True, log=log)
+    except Exception as e:
+        log(f"ensure_login_only() Fehlermeldung: {type(e).__name__}: {e}", "ERROR")
+
+
 class MainWindow(QMainWindow):
     def __init__(self, vault: Vault, settings: Settings, state: AppState):
         super().__init__()
         self._init_logging()  # Datei-Logging + globale Exception-Hooks
-        self.vault=vault; self.settings=settings; self.state=state; self.log=LogDialog(self)
+        self.vault=vault; self.settings=settings; self.state=state
+        self.log_buffer = LogBuffer(); self._log_dialog = None   # Dialog erst beim ersten Öffnen
         self.is_locked = False
+        self._icon_cache: Dict[Tuple[str, str], Optional[QPixmap]] = {}   # (game, tier) → Pixmap bzw. None (fehlt)
+        self._icons_pending: Set[Tuple[str, str]] = set()
+        self._icons_failed: Set[Tuple[str, str]] = set()
+        self.tasks = TaskRunner(self, log=self.log_msg)
+        self.tasks.busy_changed.connect(self._tasks_busy)
+        self.search = SearchIndex(self.state.accounts)   # vor den Tabellen-Models registrieren
+        # Write-behind: Mutationen markieren nur dirty, geschrieben wird gebündelt (und sofort bei Lock/Beenden)
+        self.persist = WriteBehind(self._write_dirty, self, delay_ms=PERSIST_DELAY_MS, max_delay_ms=PERSIST_MAX_DELAY_MS)
+        self._persisted: Dict[str, object] = {}   # zuletzt geschriebener/geladener Stand je Bereich (No-op-Erkennung)
+        self._unlock_t0 = 0.0
+        self._persist_gen = 0                      # erhöht bei Lock/Neuladen; verspätete Hintergrund-Saves ändern die Baseline nicht
+        # Externe Änderungen an der Vault-Datei (z. B. Sync-Ordner, zweiter Rechner) erkennen und einspielen
+        self._vault_watch = QFileSystemWatcher(self)
+        self._reload_pending = False               # Reload-Task gestartet, Ergebnis noch nicht im Store
+        self._reload_waiters: List[Callable[[bool], None]] = []   # bis dahin zurückgestellte Saves
+        self._reload_failed_sig: Optional[Tuple[int, int]] = None
+        self._carried: Optional[Dict[str, object]] = None   # beim Sperren nicht schreibbare Änderungen → nach Unlock erneut
+        self._vault_reload_timer = QTimer(self); self._vault_reload_timer.setSingleShot(True)
+        self._vault_reload_timer.setInterval(VAULT_RELOAD_DEBOUNCE_MS); self._vault_reload_timer.timeout.connect(self._check_vault_file)
+        self._vault_watch.fileChanged.connect(lambda _p: self._vault_reload_timer.start())
+        self._vault_watch.directoryChanged.connect(lambda _p: self._vault_reload_timer.start())   # atomares Ersetzen
 
         self.setWindowTitle("Riot Account Manager")
         self.resize(1280,760)
@@ -203,12 +187,8 @@ class MainWindow(QMainWindow):
             os.makedirs(log_dir, exist_ok=True)
             log_path = os.path.join(log_dir, "app.log")
 
-            self._py_logger = logging.getLogger("CValoMgr")
-            self._py_logger.setLevel(logging.INFO)
-            if not self._py_logger.handlers:
-                fh = logging.handlers.RotatingFileHandler(log_path, maxBytes=2_000_000, backupCount=3, encoding="utf-8")
-                fh.setFormatter(logging.Formatter("%(asctime)s [%(levelname)s] %(message)s"))
-                self._py_logger.addHandler(fh)
+            # Schreiben/Rotieren im Listener-Thread – log_msg() blockiert nie auf Datei-I/O
+            self._py_logger = setup_file_logging(log_path)
 
             # Ungefangene Exceptions → Log
             import sys, traceback as _tb
@@ -217,7 +197,7 @@ class MainWindow(QMainWindow):
                 try:
                     self.log_error("Ungefangene Ausnahme", exc, extra=msg)
                 except Exception:
-                    self._py_logger.error("Ungefangene Ausnahme:\n%s", msg)
+                    self._py_logger.error("Ungefangene Ausnahme", exc_info=(exc_type, exc, tb))
             sys.excepthook = _hook
 
             # Qt-Meldungen → Log (optional)
@@ -236,57 +216,86 @@ class MainWindow(QMainWindow):
         except Exception:
             pass
 
-    def log_msg(self, msg: str, level: str = "INFO"):
-        """Schreibt eine Nachricht mit Zeitstempel in UI-Log + Datei-Log."""
+    def log_msg(self, msg: str, level: str = "INFO", *, exc_info=None, **fields):
+        """
+        Schreibt eine Nachricht mit Zeitstempel in UI-Log + Datei-Log (über die Log-Queue).
+        fields: strukturierte Felder fürs Datei-Log (event, account, duration_ms).
+        """
         ts = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
         line = f"[{ts}] [{level}] {msg}"
         try:
-            self.log.append(line)  # UI
+            self.log_buffer.append(line, level)  # UI (Ringpuffer; Ansicht zeichnet gebündelt)
         except Exception:
             pass
         try:
             lvl = getattr(logging, level.upper(), logging.INFO)
             if hasattr(self, "_py_logger"):
-                self._py_logger.log(lvl, msg)  # Datei
+                self._py_logger.log(lvl, msg, exc_info=exc_info, extra=fields or None)  # Datei
         except Exception:
             pass
 
-    def log_error(self, context: str, exc: Exception | None = None, extra: str | None = None):
-        """Fehler-Logger mit Kontext + Exception + optionalem Stacktrace."""
-        import traceback as _tb
+    def log_error(self, context: str, exc: BaseException | None = None, extra: str | None = None, **fields):
+        """
+        Fehler-Logger mit Kontext + Exception. Ein Traceback wird nicht hier formatiert:
+        das Datei-Log bekommt exc_info (formatiert im Listener-Thread), das UI-Log nur 'extra'.
+        """
         parts = [f"{context}"]
         if exc is not None:
             parts.append(f"{type(exc).__name__}: {exc}")
-        try:
-            tb = extra or _tb.format_exc()
-            if tb and tb.strip() != "NoneType: None":
-                parts.append(tb)
-        except Exception:
-            pass
-        self.log_msg("\n".join(parts), level="ERROR")
+        if extra and extra.strip():
+            parts.append(extra)
+        exc_info = exc if exc is not None and exc.__traceback__ is not None and not extra else None
+        self.log_msg("\n".join(parts), level="ERROR", exc_info=exc_info, **fields)
 
     # -------- Start-Entsperrung (von main.py aufgerufen) --------
     def startup_unlock(self) -> bool:
-        ok = False
-        try:
-            ok = bool(self._ensure_vault_open())
-        except Exception:
-            ok = False
-
-        if ok:
+        """
+        Bereits offenes Vault → direkt laden. Sonst blockiert der Start nicht auf der Schlüsselableitung:
+        vorhandenes Vault → Sperrseite (Entsperren läuft im Hintergrund), neues Vault → Passwort
+        abfragen und im Hintergrund anlegen. Rückgabe: ob das Vault jetzt schon offen ist.
+        """
+        if self._vault_is_open():
             try:
                 self._load_from_vault()
             except Exception as e:
                 self.log_error("Startup: Laden aus Vault fehlgeschlagen", e)
             self._show_locked_page(False)
-        else:
-            self._show_locked_page(True)
+            self._warmup_icons()
+            self._watch_vault()
+            try:
+                self.reload_tables()
+            except Exception as e:
+                self.log_error("Startup: reload_tables fehlgeschlagen", e)
+            return True
 
-        try:
-            self.reload_tables()
-        except Exception as e:
-            self.log_error("Startup: reload_tables fehlgeschlagen", e)
-        return ok
+        self._show_locked_page(True)
+        startup_profile.mark("Entsperr-Prompt")
+        vault_path = getattr(self.vault, "path", None)
+        if vault_path and os.path.isfile(vault_path):
+            self._unlock_edit.setFocus()
+            return False
+
+        self._start_create_vault()
+        return False
+
+    def _start_create_vault(self):
+        pwd = self._prompt_new_password()
+        if pwd and self.tasks.submit("Vault anlegen", lambda t: self._create_vault(pwd), key="vault",
+                                     on_done=self._vault_created, on_error=self._vault_task_failed):
+            self._set_unlock_busy(True, "Vault wird angelegt ...")
+
+    def _vault_created(self, ok: bool):
+        self._set_unlock_busy(False)
+        if not ok:
+            QMessageBox.critical(self, "Vault", "Vault konnte nicht angelegt werden. Bitte prüfe den Pfad in den Einstellungen.")
+            return
+        QMessageBox.information(self, "Vault", "Neues Vault wurde angelegt.")
+        self._vault_opened()
+
+    def _vault_task_failed(self, exc: BaseException, tb: str):
+        self._set_unlock_busy(False)
+        self.log_error("Vault-Vorgang fehlgeschlagen", exc if isinstance(exc, Exception) else None, extra=tb)
+        self._unlock_msg.setText(f"Fehler: {exc}")
 
     # -------------------- Vault-Helfer --------------------
     def _vault_is_open(self) -> bool:
@@ -305,73 +314,65 @@ class MainWindow(QMainWindow):
                 try:
                     _ = getattr(self.vault, m)(pwd)
                     if self._vault_is_open():
+                        try: getattr(self.vault, "get_accounts", lambda: None)()   # Records (lazy) hier entschlüsseln,
+                        except Exception: pass                                      # nicht in _load_from_vault (GUI-Thread; meldet Fehler)
                         return True, None
                 except Exception as e:
                     last_err = str(e)
         return False, last_err
 
-    def _ensure_vault_open(self) -> bool:
-        if self._vault_is_open():
-            return True
-
-        vault_path = getattr(self.vault, "path", None)
-        file_exists = bool(vault_path and os.path.isfile(vault_path))
-
-        def _try_create(pwd: str) -> bool:
-            for m in ("create", "init", "initialize", "set_password"):
-                if hasattr(self.vault, m):
-                    try:
-                        res = getattr(self.vault, m)(pwd)  # type: ignore
-                        if res is None or res is True:
-                            try:
-                                if not hasattr(self.vault, "data") or self.vault.data is None:
-                                    self.vault.data = {}
-                                self.vault.data.setdefault("accounts", [])
-                                self.vault.data.setdefault("settings", {})
-                            except Exception:
-                                pass
-                            getattr(self.vault, "save", lambda: None)()
-                            return True
-                    except Exception:
-                        continue
-            ok,_ = self._vault_try_unlock(pwd)
-            if ok:
+    def _create_vault(self, pwd: str) -> bool:
+        """Legt das Vault an (bzw. öffnet es, falls schon vorhanden) – blockierend (KDF)."""
+        for m in ("create", "init", "initialize", "set_password"):
+            if hasattr(self.vault, m):
                 try:
-                    if not hasattr(self.vault, "data") or self.vault.data is None:
-                        self.vault.data = {}
-                    self.vault.data.setdefault("accounts", [])
-                    self.vault.data.setdefault("settings", {})
-                    getattr(self.vault, "save", lambda: None)()
-                    return True
+                    res = getattr(self.vault, m)(pwd)  # type: ignore
+                    if res is None or res is True:
+                        try:
+                            if not hasattr(self.vault, "data") or self.vault.data is None:
+                                self.vault.data = {}
+                            self.vault.data.setdefault("accounts", [])
+                            self.vault.data.setdefault("settings", {})
+                        except Exception:
+                            pass
+                        getattr(self.vault, "save", lambda: None)()
+                        return True
                 except Exception:
-                    return False
-            return False
-
-        if file_exists:
-            pwd, ok = QInputDialog.getText(self, "Vault entsperren", "Master-Passwort:", QLineEdit.Password)
-            if not ok or not pwd:
-                return False
-            ok, _err = self._vault_try_unlock(pwd)
-            if ok:
-                self._load_from_vault()
+                    continue
+        ok,_ = self._vault_try_unlock(pwd)
+        if ok:
+            try:
+                if not hasattr(self.vault, "data") or self.vault.data is None:
+                    self.vault.data = {}
+                self.vault.data.setdefault("accounts", [])
+                self.vault.data.setdefault("settings", {})
+                getattr(self.vault, "save", lambda: None)()
                 return True
-            QMessageBox.critical(self, "Vault", "Entsperren fehlgeschlagen (Passwort falsch oder Datei beschädigt).")
-            return False
-        else:
-            pwd1, ok1 = QInputDialog.getText(self, "Neues Vault", "Neues Master-Passwort:", QLineEdit.Password)
-            if not ok1 or not pwd1:
-                return False
-            pwd2, ok2 = QInputDialog.getText(self, "Neues Vault", "Passwort wiederholen:", QLineEdit.Password)
-            if not ok2 or not pwd2:
-                return False
-            if pwd1 != pwd2:
-                QMessageBox.warning(self, "Vault", "Passwörter stimmen nicht überein.")
+            except Exception:
                 return False
-            if _try_create(pwd1):
-                QMessageBox.information(self, "Vault", "Neues Vault wurde angelegt.")
-                return True
-            QMessageBox.critical(self, "Vault", "Vault konnte nicht angelegt werden. Bitte prüfe den Pfad in den Einstellungen.")
-            return False
+        return False
+
+    def _prompt_new_password(self, title: str = "Neues Vault") -> Optional[str]:
+        pwd1, ok1 = QInputDialog.getText(self, title, "Neues Master-Passwort:", QLineEdit.Password)
+        if not ok1 or not pwd1:
+            return None
+        pwd2, ok2 = QInputDialog.getText(self, title, "Passwort wiederholen:", QLineEdit.Password)
+        if not ok2 or not pwd2:
+            return None
+        if pwd1 != pwd2:
+            QMessageBox.warning(self, title, "Passwörter stimmen nicht überein.")
+            return None
+        return pwd1
+
+    def _ensure_vault_open(self) -> bool:
+        """Nie synchron entsperren (KDF würde die GUI blockieren): gesperrt → Sperrseite, Entsperren läuft dort im Hintergrund."""
+        if self._vault_is_open():
+            return True
+        self._show_locked_page(True)
+        vault_path = getattr(self.vault, "path", None)
+        if vault_path and os.path.isfile(vault_path): self._unlock_edit.setFocus()
+        elif not self.tasks.running("vault"): self._start_create_vault()
+        return False
 
     # ==== Speicher-Helfer ====
     def _ensure_vault_dict(self):
@@ -428,37 +429,206 @@ class MainWindow(QMainWindow):
         return False, (last or "Keine passende Save-Methode im Vault gefunden.")
 
     def _persist_accounts(self) -> bool:
-        """Speichert state.accounts sicher ins Vault – ohne replace_accounts()."""
+        """Markiert die Accounts als geändert; geschrieben wird gebündelt über self.persist."""
         if not self._ensure_vault_open():
             QMessageBox.warning(self, "Vault gesperrt", "Speichern abgebrochen – Vault ist nicht entsperrt.")
             return False
+        self.persist.mark_dirty("accounts")
+        return True
 
-        accounts = self._accounts_to_dicts()
+    def _write_dirty(self, sections: Set[str], done: Optional[Callable[[bool], None]] = None) -> Optional[bool]:
+        """
+        Schreibt die geänderten Bereiche (accounts/settings) in einem Save; unveränderte Stände werden übersprungen.
+        Der Stand wird im GUI-Thread ins Vault übernommen; mit done (Timer-Flush) läuft das Verschlüsseln/Schreiben
+        als Task (Rückgabe None, Ergebnis über done).
+        """
+        if not self._vault_is_open():
+            self.log_msg("Speichern verschoben – Vault ist nicht entsperrt.", level="WARNING")
+            return False
+        if self._reload_pending or (getattr(self.vault, "changed_on_disk", None) and self.vault.changed_on_disk()):
+            # Fremde Änderungen erst über den Reload-Task einspielen: reload() setzt die Datei-Signatur schon im Worker –
+            # ein Save davor schriebe den alten Store als Delta auf den neuen Stand und drehte sie zurück
+            if not self._reload_pending: self._check_vault_file()
+            if done is not None and self._reload_pending:
+                self._reload_waiters.append(done); return None   # done(False) nach dem Einspielen → Timer neu
+            if not self._await_vault_reload():
+                self.log_msg("Speichern verschoben – externe Änderung am Vault ist noch nicht geladen.", level="WARNING")
+                return False
+        current = {}
+        if "accounts" in sections: current["accounts"] = [a.to_dict() for a in self.state.accounts]
+        if "settings" in sections: current["settings"] = self._settings_to_dict()
+        changed = {k: v for k, v in current.items() if v != self._persisted.get(k)}
+        if not changed and "vault" not in sections:   # "vault": vault.data schon aktualisiert, nur noch schreiben
+            self.log_msg(f"Speichern übersprungen ({', '.join(sorted(sections))} unverändert).", level="DEBUG")
+            return True
 
         try:
             self._ensure_vault_dict()
-            self.vault.data["accounts"] = accounts
+            if hasattr(self.vault, "update_data"): self.vault.update_data(changed)   # unter dem Vault-Lock
+            else: self.vault.data.update(changed)
         except Exception as e:
             vpath = getattr(self.vault, "path", "unbekannt")
-            self.log_error(f"Vault: Schreiben in vault.data['accounts'] fehlgeschlagen (Pfad: {vpath})", e)
+            self.log_error(f"Vault: Schreiben in vault.data fehlgeschlagen (Pfad: {vpath})", e)
             QMessageBox.critical(self, "Speichern fehlgeschlagen",
-                f"Konnte Accounts nicht in vault.data schreiben.\n\nPfad: {vpath}\nDetails: {e}")
+                f"Konnte Daten nicht in vault.data schreiben.\n\nPfad: {vpath}\nDetails: {e}")
             return False
 
-        ok, err = self._save_vault()
+        gen, t0 = (self._persist_gen, self.persist.epoch), time.perf_counter()
+        if done is not None:
+            def failed(exc, tb):
+                self.log_error("Vault: Speichern im Hintergrund fehlgeschlagen", exc, extra=tb, event="vault_save")
+                done(False)
+            if self.tasks.submit("Vault speichern", lambda t: self._save_vault(), key="vault-save",
+                                 on_done=lambda r: done(self._save_finished(r, changed, gen, t0, interactive=False)),
+                                 on_error=failed):
+                return None
+        return self._save_finished(self._save_vault(), changed, gen, t0)
+
+    def _save_finished(self, result: tuple[bool, str | None], changed: dict, gen: Tuple[int, int], t0: float,
+                       interactive: bool = True) -> bool:
+        ok, err = result
+        dt_ms = round((time.perf_counter() - t0) * 1000)
+        # inzwischen gesperrt/neu geladen oder von flush() mit neuerem Stand überholt → Baseline nicht mehr anfassen
+        if gen != (self._persist_gen, self.persist.epoch):
+            return ok
+        if not ok and getattr(self.vault, "changed_on_disk", None) and self.vault.changed_on_disk():
+            self.log_msg("Vault wurde extern geändert – wird neu geladen, danach erneut gespeichert.", level="WARNING")
+            self._vault_reload_timer.start(); return False
         if not ok:
             vpath = getattr(self.vault, "path", "unbekannt")
-            self.log_error(f"Vault: Speichern fehlgeschlagen (Pfad: {vpath})", Exception(err or "n/a"))
-            QMessageBox.critical(self, "Speichern fehlgeschlagen",
-                f"Konnte Datei nicht sichern.\n\nPfad: {vpath}\nDetails: {err or 'n/a'}")
+            self.log_error(f"Vault: Speichern fehlgeschlagen (Pfad: {vpath})", Exception(err or "n/a"), event="vault_save")
+            if interactive:
+                QMessageBox.critical(self, "Speichern fehlgeschlagen",
+                    f"Konnte Datei nicht sichern.\n\nPfad: {vpath}\nDetails: {err or 'n/a'}")
+            else:
+                self.statusBar().showMessage("Speichern fehlgeschlagen – wird erneut versucht (Details im Log).", 5000)
             return False
 
-        try:
-            self.log_msg(f"Gespeichert: {len(accounts)} Accounts")
-        except Exception:
-            pass
+        self._persisted.update(changed)
+        what = ", ".join(f"{len(v)} Accounts" if k == "accounts" else "Einstellungen" for k, v in sorted(changed.items())) \
+            or "IDs/Migration"
+        self.log_msg(f"Gespeichert: {what}{self._vault_phases()}", event="vault_save", duration_ms=dt_ms)
+        self._maybe_compact_vault()
         return True
 
+    def _vault_phases(self) -> str:
+        """Phasenzeiten des letzten Vault-Vorgangs fürs Log, z. B. ' (kdf 480 ms, decrypt 12 ms)'."""
+        timings = dict(getattr(self.vault, "timings", None) or {})
+        return f" ({', '.join(f'{k} {round(v)} ms' for k, v in timings.items())})" if timings else ""
+
+    # ----------- Externe Änderungen an der Vault-Datei -----------
+    def _watch_vault(self, on: bool = True):
+        paths = self._vault_watch.files() + self._vault_watch.directories()
+        if paths: self._vault_watch.removePaths(paths)
+        vpath = getattr(self.vault, "path", None)
+        if on and vpath and hasattr(self.vault, "reload"):
+            self._vault_watch.addPaths([p for p in (vpath, os.path.dirname(os.path.abspath(vpath))) if os.path.exists(p)])
+
+    def _check_vault_file(self):
+        """Debounced nach fileChanged/directoryChanged: eigene Writes ignorieren, fremde im Hintergrund entschlüsseln."""
+        if not self._vault_is_open(): return
+        vpath = getattr(self.vault, "path", "")
+        if vpath not in self._vault_watch.files() and os.path.isfile(vpath): self._vault_watch.addPath(vpath)   # nach Ersetzen neu
+        if self._reload_pending: self._vault_reload_timer.start(); return   # läuft schon – danach nochmal prüfen
+        if not self.vault.changed_on_disk(): return
+        sig = self._vault_file_sig()
+        if sig is not None and sig == self._reload_failed_sig: return   # dieselbe unlesbare Fassung nicht erneut versuchen
+
+        def work(task: Task):
+            self.vault.reload()   # gecachter Key, keine KDF
+            self.vault.get_accounts()   # Records schon hier entschlüsseln, nicht im GUI-Thread
+
+        def failed(exc, tb):
+            self._reload_pending = False; self._reload_failed_sig = sig; self._release_reload_waiters()
+            self.log_error("Vault: externe Änderung konnte nicht geladen werden", exc, extra=tb)
+            self.statusBar().showMessage(f"Vault extern geändert, Laden fehlgeschlagen: {exc}", 8000)
+            # einmal je Dateifassung: bis zum erneuten Entsperren wird nichts mehr gespeichert
+            QMessageBox.warning(self, "Vault extern geändert",
+                "Die Vault-Datei wurde außerhalb dieses Fensters geändert (z. B. neues Passwort) und konnte nicht "
+                f"geladen werden:\n{exc}\n\nÄnderungen werden erst wieder gespeichert, wenn der Vault gesperrt und neu "
+                "entsperrt wurde – ungespeicherte Änderungen werden danach erneut übernommen.")
+
+        t0 = time.perf_counter()
+        if self.tasks.submit("Vault neu laden", work, key="vault-reload", on_error=failed,
+                             on_done=lambda _r: self._apply_external_change(t0)) is not None:
+            # bis _apply_external_change den Store nachgezogen hat, wird nicht gespeichert (siehe _write_dirty)
+            self._reload_pending = True
+            self._persist_gen += 1   # reload() verwirft Ungespeichertes im Vault – laufende Saves nicht als geschrieben werten
+
+    def _vault_file_sig(self) -> Optional[Tuple[int, int]]:
+        try: st = os.stat(self.vault.path)
+        except (OSError, AttributeError): return None
+        return st.st_size, st.st_mtime_ns
+
+    def _release_reload_waiters(self):
+        """Zurückgestellte Saves freigeben: done(False) lässt WriteBehind die Bereiche erneut planen."""
+        waiters, self._reload_waiters = self._reload_waiters, []
+        for done in waiters: done(False)
+
+    def _await_vault_reload(self) -> bool:
+        """Synchrone Saves (Lock, Beenden, Dialoge): den Reload-Task abwarten statt im GUI-Thread zu entschlüsseln."""
+        if self._reload_pending:
+            loop = QEventLoop(); self._reload_waiters.append(lambda _ok: loop.quit())
+            QTimer.singleShot(VAULT_RELOAD_WAIT_MS, loop.quit); loop.exec()
+        return not self._reload_pending and not self.vault.changed_on_disk()
+
+    def _apply_external_change(self, t0: Optional[float] = None):
+        """
+        Neu geladenen Vault-Stand gegen die Baseline (zuletzt gelesen/geschrieben) diffen und nur geänderte Accounts
+        im Store ersetzen/ergänzen/entfernen; lokale, noch nicht gespeicherte Änderungen anderer Accounts bleiben
+        und werden danach wieder geschrieben. Bei Konflikten im selben Account gewinnt die Datei.
+        """
+        self._reload_pending = False; self._reload_failed_sig = None
+        try:
+            if self._vault_is_open(): self._merge_reloaded(t0)   # sonst inzwischen gesperrt
+        finally:
+            self._release_reload_waiters()
+
+    def _merge_reloaded(self, t0: Optional[float]):
+        accs, settings = list(self.vault.get_accounts()), dict(self.vault.get_settings() or {})
+        self._persist_gen += 1   # laufende Saves beziehen sich auf den alten Stand
+        base = {d.get("id"): d for d in self._persisted.get("accounts") or [] if isinstance(d, dict)}
+        store = self.state.accounts
+        disk_ids = {d.get("id") for d in accs if isinstance(d, dict) and d.get("id")}
+        # Datei-Records ohne (bekannte) ID: per merge_key einem Store-Account zuordnen, der in der Datei fehlt –
+        # sonst würde jeder ID-lose Account beim Reload verdoppelt
+        free: Dict[Tuple[str, str], Account] = {}
+        for a in store:
+            if a.uid not in disk_ids: free.setdefault(merge.merge_key(a), a)
+        plan, matched, order = merge.MergePlan(), set(), []
+        for d in accs:
+            if not isinstance(d, dict): continue
+            rid = d.get("id")
+            if rid and base.get(rid) == d: order.append(rid); continue
+            try: acc = Account.from_dict(d)
+            except ValueError as e: self.log_msg(f"Vault: Account aus der Datei übersprungen: {e}", level="WARNING"); continue
+            if rid and base.get(rid) == acc.to_dict(): order.append(rid); continue   # nur ältere Schema-Form in der Datei
+            cur = store.get(rid)
+            if cur is None and (cur := free.pop(merge.merge_key(acc), None)) is not None:
+                matched.add(cur.uid); acc.uid = cur.uid
+                if base.get(cur.uid) == acc.to_dict(): order.append(cur.uid); continue   # ohne ID, aber unverändert
+            if cur is None: plan.added.append(acc); order.append(acc); continue
+            if cur != acc: plan.updated.append((cur, acc))
+            order.append(cur.uid)
+        removed = [a for a in (store.get(rid) for rid in base.keys() - disk_ids - matched) if a is not None]
+        with store.batch():
+            merge.apply_merge(store, plan)
+            if removed: store.remove(*removed)
+            store.reorder([o if isinstance(o, str) else o.uid for o in order])   # neue Accounts haben erst jetzt eine uid
+        if settings != self._persisted.get("settings"): self._apply_settings_dict(settings)
+        self._persisted = {"accounts": accs, "settings": settings}
+        self.persist.mark_dirty("accounts", "settings")   # lokale Änderungen neu schreiben (No-op, falls keine)
+        fields = {"duration_ms": round((time.perf_counter() - t0) * 1000)} if t0 is not None else {}
+        self.log_msg(f"Vault extern geändert: {len(plan.added)} neu, {len(plan.updated)} geändert, "
+                     f"{len(removed)} entfernt{self._vault_phases()}", event="vault_reload", **fields)
+
+    def _maybe_compact_vault(self):
+        """Journal des Vaults im Hintergrund zu einem neuen Snapshot zusammenfassen, wenn es zu lang wird."""
+        needs = getattr(self.vault, "needs_compaction", None)
+        if needs is None or not needs(): return
+        def failed(exc, tb): self.log_error("Vault-Kompaktierung fehlgeschlagen", exc, extra=tb)
+        self.tasks.submit("Vault kompaktieren", lambda t: self.vault.compact(), key="vault-compact", on_error=failed)
+
     # ----------- Vault → State laden (+ Settings) -----------
     def _load_from_vault(self):
         """Liest Accounts + Einstellungen aus dem geöffneten Vault in den State und loggt die Anzahl."""
@@ -474,36 +644,27 @@ class MainWindow(QMainWindow):
 
             # --- Accounts laden ---
             accs = data.get("accounts") or []
-            loaded = []
+            loaded, bad = [], []
             for d in accs:
-                try:
-                    if hasattr(Account, "from_dict"):
-                        a = Account.from_dict(d)  # type: ignore
-                    else:
-                        game_val = d.get('game', 'valorant')
-                        game = Game(game_val) if isinstance(game_val, str) else game_val
-                        queue_val = d.get('queue')
-                        queue = Queue(queue_val) if queue_val else None
-                        a = Account(
-                            alias=d.get('alias',''),
-                            game=game,
-                            region=d.get('region',''),
-                            riot_id=d.get('riot_id',''),
-                            queue=queue,
-                            tier=d.get('tier',''),
-                            rr=d.get('rr'),
-                            elo=d.get('elo'),
-                            kpxc_entry=d.get('kpxc_entry',''),
-                            notes=d.get('notes','')
-                        )
-                        if 'wins' in d: setattr(a, 'wins', d.get('wins'))
-                        if 'losses' in d: setattr(a, 'losses', d.get('losses'))
-                    loaded.append(a)
-                except Exception:
-                    continue
-            self.state.accounts = loaded
+                try: loaded.append(Account.from_dict(d))
+                except ValueError as e: bad.append(e)
+            if bad:
+                self.log_msg(f"{len(bad)} Accounts im Vault nicht lesbar und übersprungen (z. B. {bad[0]})", level="WARNING")
+            assigned = self.state.accounts.set_all(loaded)
+            migrated = sum(1 for d in accs if isinstance(d, dict) and d.get("v") != ACCOUNT_SCHEMA)
+            # Geladener Stand = Basis für die No-op-Erkennung; Ausstehendes betraf den alten Stand
+            self.persist.discard(); self._persist_gen += 1
+            # Baseline = serialisierter Store (mit vergebenen IDs), damit der Reload-Merge per uid zuordnen kann
+            serialized = [a.to_dict() for a in self.state.accounts]
+            self._persisted = {"accounts": serialized, "settings": data.get("settings") or {}}
             vpath = getattr(self.vault, "path", "unbekannt")
             self.log_msg(f"Vault geladen: {len(loaded)} Accounts (Datei: {vpath})")
+            if assigned or migrated:
+                # neue IDs/migrierte Records einmal zurückschreiben – sonst bekäme jede Sitzung andere uids
+                if hasattr(self.vault, "update_data"): self.vault.update_data({"accounts": serialized})
+                else: self.vault.data["accounts"] = serialized
+                self.persist.mark_dirty("vault")
+                self.log_msg(f"Vault: {assigned} Account-IDs vergeben, {migrated} Accounts migriert – wird gespeichert.")
         except Exception as e:
             self.log_error("Vault laden fehlgeschlagen", e)
             QMessageBox.warning(self, "Vault", f"Konnte Daten nicht laden:\n{e}")
@@ -512,34 +673,64 @@ class MainWindow(QMainWindow):
     def _build_main_page(self) -> QWidget:
         page = QWidget()
 
-        self.table_val = DraggableTable(0, 7, on_reordered=self._persist_order)
-        self.table_val.setHorizontalHeaderLabels(["Alias","Spiel","Region","Riot ID","Tier","RR","KeePassXC Entry"])
-
-        self.table_lol = DraggableTable(0, 7, on_reordered=self._persist_order)
-        self.table_lol.setHorizontalHeaderLabels(["Alias","Spiel","Region","Riot ID","Queue","Tier","KeePassXC Entry"])
+        self.model_val = AccountTableModel(self.state, [Game.valorant], VALORANT_COLUMNS, self)
+        self.model_lol = AccountTableModel(self.state, [Game.lol, Game.tft], LOL_COLUMNS, self)
+        self.proxy_val = AccountFilterProxy(self.model_val, self.search.accepts, self)
+        self.proxy_lol = AccountFilterProxy(self.model_lol, self.search.accepts, self)
+        self.table_val = AccountTableView(); self.table_val.setModel(self.proxy_val)
+        self.table_lol = AccountTableView(); self.table_lol.setModel(self.proxy_lol)
+        self._rank_delegate = RankIconDelegate(self._rank_pixmap, ICON_SIZE, self)
 
         for t in (self.table_val, self.table_lol):
+            t.reordered.connect(self._persist_order)
+            t.setItemDelegateForColumn(t.source_model().tier_column, self._rank_delegate)
             t.setIconSize(QSize(ICON_SIZE,ICON_SIZE))
             t.verticalHeader().setDefaultSectionSize(ROW_HEIGHT)
-            t.setEditTriggers(QAbstractItemView.NoEditTriggers)
-            t.setSelectionBehavior(QAbstractItemView.SelectRows)
             t.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Expanding)
             t.setVerticalScrollBarPolicy(Qt.ScrollBarAsNeeded)
             t.setHorizontalScrollBarPolicy(Qt.ScrollBarAsNeeded)
-            hdr = t.horizontalHeader(); hdr.setStretchLastSection(True)
-            for i in range(t.columnCount()):
-                hdr.setSectionResizeMode(i, QHeaderView.Stretch)
+            # Feste/Interaktive Breiten statt Stretch: kein Layout-Durchlauf über alle Zeilen beim Scrollen
+            hdr = t.horizontalHeader(); hdr.setSectionResizeMode(QHeaderView.Interactive)
+            hdr.setDefaultSectionSize(150); hdr.setStretchLastSection(True)
 
         self.tabs = QTabWidget()
         self.tabs.addTab(self.table_val, "Valorant")
         self.tabs.addTab(self.table_lol, "League of Legends / TFT")
 
+        # Suche: entprellt, filtert nur über die Proxies (Tabellen werden nicht neu aufgebaut)
+        self.search_edit = QLineEdit(); self.search_edit.setClearButtonEnabled(True)
+        self.search_edit.setPlaceholderText("Suchen …  z. B. gold region:euw tier>=plat stale:>1d")
+        self._search_hits = QLabel(""); self._search_hits.setStyleSheet("color:#bbb;")
+        self._search_timer = QTimer(self); self._search_timer.setSingleShot(True); self._search_timer.setInterval(SEARCH_DEBOUNCE_MS)
+        self._search_timer.timeout.connect(self._apply_search)
+        self.search_edit.textChanged.connect(self._search_timer.start)
+        self.search_edit.returnPressed.connect(self._apply_search)
+        QShortcut(QKeySequence.Find, self, activated=lambda: (self.search_edit.setFocus(), self.search_edit.selectAll()))
+        search_row = QHBoxLayout(); search_row.addWidget(self.search_edit, 1); search_row.addWidget(self._search_hits, 0)
+
         sidebar = self._build_iconmenu()
 
+        right = QVBoxLayout(); right.setContentsMargins(0,0,0,0)
+        right.addLayout(search_row); right.addWidget(self.tabs, 1)
         root=QHBoxLayout(page); root.setContentsMargins(8,8,8,8)
-        root.addWidget(sidebar, 0); root.addWidget(self.tabs, 1)
+        root.addWidget(sidebar, 0); root.addLayout(right, 1)
         return page
 
+    def _apply_search(self):
+        self._search_timer.stop()
+        text = self.search_edit.text()
+        try:
+            allowed = self.search.set_query(text)
+        except QueryError as e:
+            self.search_edit.setStyleSheet("color:#f88;"); self.search_edit.setToolTip(str(e))
+            return
+        self.search_edit.setStyleSheet(""); self.search_edit.setToolTip("")
+        self.proxy_val.refilter(); self.proxy_lol.refilter()
+        filtering = allowed is not None
+        for t in (self.table_val, self.table_lol):
+            t.setDragEnabled(not filtering)   # Umsortieren nur in der vollen Liste
+        self._search_hits.setText(f"{len(allowed)} / {len(self.state.accounts)}" if filtering else "")
+
     def _build_locked_page(self) -> QWidget:
         w = QWidget()
         w.setAutoFillBackground(True)
@@ -563,10 +754,13 @@ class MainWindow(QMainWindow):
         self._unlock_edit = QLineEdit(); self._unlock_edit.setEchoMode(QLineEdit.Password)
         self._unlock_edit.setPlaceholderText("Master-Passwort")
         self._unlock_edit.returnPressed.connect(self._unlock_clicked)
-        btn = QPushButton("Entsperren"); btn.clicked.connect(self._unlock_clicked)
+        self._unlock_btn = QPushButton("Entsperren"); self._unlock_btn.clicked.connect(self._unlock_clicked)
         self._unlock_msg = QLabel(""); self._unlock_msg.setStyleSheet("color:#f88;")
-        row.addWidget(self._unlock_edit, 3); row.addWidget(btn, 0)
+        row.addWidget(self._unlock_edit, 3); row.addWidget(self._unlock_btn, 0)
         v.addLayout(row)
+        self._unlock_busy = QProgressBar(); self._unlock_busy.setRange(0, 0)   # unbestimmt: KDF meldet keinen Fortschritt
+        self._unlock_busy.setTextVisible(False); self._unlock_busy.setFixedHeight(6); self._unlock_busy.hide()
+        v.addWidget(self._unlock_busy)
         v.addWidget(self._unlock_msg, 0, Qt.AlignHCenter)
         return w
 
@@ -580,8 +774,11 @@ class MainWindow(QMainWindow):
                 pass
 
     # -------------------- Linkes Menü --------------------
-    def _btn(self, icon: QIcon, text: str, handler) -> QToolButton:
-        btn = QToolButton(); btn.setText(text); btn.setIcon(icon); btn.setIconSize(QSize(LEFT_ICON_PX,LEFT_ICON_PX))
+    def _btn(self, icon: QIcon | str, text: str, handler) -> QToolButton:
+        """icon als Name ('add') → wird nach dem ersten Anzeigen nachgeladen (_load_sidebar_icons)."""
+        btn = QToolButton(); btn.setText(text); btn.setIconSize(QSize(LEFT_ICON_PX,LEFT_ICON_PX))
+        if isinstance(icon, str): self._pending_icons.append((btn, icon))
+        else: btn.setIcon(icon)
         btn.setToolButtonStyle(Qt.ToolButtonTextBesideIcon)
         btn.setCursor(Qt.PointingHandCursor); btn.setFixedHeight(36)
         btn.clicked.connect(handler); return btn
@@ -593,6 +790,8 @@ class MainWindow(QMainWindow):
         s = QFrame(); s.setFrameShape(QFrame.HLine); s.setFrameShadow(QFrame.Sunken); return s
 
     def _build_iconmenu(self) -> QWidget:
+        self._pending_icons: List[Tuple[QToolButton, str]] = []
+        QTimer.singleShot(0, self._load_sidebar_icons)
         w=QWidget(); lay=QVBoxLayout(w); lay.setContentsMargins(10,10,10,10); lay.setSpacing(8)
         w.setStyleSheet(
             "QToolButton{ color:#fff; background:transparent; padding:6px 10px; border-radius:8px; text-align:left;}"
@@ -603,9 +802,7 @@ class MainWindow(QMainWindow):
         logo_w, logo_h = 80, 80
         logo_lbl = QLabel(); logo_lbl.setAlignment(Qt.AlignCenter)
         logo_lbl.setFixedSize(80, 80); logo_lbl.setSizePolicy(QSizePolicy.Fixed, QSizePolicy.Fixed)
-        base_dir = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
-        logo_path = os.path.join(base_dir, "resources", "sidebar_logo.png")
-        pm = QPixmap(logo_path)
+        pm = resource_pixmap("sidebar_logo.png")
         canvas = QPixmap(logo_w, logo_h); canvas.fill(w.palette().color(QPalette.Window))
         if not pm.isNull():
             scaled = pm.scaled(logo_w, logo_h, Qt.KeepAspectRatio, Qt.SmoothTransformation)
@@ -617,109 +814,139 @@ class MainWindow(QMainWindow):
 
         # Buttons
         lay.addWidget(self._header("Accounts"))
-        lay.addWidget(self._btn(_load_menu_icon("add"), "Account hinzufügen", self.add_account))
-        lay.addWidget(self._btn(_load_menu_icon("edit"), "Bearbeiten", self.edit_account))
-        lay.addWidget(self._btn(_load_menu_icon("delete"), "Löschen", self.delete_account))
+        lay.addWidget(self._btn("add", "Account hinzufügen", self.add_account))
+        lay.addWidget(self._btn("edit", "Bearbeiten", self.edit_account))
+        lay.addWidget(self._btn("delete", "Löschen", self.delete_account))
         lay.addWidget(self._sep())
 
         lay.addWidget(self._header("Rankings"))
-        lay.addWidget(self._btn(_load_menu_icon("refresh"), "Ranks aktualisieren", self.refresh_selected))
-        lay.addWidget(self._btn(_load_menu_icon("refresh_all"), "Alle aktualisieren", self.refresh_all))
+        lay.addWidget(self._btn("refresh", "Ranks aktualisieren", self.refresh_selected))
+        lay.addWidget(self._btn("refresh_all", "Alle aktualisieren", self.refresh_all))
+        lay.addWidget(self._btn("sort", "Nach Rang sortieren", self.sort_by_rank))
         lay.addWidget(self._sep())
 
         lay.addWidget(self._header("Login"))
-        lay.addWidget(self._btn(_load_menu_icon("login"), "Login (ausgewählt)", self.login_selected))
+        lay.addWidget(self._btn("login", "Login (ausgewählt)", self.login_selected))
         lay.addWidget(self._sep())
 
         lay.addWidget(self._header("Vault & Daten"))
-        lay.addWidget(self._btn(_load_menu_icon("export"), "Export", self.export_vault))
-        lay.addWidget(self._btn(_load_menu_icon("import"), "Import", self.import_vault))
+        lay.addWidget(self._btn("export", "Export", self.export_vault))
+        lay.addWidget(self._btn("export", "Auswahl exportieren", self.export_selected))
+        lay.addWidget(self._btn("import", "Import", self.import_vault))
         lay.addWidget(self._sep())
 
         lay.addWidget(self._header("System"))
-        lay.addWidget(self._btn(_load_menu_icon("settings"), "Einstellungen", self.open_settings))
-        lay.addWidget(self._btn(_load_menu_icon("log"), "Log anzeigen", self.show_log))
-        lay.addWidget(self._btn(_load_menu_icon("lock"), "Lock", self.lock))
+        lay.addWidget(self._btn("settings", "Einstellungen", self.open_settings))
+        lay.addWidget(self._btn("log", "Log anzeigen", self.show_log))
+        lay.addWidget(self._btn("lock", "Lock", self.lock))
         lay.addStretch(1); w.setFixedWidth(260); return w
 
+    def _load_sidebar_icons(self):
+        """Menü-Icons nach dem ersten Event-Durchlauf setzen (Start/Entsperr-Prompt wartet nicht darauf)."""
+        pending, self._pending_icons = self._pending_icons, []
+        icons = icon_provider(FORCE_WHITE_TINT)   # cached je Name/Größe/DPR, Fallback über QApplication.style()
+        for btn, name in pending:
+            btn.setIcon(icons.icon(name, LEFT_ICON_PX))   # 1x + 2x
+
     # -------------------- Tabellen/State --------------------
-    def current_table(self) -> QTableWidget:
+    def current_table(self) -> AccountTableView:
         return self.table_val if self.tabs.currentIndex()==0 else self.table_lol
 
-    def _accounts_to_dicts(self):
-        out=[]
-        for a in self.state.accounts:
-            out.append({
-                "alias":a.alias, "game":a.game.value, "region":a.region, "riot_id":a.riot_id,
-                "queue":a.queue.value if a.queue else None, "tier":a.tier, "rr":a.rr,
-                "elo":a.elo, "kpxc_entry":a.kpxc_entry, "notes":a.notes,
-                "wins": getattr(a, "wins", None), "losses": getattr(a, "losses", None),
-            })
-        return out
-
-    def _table_for_account(self, acc: Account) -> QTableWidget:
-        return self.table_val if acc.game==Game.valorant else self.table_lol
+    # -------------------- Rank-Icons (Cache + Warm-up) --------------------
+    def _rank_icon_path(self, acc: Account) -> Optional[str]:
+        """Lokales Icon-Pack (Ressourcenname) oder Download-Cache (Pfad) – blockiert nie auf Netzwerk."""
+        if acc.game == Game.valorant:
+            override = _valorant_icon_name_for_tier(acc.rank)
+            if override:
+                return override
+        return cached_rank_icon(acc.game.value, acc.tier, self.settings)
+
+    def _rank_pixmap(self, acc: Account) -> Optional[QPixmap]:
+        """
+        Vorskaliertes Rank-Icon (vom Delegate pro Paint aufgerufen): Cache je (game, tier), auch für fehlende
+        Icons – Pfad-Auflösung/Dateizugriffe nur beim ersten Paint; _icons_warmed verwirft nachgeladene Paare.
+        """
+        if not acc.tier:
+            return None
+        key = (acc.game.value, acc.tier)
+        if key in self._icon_cache:
+            return self._icon_cache[key]
+        try:
+            path = self._rank_icon_path(acc)
+        except Exception as e:
+            self.log_error(f"Icon-Resolve-Fehler ({acc.game.value}) für Tier '{acc.tier}'", e)
+            path = None
+        pm = None
+        if path:
+            pm = QPixmap(path) if os.path.isabs(path) else resource_pixmap(path)
+            if not pm.isNull():
+                dpr = self.devicePixelRatioF()
+                pm = pm.scaled(int(ICON_SIZE*dpr), int(ICON_SIZE*dpr), Qt.KeepAspectRatio, Qt.SmoothTransformation)
+                pm.setDevicePixelRatio(dpr)
+            else: pm = None
+        self._icon_cache[key] = pm
+        if pm is None and path is None:
+            # Noch nicht im Cache → im Hintergrund nachladen, Zelle wird danach aktualisiert
+            self._warmup_icons([acc])
+        return pm
 
-    def _add_row(self, table: QTableWidget, acc: Account):
-        if table is self.table_val:
-            cols=[acc.alias,acc.game.value,acc.region,acc.riot_id,acc.tier, "" if acc.rr is None else str(acc.rr), acc.kpxc_entry]
-            row=table.rowCount(); table.insertRow(row)
-            for c, text in enumerate(cols):
-                item=QTableWidgetItem(text)
-                if c==4:
-                    try:
-                        base_dir = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
-                        override = _valorant_icon_path_for_tier(base_dir, acc.tier)
-                        icon_path = override or get_rank_icon(acc.game.value, acc.tier, self.settings)
-                        if icon_path and os.path.exists(icon_path):
-                            pm = QPixmap(icon_path)
-                            if not pm.isNull():
-                                item.setIcon(QIcon(pm))
-                    except Exception as e:
-                        self.log_error(f"Icon-Resolve-Fehler (Valorant) für Tier '{acc.tier}'", e)
-                item.setData(USER_ROLE_KEY, _row_key(acc)); table.setItem(row,c,item)
-        else:
-            row=table.rowCount(); table.insertRow(row)
-            cols=[acc.alias,acc.game.value,acc.region,acc.riot_id,acc.queue.value if acc.queue else "",acc.tier,acc.kpxc_entry]
-            for c, text in enumerate(cols):
-                item=QTableWidgetItem(text)
-                if c==5:
-                    try:
-                        icon_path=get_rank_icon(acc.game.value, acc.tier, self.settings)
-                        if icon_path and os.path.exists(icon_path):
-                            item.setIcon(QIcon(icon_path))
-                    except Exception as e:
-                        self.log_error(f"Icon-Resolve-Fehler (LoL/TFT) für Tier '{acc.tier}'", e)
-                item.setData(USER_ROLE_KEY, _row_key(acc)); table.setItem(row,c,item)
+    def _warmup_icons(self, accounts: Optional[List[Account]] = None):
+        """Ermittelt fehlende (game, tier)-Paare und lädt sie parallel im Hintergrund."""
+        pairs: Set[Tuple[str, str]] = set(); seen: Set[Tuple[str, str]] = set()
+        for acc in (self.state.accounts if accounts is None else accounts):
+            pair = (acc.game.value, acc.tier)
+            if not acc.tier or pair in seen or pair in self._icons_pending:
+                continue
+            seen.add(pair)   # jedes Paar nur einmal prüfen (stat/makedirs), nicht einmal je Account
+            if accounts is not None and pair in self._icons_failed:
+                continue  # Einzel-Nachladen nicht endlos wiederholen; Unlock-Warm-up versucht es erneut
+            try:
+                if self._rank_icon_path(acc):
+                    continue
+            except Exception:
+                pass
+            pairs.add(pair)
+        if not pairs:
+            return
+        self._icons_pending |= pairs
+        self.log_msg(f"Icons: lade {len(pairs)} fehlende Rank-Icons im Hintergrund ...")
+        settings = self.settings
+        self.tasks.submit("Rank-Icons laden", lambda t: prefetch_rank_icons(pairs, settings),
+                          on_done=self._icons_warmed,
+                          on_error=lambda e, tb: self._icons_warmed({p: None for p in pairs}))
+
+    def _icons_warmed(self, result: dict):
+        self._icons_pending -= set(result)
+        loaded = {pair for pair, path in result.items() if path}
+        self._icons_failed = (self._icons_failed - loaded) | (set(result) - loaded)
+        for pair in loaded: self._icon_cache.pop(pair, None)   # negativen Eintrag verwerfen, nächster Paint lädt
+        if len(loaded) < len(result):
+            self.log_msg(f"Icons: {len(result) - len(loaded)} Rank-Icons nicht verfügbar.", level="WARNING")
+        if not loaded or self.is_locked:
+            return
+        self.model_val.rank_icons_changed(loaded); self.model_lol.rank_icons_changed(loaded)
 
     def _selected_key(self) -> Optional[str]:
         table = self.current_table(); sel = table.selectionModel().selectedRows()
         if not sel: return None
-        row = sel[0].row(); item = table.item(row,0)
-        return item.data(USER_ROLE_KEY) if item else None
+        return sel[0].data(KEY_ROLE)
+
+    def _selected_accounts(self) -> List[Account]:
+        """Ausgewählte Accounts beider Tabellen (aktiver Tab zuerst, jeweils in Tabellen-Reihenfolge)."""
+        tables = [self.current_table()] + [t for t in (self.table_val, self.table_lol) if t is not self.current_table()]
+        out: List[Account] = []
+        for t in tables:
+            for ix in sorted(t.selectionModel().selectedRows(), key=lambda i: i.row()):
+                acc = self._account_by_key(ix.data(KEY_ROLE))
+                if acc is not None: out.append(acc)
+        return out
 
     def _account_by_key(self, key: str) -> Optional[Account]:
-        for a in self.state.accounts:
-            if _row_key(a)==key: return a
-        return None
-
-    def _table_order(self, table: QTableWidget) -> List[str]:
-        keys = []
-        for r in range(table.rowCount()):
-            it = table.item(r,0)
-            if it: keys.append(it.data(USER_ROLE_KEY))
-        return keys
+        return self.state.accounts.get(key)
 
     def _persist_order(self, *_args):
-        map_acc: Dict[str,Account] = { _row_key(a): a for a in self.state.accounts }
-        ordered = []
-        for k in self._table_order(self.table_val):
-            if k in map_acc: ordered.append(map_acc[k])
-        for k in self._table_order(self.table_lol):
-            if k in map_acc: ordered.append(map_acc[k])
-        for a in self.state.accounts:
-            if a not in ordered: ordered.append(a)
-        self.state.accounts = ordered
+        # Rest (Accounts ohne Tabelle) hängt reorder() selbst hinten an
+        self.state.accounts.reorder(a.uid for a in self.model_val.accounts() + self.model_lol.accounts())
         self._persist_accounts()
 
     def reload_tables(self):
@@ -728,92 +955,142 @@ class MainWindow(QMainWindow):
                 return
         except Exception:
             pass
-        self.table_val.setRowCount(0); self.table_lol.setRowCount(0)
-        for acc in self.state.accounts:
-            t = self._table_for_account(acc); self._add_row(t, acc)
+        self.model_val.reset(); self.model_lol.reset()
 
     # -------------------- Aktionen --------------------
+    @property
+    def log(self):
+        if self._log_dialog is None:
+            from .log_dialog import LogDialog
+            self._log_dialog = LogDialog(self, self.log_buffer)
+        return self._log_dialog
+
     def show_log(self):
         self.log.show(); self.log.raise_(); self.log.activateWindow()
 
     def add_account(self):
+        from .add_edit_dialog import AddEditDialog
         dlg=AddEditDialog(self)
         if dlg.exec()==QDialog.Accepted:
             acc=dlg.get_account()
             if acc:
-                self.state.accounts.append(acc)
-                if self._persist_accounts():
-                    self._add_row(self._table_for_account(acc), acc)
+                self.state.accounts.add(acc)
+                self._persist_accounts()
 
     def edit_account(self):
         key=self._selected_key()
         if not key: return
         acc=self._account_by_key(key)
         if not acc: return
+        from .add_edit_dialog import AddEditDialog
         dlg=AddEditDialog(self, acc)
         if dlg.exec()==QDialog.Accepted:
             new_acc=dlg.get_account()
             if new_acc:
-                idx = self.state.accounts.index(acc)
-                self.state.accounts[idx]=new_acc
-                if self._persist_accounts():
-                    self.reload_tables()
+                self.state.accounts.update(acc, new_acc)
+                self._persist_accounts()
 
     def delete_account(self):
-        key=self._selected_key()
-        if not key: return
-        acc=self._account_by_key(key)
-        if not acc: return
-        if QMessageBox.question(self,"Löschen","Account wirklich löschen?")==QMessageBox.Yes:
-            self.state.accounts.remove(acc)
-            if self._persist_accounts():
-                self.reload_tables()
-
-    def _update_rank(self, acc: Account)->tuple[bool,str]:
-        try:
-            if acc.game==Game.valorant:
-                tier, rr, *_ = fetch_valorant_rank(acc.riot_id, acc.region, self.settings)
-                acc.tier, acc.rr, acc.elo = tier or "", rr, None
-            else:
-                tier, lp = fetch_lol_tft_rank(acc, self.settings); acc.tier, acc.elo, acc.rr = tier, lp, None
-            return True, "OK"
-        except Exception as e:
-            return False, str(e)
+        accs=self._selected_accounts()
+        if not accs: return
+        if len(accs)==1:
+            question="Account wirklich löschen?"
+        else:
+            names=", ".join(a.alias for a in accs[:10]) + (f" … (+{len(accs)-10})" if len(accs)>10 else "")
+            question=f"{len(accs)} Accounts wirklich löschen?\n\n{names}"
+        if QMessageBox.question(self,"Löschen",question)==QMessageBox.Yes:
+            self.state.accounts.remove(*accs)   # ein Event, ein Speichern
+            self._persist_accounts()
+
+    def _start_rank_refresh(self, accounts: List[Account], title: str, show_errors: bool) -> Optional[Task]:
+        """
+        Ruft Ranks im Hintergrund ab (Snapshots, bis zu RANK_FETCH_WORKERS parallel). Jedes Ergebnis
+        wird sofort im GUI-Thread übernommen (Zeile aktualisiert sich); gespeichert wird einmal am Ende.
+        """
+        if self.tasks.running("ranks"):
+            QMessageBox.information(self,"Hinweis","Rank-Aktualisierung läuft bereits."); return None
+        settings = self.settings
+        jobs = [(a.uid, replace(a)) for a in accounts]   # Worker liest nie aus den Live-Objekten
+
+        def fetch(task: Task, snap: Account):
+            if task.cancelled: return None
+            task.log(f"Aktualisiere: {snap.alias} ({snap.game.value}) ...")
+            t0 = time.perf_counter(); values = _fetch_rank(snap, settings)
+            return values, round((time.perf_counter() - t0) * 1000)
+
+        def work(task: Task) -> int:
+            errors = 0
+            with ThreadPoolExecutor(max_workers=max(1, min(RANK_FETCH_WORKERS, len(jobs))), thread_name_prefix="rank") as ex:
+                futs = {ex.submit(fetch, task, snap): (uid, snap) for uid, snap in jobs}
+                for i, fut in enumerate(as_completed(futs), start=1):
+                    uid, snap = futs[fut]
+                    try:
+                        res = fut.result()
+                        if res is not None: task.partial((uid, res, None))
+                    except Exception as e:
+                        errors += 1; task.partial((uid, None, e))
+                    task.progress(i, len(jobs), f"{snap.alias} ({snap.game.value})")
+                    if task.cancelled:
+                        ex.shutdown(wait=True, cancel_futures=True); break
+            return errors
+
+        def apply(item):
+            uid, res, err = item
+            acc = self.state.accounts.get(uid)
+            if acc is None:
+                return   # inzwischen gelöscht
+            if err is not None:
+                self.log_error(f"Rank-Update fehlgeschlagen für {acc.alias} ({acc.game.value})", err,
+                               event="rank_refresh", account=uid)
+                if show_errors: QMessageBox.critical(self,"Rank-Update fehlgeschlagen",str(err))
+                return
+            values, dt_ms = res
+            old = acc.rank
+            acc.tier, acc.rr, acc.elo = values; acc.rank_updated = time.time()
+            self.state.accounts.touch(acc)   # Zeile sofort aktualisieren, nicht erst am Ende
+            self.log_msg(f" → Erfolg: {acc.alias}: {_rank_change_text(old, acc.rank)}",
+                         event="rank_refresh", account=uid, duration_ms=dt_ms)
+
+        prog = None
+        if len(jobs) > 1:
+            prog = QProgressDialog("Aktualisiere Ranks...","Abbrechen",0,len(jobs),self)
+            prog.setWindowTitle(title); prog.setMinimumDuration(0); prog.setAutoClose(False); prog.setValue(0)
+
+        def progress(done: int, total: int, text: str):
+            if prog is not None: prog.setValue(done); prog.setLabelText(text)
+
+        def finish(errors=None):
+            if prog is not None: prog.close(); prog.deleteLater()
+            if errors: self.log_msg(f"{title}: {errors} von {len(jobs)} Abrufen fehlgeschlagen.", level="WARNING")
+            self._persist_accounts()
+
+        def failed(exc, tb):
+            self.log_error("Rank-Aktualisierung abgebrochen", exc, extra=tb); finish(None)
+
+        task = self.tasks.submit(title, work, key="ranks", on_done=finish, on_error=failed,
+                                 on_progress=progress, on_partial=apply)
+        if prog is not None and task is not None:
+            prog.canceled.connect(task.cancel)
+        return task
 
     def refresh_selected(self):
-        key=self._selected_key()
-        if not key:
+        accs=self._selected_accounts()
+        if not accs:
             QMessageBox.warning(self,"Hinweis","Bitte einen Account auswählen."); return
-        acc=self._account_by_key(key)
-        if not acc:
-            QMessageBox.critical(self,"Fehler","Konnte Account nicht finden."); return
-        self.log_msg(f"Aktualisiere: {acc.alias} ({acc.game.value}) ...")
-        ok,msg=self._update_rank(acc)
-        if ok:
-            self.log_msg(" → Erfolg")
-            if self._persist_accounts():
-                self.reload_tables()
-        else:
-            self.log_error(f"Rank-Update fehlgeschlagen für {acc.alias} ({acc.game.value})", Exception(msg))
-            QMessageBox.critical(self,"Rank-Update fehlgeschlagen",msg)
+        self._start_rank_refresh(accs, "Ranks aktualisieren", show_errors=len(accs)==1)
 
     def refresh_all(self):
         if not self.state.accounts:
             QMessageBox.information(self,"Hinweis","Keine Accounts vorhanden.")
             return
-        prog=QProgressDialog("Aktualisiere Ranks...","Abbrechen",0,len(self.state.accounts),self)
-        prog.setWindowTitle("Alle aktualisieren"); prog.setMinimumDuration(0)
-        for i, acc in enumerate(self.state.accounts, start=1):
-            if prog.wasCanceled(): break
-            prog.setValue(i-1); prog.setLabelText(f"{acc.alias} ({acc.game.value})")
-            self.log_msg(f"Aktualisiere: {acc.alias} ({acc.game.value}) ...")
-            ok,msg=self._update_rank(acc)
-            if ok: self.log_msg(" → Erfolg")
-            else:
-                self.log_error(f" → Fehler bei {acc.alias} ({acc.game.value})", Exception(msg))
-        prog.setValue(len(self.state.accounts))
+        self._start_rank_refresh(list(self.state.accounts), "Alle aktualisieren", show_errors=False)
+
+    def sort_by_rank(self):
+        """Sortiert beide Tabellen absteigend nach Rang (Ordinal); gleiche Ränge behalten ihre Reihenfolge."""
+        if not self.state.accounts:
+            return
+        self.state.accounts.reorder(a.uid for a in sorted(self.state.accounts, key=lambda a: -a.rank.ordinal))
         self._persist_accounts()
-        self.reload_tables()
 
     def login_selected(self):
         key=self._selected_key()
@@ -822,42 +1099,27 @@ class MainWindow(QMainWindow):
         acc=self._account_by_key(key)
         if not acc: return
 
-        # Riot Client sicher starten (nur Client, kein Spiel)
-        if self.settings.riot_client_path:
-            start_riot(self.settings.riot_client_path, acc.game.value, log=self.log_msg)
-        focus_riot_login_window(log=self.log_msg)
-
-        # Username-Feld fokussieren/prüfen
-        try:
-            ok_focus = focus_username_field(log=self.log_msg)
-        except Exception as e:
-            ok_focus = False
-            self.log_error("focus_username_field() schlug fehl", e)
-        if not ok_focus:
-            self.log_msg("Hinweis: Benutzername-Feld konnte nicht eindeutig fokussiert werden. "
-                         "Falls Auto-Type nicht greift, klicke in das Feld und wiederhole den Login.")
-
-        # KeePassXC Auto-Type
-        try:
-            if acc.kpxc_entry and acc.kpxc_entry.strip():
-                self.log_msg(f"KeePassXC: gezielter Auto-Type für Eintrag: {acc.kpxc_entry}")
-                autotype_entry(self.settings.auto_type_hotkey, acc.kpxc_entry.strip())
-            else:
-                self.log_msg("KeePassXC: globaler Auto-Type")
-                trigger_autotype(self.settings.auto_type_hotkey)
-        except Exception as e:
-            self.log_error("KeePassXC Auto-Type fehlgeschlagen", e)
-            QMessageBox.critical(self,"KeePassXC",f"Auto-Type fehlgeschlagen:\n{e}")
-            return
+        def failed(exc, tb):
+            self.log_error("Login fehlgeschlagen", exc, extra=tb)
+            QMessageBox.critical(self,"Login",str(exc))
 
-        # Sicherheit: nur Login-Phase, kein Spielstart
-        try:
-            ensure_login_only(duration=8.0, kill=True, log=self.log_msg)
-        except Exception as e:
-            self.log_error("ensure_login_only() Fehlermeldung", e)
+        snap, settings = replace(acc), self.settings
+        if self.tasks.submit(f"Login {acc.alias}", lambda t: _login_flow(t, snap, settings),
+                             key="login", on_error=failed) is None:
+            QMessageBox.information(self,"Hinweis","Ein Login läuft bereits.")
 
     # ---------- Lock / Unlock ----------
     def lock(self):
+        if not self.persist.flush():   # ausstehende Änderungen vor dem Sperren schreiben
+            if QMessageBox.question(self, "Lock",
+                    "Ungespeicherte Änderungen konnten nicht geschrieben werden (Details im Log).\n\n"
+                    "Trotzdem sperren? Die Änderungen werden nach dem nächsten Entsperren erneut übernommen "
+                    "und gespeichert.") != QMessageBox.Yes:
+                return
+            self._carried = self._local_changes()
+        self._persisted = {}; self._persist_gen += 1
+        self._watch_vault(False); self._vault_reload_timer.stop(); self.persist.discard()
+        self._reload_pending = False; self._reload_failed_sig = None; self._release_reload_waiters()
         try:
             if hasattr(self.vault, "lock"):
                 self.vault.lock()
@@ -873,16 +1135,24 @@ class MainWindow(QMainWindow):
             self._unlock_msg.setText("Bitte ein Passwort eingeben.")
             return
 
-        ok, err = self._vault_try_unlock(pwd)
+        if self.tasks.submit("Vault entsperren", lambda t: self._vault_try_unlock(pwd), key="vault",
+                             on_done=self._unlock_finished, on_error=self._vault_task_failed):
+            self._unlock_t0 = time.perf_counter()
+            self._set_unlock_busy(True, "Entsperre ...")
+
+    def _set_unlock_busy(self, busy: bool, text: str = ""):
+        self._unlock_edit.setEnabled(not busy); self._unlock_btn.setEnabled(not busy)
+        self._unlock_busy.setVisible(busy); self._unlock_msg.setText(text)
+        if not busy: self._unlock_edit.setFocus()
+
+    def _unlock_finished(self, result: tuple[bool, str | None]):
+        ok, err = result
+        self._set_unlock_busy(False)
+        dt_ms = round((time.perf_counter() - self._unlock_t0) * 1000)
         if ok:
-            try:
-                self._load_from_vault()
-            except Exception as e:
-                self.log_error("Unlock: Laden aus Vault fehlgeschlagen", e)
-            self._unlock_msg.setText("")
+            self.log_msg(f"Vault entsperrt{self._vault_phases()}", event="vault_unlock", duration_ms=dt_ms)
             self._unlock_edit.setText("")
-            self._show_locked_page(False)
-            self.reload_tables()
+            self._vault_opened()
             return
 
         vpath = getattr(self.vault, "path", "unbekannt")
@@ -893,24 +1163,69 @@ class MainWindow(QMainWindow):
         )
         self.log_msg(f"Unlock fehlgeschlagen{hint}: {err or ''}", level="WARNING")
 
+    def _vault_opened(self):
+        try:
+            self._load_from_vault()
+        except Exception as e:
+            self.log_error("Unlock: Laden aus Vault fehlgeschlagen", e)
+        self._show_locked_page(False)
+        if self._carried: self._apply_carried()
+        self._warmup_icons()
+        self.reload_tables()
+        self._watch_vault()
+        if getattr(self.vault, "rekey_pending", False):
+            self.log_msg(f"KDF-Vorgabe verlangt andere bzw. stärkere Parameter – Vault wird neu verschlüsselt "
+                         f"({self.vault.kdf} → {self.vault.pending_kdf}).")
+            self._maybe_compact_vault()
+
+    def _local_changes(self) -> Optional[Dict[str, object]]:
+        """Noch nicht geschriebene Änderungen gegenüber der Baseline (geänderte/neue Accounts, gelöschte IDs, Einstellungen)."""
+        base = {d.get("id"): d for d in self._persisted.get("accounts") or [] if isinstance(d, dict)}
+        accs = [d for d in (a.to_dict() for a in self.state.accounts) if base.get(d["id"]) != d]
+        removed = [rid for rid in base.keys() - set(self.state.accounts.ids()) if rid]
+        settings = self._settings_to_dict()
+        if settings == self._persisted.get("settings"): settings = None
+        return {"accounts": accs, "removed": removed, "settings": settings} if accs or removed or settings else None
+
+    def _apply_carried(self):
+        """Beim Sperren übernommene Änderungen auf den frisch geladenen Stand anwenden (lokal gewinnt) und speichern."""
+        carried, self._carried = self._carried, None
+        store, plan = self.state.accounts, merge.MergePlan()
+        for d in carried["accounts"]:
+            try: acc = Account.from_dict(d)
+            except ValueError: continue
+            cur = store.get(acc.uid)
+            if cur is None: plan.added.append(acc)
+            else: plan.updated.append((cur, acc))
+        removed = [a for a in (store.get(rid) for rid in carried["removed"]) if a is not None]
+        with store.batch():
+            merge.apply_merge(store, plan)
+            if removed: store.remove(*removed)
+        if carried["settings"] is not None: self._apply_settings_dict(carried["settings"])
+        self.persist.mark_dirty("accounts", "settings")
+        self.log_msg(f"Ungespeicherte Änderungen vom Sperren übernommen: {len(plan.added)} neu, {len(plan.updated)} geändert, "
+                     f"{len(removed)} entfernt" + (", Einstellungen" if carried["settings"] is not None else ""))
+
+    def _tasks_busy(self, names: List[str]):
+        if names: self.statusBar().showMessage("Läuft: " + ", ".join(names))
+        else: self.statusBar().clearMessage()
+
     def open_settings(self):
+        from .settings_dialog import SettingsDialog
         dlg = SettingsDialog(self, self.settings, self.vault)
         if dlg.exec() == QDialog.Accepted:
             # 1) UI -> Objekt
             self.settings = dlg.get_settings()
-            # 2) Objekt -> Vault
+            # 2) Objekt -> Vault (sofort; unveränderte Einstellungen werden nicht neu verschlüsselt)
+            self.persist.mark_dirty("settings")
             try:
-                self._ensure_vault_dict()
-                self.vault.data["settings"] = self._settings_to_dict()
-                ok, err = self._save_vault()
-                if not ok:
-                    raise RuntimeError(err or "Unbekannter Fehler beim Speichern.")
-                QMessageBox.information(self, "Gespeichert", "Einstellungen gespeichert.")
-                try: self.log_msg("Einstellungen gespeichert.")
-                except Exception: pass
+                ok = self.persist.flush()   # Fehler meldet _write_dirty selbst
             except Exception as e:
                 self.log_error("Einstellungen speichern fehlgeschlagen", e)
-                QMessageBox.critical(self, "Speichern fehlgeschlagen", str(e))
+                QMessageBox.critical(self, "Speichern fehlgeschlagen", str(e)); return
+            if ok:
+                QMessageBox.information(self, "Gespeichert", "Einstellungen gespeichert.")
+            self._maybe_compact_vault()   # geänderte KDF-Vorgabe landet mit dem nächsten Snapshot im Meta
 
     def export_vault(self):
         path,_=QFileDialog.getSaveFileName(self,"Vault exportieren","vault.dat","Vault (*.dat);;Alle Dateien (*)")
@@ -922,43 +1237,93 @@ class MainWindow(QMainWindow):
             self.log_error("Vault-Export fehlgeschlagen", e)
             QMessageBox.critical(self,"Export fehlgeschlagen", str(e))
 
+    def export_selected(self):
+        """Exportiert die ausgewählten Accounts in ein neues, eigenes verschlüsseltes Vault."""
+        accs=self._selected_accounts()
+        if not accs:
+            QMessageBox.warning(self,"Hinweis","Bitte Accounts auswählen."); return
+        path,_=QFileDialog.getSaveFileName(self,f"{len(accs)} Accounts exportieren","auswahl.dat","Vault (*.dat);;Alle Dateien (*)")
+        if not path: return
+        if os.path.abspath(path)==os.path.abspath(self.vault.path):
+            QMessageBox.warning(self,"Export","Das aktuelle Vault kann nicht überschrieben werden."); return
+        pwd=self._prompt_new_password("Export-Vault")
+        if not pwd: return
+        dicts=[a.to_dict() for a in accs]
+
+        def work(task: Task) -> int:
+            tmp = path + ".tmp"
+            if os.path.exists(tmp): os.remove(tmp)
+            out = Vault(tmp); out.create(pwd)   # KDF + Verschlüsselung im Worker
+            out.replace_accounts(dicts); out.save()
+            os.replace(tmp, path)
+            return len(dicts)
+
+        def done(n: int):
+            self.log_msg(f"Export: {n} Accounts → {path}")
+            QMessageBox.information(self,"Export",f"{n} Accounts exportiert.")
+
+        def failed(exc, tb):
+            self.log_error("Export der Auswahl fehlgeschlagen", exc, extra=tb)
+            QMessageBox.critical(self,"Export fehlgeschlagen", str(exc))
+
+        if self.tasks.submit("Auswahl exportieren", work, key="export", on_done=done, on_error=failed) is None:
+            QMessageBox.information(self,"Hinweis","Ein Export läuft bereits.")
+
     def import_vault(self):
+        """Fremdes Vault im laufenden Betrieb öffnen und seine Accounts per stabilem Schlüssel einmischen."""
+        if not self._ensure_vault_open(): return
         path,_=QFileDialog.getOpenFileName(self,"Vault importieren","","Vault (*.dat);;Alle Dateien (*)")
         if not path: return
-        try:
-            shutil.copy2(path, self.vault.path)
-            QMessageBox.information(self,"Import","Vault importiert. Bitte App neu starten.")
-        except Exception as e:
-            self.log_error("Vault-Import fehlgeschlagen", e)
-            QMessageBox.critical(self,"Import fehlgeschlagen", str(e))
+        if os.path.abspath(path)==os.path.abspath(self.vault.path):
+            QMessageBox.warning(self,"Import","Das aktuelle Vault kann nicht in sich selbst importiert werden."); return
+        pwd, ok = QInputDialog.getText(self, "Vault importieren", f"Passwort für {os.path.basename(path)}:", QLineEdit.Password)
+        if not ok or not pwd: return
+        labels = list(merge.POLICIES.values())
+        label, ok = QInputDialog.getItem(self, "Vault importieren", "Bei Konflikten (gleicher Account, andere Daten):", labels, 0, False)
+        if not ok: return
+        policy = next(k for k, v in merge.POLICIES.items() if v == label)
+
+        def work(task: Task) -> list:
+            src = Vault(path); src.open(pwd, rekey=False)   # KDF + Entschlüsselung im Worker
+            try: return src.get_accounts()
+            finally: src.lock()
+
+        def done(dicts: list):
+            incoming, bad = [], 0
+            for d in dicts:
+                try: incoming.append(Account.from_dict(d))
+                except ValueError: bad += 1
+            if bad: self.log_msg(f"Import: {bad} Accounts nicht lesbar und übersprungen", level="WARNING")
+            plan = merge.plan_merge(self.state.accounts, incoming, policy)
+            if plan.added or plan.updated:
+                merge.apply_merge(self.state.accounts, plan)
+                if self._persist_accounts(): self.persist.flush()   # Ergebnis in einem Save
+            self.log_msg(f"Import {os.path.basename(path)} ({label}): {plan.summary()}")
+            QMessageBox.information(self,"Import",f"Import abgeschlossen:\n{plan.summary()}.")
+
+        def failed(exc, tb):
+            self.log_error("Vault-Import fehlgeschlagen", exc, extra=tb)
+            QMessageBox.critical(self,"Import fehlgeschlagen", str(exc))
+
+        if self.tasks.submit("Vault importieren", work, key="import", on_done=done, on_error=failed) is None:
+            QMessageBox.information(self,"Hinweis","Ein Import läuft bereits.")
 
     def closeEvent(self, e):
-        # Failsafe: Settings persistieren
+        # Ausstehende Änderungen schreiben; Settings nur, wenn sie sich seit dem Laden geändert haben
         try:
-            self._ensure_vault_dict()
-            self.vault.data["settings"] = self._settings_to_dict()
-            ok, _ = self._save_vault()
-            if not ok:
+            if self._vault_is_open(): self.persist.mark_dirty("settings")
+            if not self.persist.flush():
                 self.log_msg("Warnung: Speichern beim Beenden nicht bestätigt.", level="WARNING")
+                if QMessageBox.question(self, "Beenden",
+                        "Ungespeicherte Änderungen konnten nicht geschrieben werden (Details im Log).\n\n"
+                        "Trotzdem beenden? Die Änderungen gehen dabei verloren.") != QMessageBox.Yes:
+                    e.ignore(); return
             else:
                 self.log_msg("Anwendung wird beendet – Daten persistiert.")
         except Exception as ex:
             self.log_error("Speichern beim Beenden fehlgeschlagen", ex)
+        # Laufende Hintergrund-Tasks abbrechen und kurz auf sie warten (Login-Absicherung ggf. bis zu ~8 s)
+        self.tasks.cancel_all()
+        if not self.tasks.wait(10_000):
+            self.log_msg("Warnung: Hintergrund-Tasks laufen beim Beenden noch.", level="WARNING")
         super().closeEvent(e)
-
-
-class DraggableTable(QTableWidget):
-    def __init__(self, *a, on_reordered=None, **kw):
-        super().__init__(*a, **kw)
-        self.on_reordered = on_reordered
-        self.setDragEnabled(True)
-        self.setAcceptDrops(True)
-        self.setDragDropOverwriteMode(False)
-        self.setDropIndicatorShown(True)
-        self.setSelectionBehavior(QAbstractItemView.SelectRows)
-        self.setDragDropMode(QAbstractItemView.InternalMove)
-
-    def dropEvent(self, event):
-        super().dropEvent(event)
-        if self.on_reordered:
-            self.on_reordered(self)
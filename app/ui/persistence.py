@@ -0,0 +1,85 @@
+"""Write-behind-Persistenz: Änderungen markieren Bereiche als dirty, geschrieben wird gebündelt nach kurzer Ruhe."""
+from __future__ import annotations
+import time
+from typing import Callable, FrozenSet, Optional, Set
+from PySide6.QtCore import QObject, QTimer, Signal
+
+class WriteBehind(QObject):
+    """
+    Sammelt Änderungen ("accounts", "settings", …) und ruft write(sections, done) erst, wenn delay_ms
+    lang nichts mehr markiert wurde – spätestens aber max_delay_ms nach der ersten Änderung (Dauer-Drag
+    o. Ä. verschiebt das Speichern nicht endlos). Per Timer ist done ein Callback: write darf dann None liefern
+    (Speichern läuft als Task) und ruft done(ok) später im GUI-Thread. flush() schreibt sofort und synchron
+    (done=None; Lock, Beenden, Dialoge) und übernimmt dabei auch die Bereiche eines laufenden Hintergrund-Saves.
+    Schlägt ein Schreiben fehl, bleiben die Bereiche dirty.
+    """
+    flushed = Signal(bool)   # Ergebnis jedes echten Schreibversuchs
+
+    def __init__(self, write: Callable[[Set[str], Optional[Callable[[bool], None]]], Optional[bool]], parent=None, *,
+                 delay_ms: int = 800, max_delay_ms: int = 5000):
+        super().__init__(parent)
+        self._write = write; self.delay_ms = delay_ms; self.max_delay_ms = max_delay_ms
+        self._dirty: Set[str] = set()
+        self._inflight: Set[str] = set()      # Bereiche eines laufenden Hintergrund-Saves
+        self._first: Optional[float] = None   # Zeitpunkt der ältesten ungespeicherten Änderung
+        self._epoch = 0                       # überholt verspätete done()-Aufrufe nach flush()/discard()
+        self._writing = False
+        self._timer = QTimer(self); self._timer.setSingleShot(True); self._timer.timeout.connect(self._flush_background)
+
+    @property
+    def dirty(self) -> FrozenSet[str]: return frozenset(self._dirty)
+    @property
+    def busy(self) -> bool: return bool(self._inflight)
+    @property
+    def epoch(self) -> int: return self._epoch   # ändert sich, wenn flush()/discard() einen Hintergrund-Save überholt
+
+    def mark_dirty(self, *sections: str):
+        self._dirty.update(sections)
+        now = time.monotonic()
+        if self._first is None: self._first = now
+        left_ms = self.max_delay_ms - (now - self._first) * 1000
+        self._timer.start(max(0, int(min(self.delay_ms, left_ms))))
+
+    def discard(self):
+        """Verwirft ausstehende Änderungen (z. B. nachdem das Vault neu geladen wurde)."""
+        self._timer.stop(); self._dirty.clear(); self._inflight.clear(); self._first = None; self._epoch += 1
+
+    def flush(self) -> bool:
+        """Schreibt alle dirty-Bereiche synchron in einem Zug; True = nichts offen bzw. erfolgreich geschrieben."""
+        self._timer.stop()
+        if self._inflight:   # laufenden Hintergrund-Save nicht abwarten, sondern synchron mitschreiben
+            self._dirty |= self._inflight; self._inflight = set(); self._epoch += 1
+        return self._run(background=False) is not False
+
+    def _completion(self, sections: Set[str]) -> Callable[[bool], None]:
+        epoch = self._epoch
+        def done(ok: bool):
+            if epoch != self._epoch: return   # inzwischen per flush()/discard() übernommen
+            self._inflight -= sections; self._settle(sections, ok)
+            if self._dirty and not self._timer.isActive(): self._timer.start(self.delay_ms)
+        return done
+
+    def _flush_background(self):
+        if self._inflight or self._writing:   # nie zwei Saves gleichzeitig – später erneut versuchen
+            self._timer.start(self.delay_ms); return
+        self._run(background=True)
+
+    def _run(self, background: bool) -> Optional[bool]:
+        if not self._dirty: return True
+        if self._writing:   # z. B. Timer während einer Fehlermeldung des laufenden Schreibens
+            self._timer.start(self.delay_ms); return False
+        sections, self._dirty = self._dirty, set()
+        self._writing = True; ok: Optional[bool] = False
+        try:
+            ok = self._write(sections, self._completion(sections) if background else None)
+        finally:
+            self._writing = False
+            if ok is None: self._inflight |= sections
+            else: self._settle(sections, bool(ok))
+        return ok
+
+    def _settle(self, sections: Set[str], ok: bool):
+        if not ok: self._dirty |= sections
+        if not self._dirty and not self._inflight: self._first = None
+        elif not ok and self._first is None: self._first = time.monotonic()
+        self.flushed.emit(ok)
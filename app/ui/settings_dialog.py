@@ -1,14 +1,14 @@
 
 from __future__ import annotations
-import os
+import os, time
 from typing import Optional
 from PySide6.QtWidgets import (
     QDialog, QWidget, QLabel, QLineEdit, QPushButton, QFormLayout, QVBoxLayout, QHBoxLayout,
-    QFileDialog, QMessageBox, QGroupBox
+    QFileDialog, QMessageBox, QGroupBox, QComboBox, QSpinBox, QProgressBar
 )
 from PySide6.QtCore import Qt
 from ..core.settings import Settings
-from ..core import vault_ext
+from ..core import vault_ext, kdf
 
 class SettingsDialog(QDialog):
     def __init__(self, parent, settings: Settings, vault):
@@ -16,6 +16,8 @@ class SettingsDialog(QDialog):
         self.setWindowTitle("Einstellungen")
         self.settings = settings
         self.vault = vault
+        self.tasks = getattr(parent, "tasks", None)   # TaskRunner des Hauptfensters (Passwortwechsel im Hintergrund)
+        self._pwd_running = False
 
         self.riot_api = QLineEdit(getattr(settings, "riot_api_key", ""))
         self.hdev_base = QLineEdit(getattr(settings, "henrikdev_api_base", "https://api.henrikdev.xyz"))
@@ -46,8 +48,26 @@ class SettingsDialog(QDialog):
         pwd_lay.addRow("Aktuelles Passwort:", self.cur_pwd)
         pwd_lay.addRow("Neues Passwort:", self.new_pwd)
         pwd_lay.addRow("Neues Passwort (Wiederholung):", self.rep_pwd)
-        btn_change = QPushButton("Passwort ändern"); btn_change.clicked.connect(self.change_password)
-        pwd_lay.addRow("", btn_change)
+        self._btn_change = QPushButton("Passwort ändern"); self._btn_change.clicked.connect(self.change_password)
+        pwd_lay.addRow("", self._btn_change)
+        self._pwd_busy = QProgressBar(); self._pwd_busy.setRange(0, 0); self._pwd_busy.setTextVisible(False); self._pwd_busy.hide()
+        pwd_lay.addRow("", self._pwd_busy)
+
+        # Vault-Verschlüsselung (KDF); greift beim nächsten Entsperren bzw. Passwortwechsel (Re-Key braucht das Passwort)
+        kdf_box = QGroupBox("Vault-Verschlüsselung")
+        kdf_lay = QFormLayout(kdf_box)
+        pref = getattr(vault, "kdf_pref", None) or {"name": "scrypt", "target_ms": kdf.DEFAULT_TARGET_MS}
+        self.kdf_name = QComboBox(); self.kdf_name.addItem("scrypt", "scrypt")
+        if kdf.argon2_available(): self.kdf_name.addItem("Argon2id", "argon2id")
+        self.kdf_name.setCurrentIndex(max(0, self.kdf_name.findData(pref.get("name"))))
+        self.kdf_ms = QSpinBox(); self.kdf_ms.setRange(100, 5000); self.kdf_ms.setSingleStep(100); self.kdf_ms.setSuffix(" ms")
+        self.kdf_ms.setValue(int(pref.get("target_ms", kdf.DEFAULT_TARGET_MS)))
+        kdf_lay.addRow("Verfahren:", self.kdf_name)
+        kdf_lay.addRow("Ziel-Entsperrzeit:", self.kdf_ms)
+        cur = getattr(vault, "kdf", None)
+        self._kdf_cur = QLabel(", ".join(f"{k}={v}" for k, v in cur.items()) if cur else "–")
+        kdf_lay.addRow("Aktuell:", self._kdf_cur)
+        kdf_lay.addRow("", QLabel("Stärkere Vorgaben gelten ab dem nächsten Entsperren, schwächere ab dem nächsten Passwortwechsel."))
 
         # Buttons
         btns = QWidget(); hb = QHBoxLayout(btns); hb.setContentsMargins(0,0,0,0)
@@ -58,9 +78,20 @@ class SettingsDialog(QDialog):
         root = QVBoxLayout(self)
         root.addLayout(form)
         root.addWidget(pwd_box)
+        root.addWidget(kdf_box)
         root.addStretch(1)
         root.addWidget(btns)
 
+    def accept(self):
+        if self._pwd_running: return   # Dialog offen lassen, bis der Passwortwechsel fertig ist
+        if hasattr(self.vault, "set_kdf_preference"):
+            self.vault.set_kdf_preference(self.kdf_name.currentData(), self.kdf_ms.value())
+        super().accept()
+
+    def reject(self):
+        if self._pwd_running: return
+        super().reject()
+
     def browse_riot(self):
         path, _ = QFileDialog.getOpenFileName(self, "Riot Client auswählen", "", "Executable (*.exe);;Alle Dateien (*)")
         if path:
@@ -93,11 +124,35 @@ class SettingsDialog(QDialog):
             QMessageBox.warning(self, "Ungültig", "Das neue Passwort muss mindestens 4 Zeichen haben."); return
         if new != rep:
             QMessageBox.warning(self, "Ungültig", "Neues Passwort und Wiederholung stimmen nicht überein."); return
-        try:
-            vault_ext.change_password(self.vault, cur, new)
-        except Exception as e:
-            QMessageBox.critical(self, "Fehler", f"Passwort konnte nicht geändert werden:\n{e}")
-            return
-        QMessageBox.information(self, "Erfolg", "Master-Passwort wurde geändert. Bitte merke dir das neue Passwort!")
+        t0 = time.perf_counter()
+        run = lambda t=None: vault_ext.change_password(self.vault, cur, new)
+        if self.tasks is None:   # ohne Hauptfenster (z. B. Tools): synchron
+            try: run()
+            except Exception as e: self._password_failed(e, ""); return
+            self._password_changed(t0); return
+        if self.tasks.submit("Passwort ändern", run, key="vault-rekey", on_done=lambda _r: self._password_changed(t0),
+                             on_error=self._password_failed) is None:
+            QMessageBox.information(self, "Hinweis", "Ein Passwortwechsel läuft bereits."); return
+        self._set_pwd_busy(True)
+
+    def _set_pwd_busy(self, busy: bool):
+        self._pwd_running = busy
+        for w in (self.cur_pwd, self.new_pwd, self.rep_pwd, self._btn_change): w.setEnabled(not busy)
+        self._pwd_busy.setVisible(busy)
+
+    def _password_changed(self, t0: float):
+        self._set_pwd_busy(False)
+        dt_ms = round((time.perf_counter() - t0) * 1000)
+        phases = ", ".join(f"{k} {round(v)} ms" for k, v in (getattr(self.vault, "timings", None) or {}).items())
+        log = getattr(self.parent(), "log_msg", None)
+        if log: log(f"Master-Passwort geändert ({phases})", event="vault_rekey", duration_ms=dt_ms)
+        cur = getattr(self.vault, "kdf", None)
+        if cur: self._kdf_cur.setText(", ".join(f"{k}={v}" for k, v in cur.items()))
+        QMessageBox.information(self, "Erfolg", f"Master-Passwort wurde geändert ({dt_ms / 1000:.1f} s). "
+                                                "Bitte merke dir das neue Passwort!")
         # Felder leeren
         self.cur_pwd.clear(); self.new_pwd.clear(); self.rep_pwd.clear()
+
+    def _password_failed(self, exc: BaseException, tb: str):
+        self._set_pwd_busy(False)
+        QMessageBox.critical(self, "Fehler", f"Passwort konnte nicht geändert werden:\n{exc}")
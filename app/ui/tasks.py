@@ -0,0 +1,133 @@
+"""Hintergrund-Tasks für die GUI: Arbeit im QThreadPool, Ergebnisse per Signal zurück in den GUI-Thread."""
+from __future__ import annotations
+import logging, threading, time, traceback
+from typing import Any, Callable, Dict, List, Optional
+from PySide6.QtCore import QObject, QRunnable, QThreadPool, Signal, Slot
+from ..core.applog import LOGGER_NAME
+
+_file_log = logging.getLogger(LOGGER_NAME)
+
+class TaskCancelled(Exception):
+    """Darf von Worker-Funktionen geworfen werden (z. B. über Task.check()); zählt nicht als Fehler."""
+
+class Task(QObject):
+    """
+    Handle einer Hintergrund-Arbeit. Die Worker-Funktion bekommt den Task als einziges Argument
+    und meldet darüber Fortschritt (progress), Zwischenergebnisse (partial) und Log-Zeilen (log);
+    Abbruch über cancel()/cancelled. Alle Callbacks laufen im GUI-Thread – der Task lebt dort,
+    die Signale werden aus dem Worker heraus also queued zugestellt (Reihenfolge bleibt erhalten).
+    """
+    _progress = Signal(int, int, str)
+    _partial = Signal(object)
+    _log = Signal(str, str)
+    _done = Signal(object)
+    _error = Signal(object, str)
+    finished = Signal(object)   # Task; nach on_done/on_error
+
+    def __init__(self, name: str, fn: Callable[["Task"], Any], *, key: Optional[str] = None,
+                 on_done: Optional[Callable[[Any], None]] = None,
+                 on_error: Optional[Callable[[BaseException, str], None]] = None,
+                 on_progress: Optional[Callable[[int, int, str], None]] = None,
+                 on_partial: Optional[Callable[[Any], None]] = None,
+                 log: Optional[Callable[..., None]] = None, parent=None):
+        super().__init__(parent)
+        self.name = name; self.key = key; self._fn = fn
+        self._on_done = on_done; self._on_error = on_error; self._on_progress = on_progress
+        self._on_partial = on_partial; self._log_fn = log
+        self._cancel = threading.Event()
+        self.duration = 0.0   # Sekunden, gesetzt wenn fertig
+        self.failed = False
+        self._progress.connect(self._progress_slot); self._partial.connect(self._partial_slot)
+        self._log.connect(self._log_slot); self._done.connect(self._done_slot); self._error.connect(self._error_slot)
+
+    # ---- aus dem Worker ----
+    def progress(self, done: int, total: int, text: str = ""): self._progress.emit(done, total, text)
+    def partial(self, value: Any): self._partial.emit(value)
+    def log(self, msg: str, level: str = "INFO"): self._log.emit(str(msg), level)
+    @property
+    def cancelled(self) -> bool: return self._cancel.is_set()
+    def check(self):
+        if self._cancel.is_set(): raise TaskCancelled(self.name)
+
+    # ---- aus dem GUI-Thread ----
+    def cancel(self): self._cancel.set()
+
+    def _execute(self):
+        t0 = time.perf_counter()
+        try:
+            res = self._fn(self)
+        except TaskCancelled:
+            self.duration = time.perf_counter() - t0; self._done.emit(None)
+        except BaseException as e:
+            self.duration = time.perf_counter() - t0; self.failed = True; self._error.emit(e, traceback.format_exc())
+        else:
+            self.duration = time.perf_counter() - t0; self._done.emit(res)
+
+    @Slot(int, int, str)
+    def _progress_slot(self, done: int, total: int, text: str):
+        if self._on_progress: self._on_progress(done, total, text)
+    @Slot(object)
+    def _partial_slot(self, value: Any):
+        if self._on_partial: self._on_partial(value)
+    @Slot(str, str)
+    def _log_slot(self, msg: str, level: str):
+        if self._log_fn: self._log_fn(msg, level=level)
+    @Slot(object)
+    def _done_slot(self, res: Any):
+        try:
+            if self._on_done: self._on_done(res)
+        finally:
+            self.finished.emit(self)
+    @Slot(object, str)
+    def _error_slot(self, exc: BaseException, tb: str):
+        try:
+            if self._on_error: self._on_error(exc, tb)
+            elif self._log_fn: self._log_fn(f"Task '{self.name}' fehlgeschlagen: {type(exc).__name__}: {exc}\n{tb}", level="ERROR")
+        finally:
+            self.finished.emit(self)
+
+class _Runnable(QRunnable):
+    def __init__(self, task: Task):
+        super().__init__(); self.task = task; self.setAutoDelete(True)
+    def run(self): self.task._execute()
+
+class TaskRunner(QObject):
+    """
+    Eigener QThreadPool für blockierende Arbeit (Netzwerk, KDF/Krypto, Sleeps).
+    submit(key=...) verhindert Stapeln: läuft bereits ein Task mit gleichem Key, wird nichts gestartet.
+    """
+    busy_changed = Signal(list)   # Namen der laufenden Tasks ([] = idle)
+
+    def __init__(self, parent=None, *, max_threads: int = 4, log: Optional[Callable[..., None]] = None):
+        super().__init__(parent)
+        self.pool = QThreadPool(self); self.pool.setMaxThreadCount(max_threads)
+        self._log = log
+        self._active: List[Task] = []
+        self._keys: Dict[str, Task] = {}
+
+    def submit(self, name: str, fn: Callable[[Task], Any], *, key: Optional[str] = None, **callbacks) -> Optional[Task]:
+        """Startet fn(task) im Pool; Callbacks: on_done, on_error, on_progress, on_partial. None = läuft schon."""
+        if key is not None and key in self._keys:
+            return None
+        task = Task(name, fn, key=key, log=self._log, parent=self, **callbacks)
+        task.finished.connect(self._finished)
+        self._active.append(task)
+        if key is not None: self._keys[key] = task
+        self.busy_changed.emit(self.names())
+        self.pool.start(_Runnable(task))
+        return task
+
+    def running(self, key: str) -> Optional[Task]: return self._keys.get(key)
+    def names(self) -> List[str]: return [t.name for t in self._active]
+    def cancel_all(self):
+        for t in self._active: t.cancel()
+    def wait(self, msecs: int = -1) -> bool: return self.pool.waitForDone(msecs)
+
+    @Slot(object)
+    def _finished(self, task: Task):
+        if task in self._active: self._active.remove(task)
+        if task.key is not None and self._keys.get(task.key) is task: del self._keys[task.key]
+        _file_log.info("Task '%s' %s", task.name, "fehlgeschlagen" if task.failed else "fertig",
+                       extra={"event": "task", "duration_ms": round(task.duration * 1000)})
+        self.busy_changed.emit(self.names())
+        task.deleteLater()
@@ -67,9 +67,6 @@ if ($Clean) { $commonArgs += "--clean" }
 $commonArgs += @("--name", $Name, "--noconfirm")
 if (-not $Console) { $commonArgs += "--noconsole" }
 
-# Deine Ressourcen als echte Dateien neben der EXE
-$commonArgs += @("--add-data", "app\resources;app\resources")
-
 # Slim vs. Full (Qt)
 if (-not $Slim) {
   $commonArgs += @("--collect-all", "PySide6")
@@ -126,6 +123,23 @@ if ($UseUPX) {
   }
 }
 
+# Qt-Ressource kompilieren (Rank-/Menü-Icons + Logos als icons.rcc; wird beim Start registriert und aus dem Speicher gelesen).
+# Nur dieser eine Packer: ein zusätzlicher Atlas würde dieselben Icons ein zweites Mal ausliefern.
+Write-Host "Qt-Ressource (icons.rcc) kompilieren ..." -ForegroundColor Cyan
+python tools\prepare_valo_icons_downloader.py --pack-rcc app\resources\icons.rcc
+if ($LASTEXITCODE -ne 0) { Write-Host "icons.rcc konnte nicht erzeugt werden – App nutzt lose Dateien." -ForegroundColor Yellow }
+
+# Ressourcen als echte Dateien neben der EXE – mit .rcc ohne die darin gepackten Icon-Ordner/PNG-Logos (und ohne alten Atlas)
+$res = "app\resources"
+if (Test-Path "$res\icons.rcc") {
+  foreach ($f in Get-ChildItem $res -File) {
+    if (@(".png", ".qrc", ".atlas") -notcontains $f.Extension.ToLower()) { $commonArgs += @("--add-data", "$res\$($f.Name);$res") }
+  }
+  Write-Host "Icons gepackt (icons.rcc) – lose Icon-Dateien werden nicht mitgeliefert." -ForegroundColor DarkGray
+} else {
+  $commonArgs += @("--add-data", "$res;$res")
+}
+
 # Build starten
 if (-not (Test-Path $Entry)) { throw "Entry-Script '$Entry' nicht gefunden." }
 Write-Host "Baue Entry: $Entry" -ForegroundColor Cyan
@@ -0,0 +1,18 @@
+from __future__ import annotations
+import os, sys
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.core import kdf  # noqa: E402
+
+FAST_SCRYPT = {"name": "scrypt", "n": 2**10, "r": 8, "p": 1}   # Tests: schnelle KDF statt Kalibrierung
+
+@pytest.fixture(autouse=True)
+def fast_kdf(monkeypatch):
+    """Keine Kalibrierung/Cache-Datei im Home – jede neue Ableitung nutzt FAST_SCRYPT."""
+    monkeypatch.setattr(kdf, "calibrated", lambda name="scrypt", target_ms=0, cache_path=None: dict(FAST_SCRYPT))
+
+@pytest.fixture
+def vault_path(tmp_path) -> str:
+    return str(tmp_path / "vault.dat")
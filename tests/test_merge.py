@@ -0,0 +1,51 @@
+"""Import/Merge: Zuordnung per uid bzw. merge_key, Konfliktregeln, gebündeltes Übernehmen."""
+from __future__ import annotations
+import pytest
+from app.core import merge
+from app.core.models import ACCOUNTS_RESET, Account, AccountStore, Game
+
+def _acc(alias: str, riot_id: str = "", uid: str = "", game: Game = Game.valorant, **kw) -> Account:
+    return Account(alias=alias, game=game, riot_id=riot_id, uid=uid, **kw)
+
+def test_merge_key():
+    assert merge.merge_key(_acc("x", " Foo#EUW ")) == merge.merge_key(_acc("y", "foo#euw"))   # Riot-ID schlägt Alias
+    assert merge.merge_key(_acc("Main")) == merge.merge_key(_acc(" main "))
+    assert merge.merge_key(_acc("a", "foo#1")) != merge.merge_key(_acc("a", "foo#1", game=Game.lol))   # je Spiel
+
+@pytest.fixture
+def store() -> AccountStore:
+    return AccountStore([_acc("main", "a#1", "u1", tier="Gold 1", rank_updated=100.0),
+                         _acc("smurf", "b#1", "u2", tier="Iron 1"), _acc("alt", uid="u3")])
+
+def test_plan_matches_by_uid_then_key(store):
+    incoming = [_acc("umbenannt", "anders#9", "u1", tier="Gold 1", rank_updated=100.0),   # uid (Re-Import)
+                _acc("smurf", "B#1", tier="Iron 2"),                                       # Riot-ID
+                _acc("alt"), _acc("neu", "c#1"), _acc("neu2", "C#1")]                      # Alias; Duplikat
+    plan = merge.plan_merge(store, incoming, merge.REPLACE)
+    assert [a.alias for a in plan.added] == ["neu"] and plan.duplicates == 1
+    assert [(cur.uid, inc.alias) for cur, inc in plan.updated] == [("u1", "umbenannt"), ("u2", "smurf")]
+    assert plan.unchanged == 1 and plan.kept == 0
+    assert "1 neu, 2 aktualisiert, 1 unverändert" in plan.summary()
+
+@pytest.mark.parametrize("policy, updated", [(merge.KEEP, 0), (merge.REPLACE, 1), (merge.NEWER, 1)])
+def test_conflict_policies(store, policy, updated):
+    plan = merge.plan_merge(store, [_acc("main", "a#1", tier="Gold 3", rank_updated=200.0)], policy)
+    assert len(plan.updated) == updated and plan.kept == 1 - updated
+
+def test_newer_keeps_older_import(store):
+    plan = merge.plan_merge(store, [_acc("main", "a#1", tier="Iron 4", rank_updated=50.0)], merge.NEWER)
+    assert plan.kept == 1 and not plan.updated
+
+def test_unknown_policy(store):
+    with pytest.raises(ValueError): merge.plan_merge(store, [], "egal")
+
+def test_apply_merge_batches_and_takes_stats(store):
+    events: list = []; store.subscribe(lambda kind, accs: events.append((kind, sorted(a.alias for a in accs))))
+    plan = merge.plan_merge(store, [_acc("main", "a#1", tier="Gold 3", wins=7, rank_updated=200.0),
+                                    _acc("neu", "c#1", "fremd-uid")], merge.REPLACE)
+    merge.apply_merge(store, plan)
+    main = store.get("u1")
+    assert (main.tier, main.wins, main.rank_updated, main.uid) == ("Gold 3", 7, 200.0, "u1")
+    assert store.get("fremd-uid").alias == "neu"   # freie uid bleibt erhalten
+    assert [k for k, _ in events] == ["added", "changed"] and ACCOUNTS_RESET not in dict(events)
+    assert merge.plan_merge(store, [_acc("neu", "c#1")]).unchanged == 1   # erneuter Import ist ein No-op
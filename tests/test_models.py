@@ -0,0 +1,79 @@
+"""AccountStore (stabile uids, Lookup/Reihenfolge, gebündelte Events) und Account-Codec mit Schema-Migration."""
+from __future__ import annotations
+import pytest
+from app.core.models import (
+    ACCOUNT_SCHEMA, ACCOUNTS_ADDED, ACCOUNTS_CHANGED, ACCOUNTS_REMOVED, ACCOUNTS_REORDERED, ACCOUNTS_RESET, Account,
+    AccountStore, Game, Queue, migrate_account,
+)
+
+def _acc(alias: str, uid: str = "", **kw) -> Account:
+    return Account(alias=alias, game=Game.valorant, uid=uid, **kw)
+
+def _recording(store: AccountStore) -> list:
+    events: list = []; store.subscribe(lambda kind, accs: events.append((kind, sorted(a.alias for a in accs))))
+    return events
+
+def test_uids_are_assigned_for_missing_and_duplicate_ids():
+    store = AccountStore()
+    assert store.set_all([_acc("a", "x"), _acc("b"), _acc("c", "x")]) == 2
+    a, b, c = store
+    assert a.uid == "x" and b.uid and c.uid not in ("", "x") and len(set(store.ids())) == 3
+    assert store.set_all([_acc("d", "y")]) == 0
+
+def test_lookup_and_order():
+    store = AccountStore([_acc("a", "1"), _acc("b", "2"), _acc("c", "3")])
+    assert store.get("2").alias == "b" and store.get("fehlt") is None and store.get(None) is None
+    assert store.index_of("3") == 2 and store[0].alias == "a" and len(store) == 3
+    assert _acc("a", "1") not in store and store.get("1") in store   # Identität, nicht Gleichheit
+    store.reorder(["3", "fehlt", "1"])
+    assert store.ids() == ["3", "1", "2"] and store.index_of("2") == 2
+
+def test_update_keeps_uid_and_rank_fields():
+    store = AccountStore([_acc("a", "1", tier="Gold 1", wins=3, rank_updated=10.0)])
+    acc = store.get("1")
+    store.update(acc, _acc("neu", "anders", tier="Gold 2"))
+    assert (acc.alias, acc.tier, acc.uid, acc.wins, acc.rank_updated) == ("neu", "Gold 2", "1", 3, 10.0)
+
+def test_events_without_batch():
+    store = AccountStore([_acc("a", "1")]); events = _recording(store)
+    b = _acc("b"); store.add(b); store.touch(b); store.remove(b, _acc("fremd"))
+    assert events == [(ACCOUNTS_ADDED, ["b"]), (ACCOUNTS_CHANGED, ["b"]), (ACCOUNTS_REMOVED, ["b"])]
+    store.remove(_acc("fremd")); store.reorder(store.ids())
+    assert len(events) == 3   # nichts geändert → kein Event
+
+def test_batch_coalesces_per_kind():
+    store = AccountStore([_acc("a", "1"), _acc("b", "2")]); events = _recording(store)
+    with store.batch():
+        store.touch(store.get("1")); store.add(_acc("c")); store.touch(store.get("1"), store.get("2"))
+        with store.batch(): store.remove(store.get("2"))
+        assert events == []   # erst am Ende des äußersten Batches
+        store.reorder(list(reversed(store.ids())))
+    assert events == [(ACCOUNTS_REMOVED, ["b"]), (ACCOUNTS_ADDED, ["c"]), (ACCOUNTS_CHANGED, ["a", "b"]),
+                      (ACCOUNTS_REORDERED, [])]
+
+def test_batch_with_reset_reports_only_reset():
+    store = AccountStore([_acc("a", "1")]); events = _recording(store)
+    with store.batch():
+        store.add(_acc("b")); store.set_all([_acc("c")])
+    assert events == [(ACCOUNTS_RESET, [])]
+
+# ---- Account-Codec / Schema-Migration ----
+
+def test_codec_roundtrip():
+    acc = Account(alias="a", game=Game.lol, region="EUW", riot_id="x#1", queue=Queue.flex, tier="Gold II", rr=40,
+                  wins=3, losses=2, rank_updated=1.5, uid="u1")
+    d = acc.to_dict()
+    assert d["v"] == ACCOUNT_SCHEMA and d["id"] == "u1" and d["queue"] == Queue.flex.value
+    back = Account.from_dict(d)
+    assert back == acc and back.uid == "u1"
+
+def test_v1_dict_is_migrated():
+    v1 = {"uid": "u7", "alias": "alt", "game": "valorant", "queue": "SOLO", "rr": "42", "elo": "", "wins": "x"}
+    acc = Account.from_dict(v1)
+    assert (acc.game, acc.queue, acc.rr, acc.elo, acc.wins, acc.uid) == (Game.valorant, Queue.solo, 42, None, None, "u7")
+    assert "v" not in v1 and migrate_account(v1)["v"] == ACCOUNT_SCHEMA   # Original bleibt unverändert
+    assert Account.from_dict({"alias": "ohne Spiel"}).game == Game.valorant
+
+def test_newer_or_broken_schema_is_rejected():
+    with pytest.raises(ValueError): Account.from_dict({"v": ACCOUNT_SCHEMA + 1, "alias": "zukunft", "game": "Valorant"})
+    with pytest.raises(ValueError): Account.from_dict({"v": ACCOUNT_SCHEMA, "alias": "kaputt", "game": "Pong"})
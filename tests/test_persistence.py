@@ -0,0 +1,68 @@
+"""WriteBehind: Änderungen bündeln, Höchstwartezeit, flush() überholt Hintergrund-Saves, Fehler bleiben dirty."""
+from __future__ import annotations
+import time
+import pytest
+
+QtCore = pytest.importorskip("PySide6.QtCore")
+from app.ui.persistence import WriteBehind  # noqa: E402
+
+@pytest.fixture(scope="module", autouse=True)
+def qapp():
+    return QtCore.QCoreApplication.instance() or QtCore.QCoreApplication([])
+
+def _pump(cond, timeout: float = 2.0) -> bool:
+    end = time.monotonic() + timeout
+    while not cond() and time.monotonic() < end:
+        QtCore.QCoreApplication.processEvents(); time.sleep(0.005)
+    return cond()
+
+class Writer:
+    """write(sections, done): sync → Ergebnis sofort; background → done merken (wie ein laufender Task)."""
+    def __init__(self, ok: bool = True, background: bool = False):
+        self.calls: list = []; self.pending: list = []; self.ok = ok; self.background = background
+    def __call__(self, sections, done):
+        self.calls.append((set(sections), done is not None))
+        if done is not None and self.background: self.pending.append(done); return None
+        return self.ok
+
+def test_marks_are_coalesced_into_one_write():
+    w = Writer(); wb = WriteBehind(w, delay_ms=30, max_delay_ms=1000)
+    wb.mark_dirty("accounts"); wb.mark_dirty("settings"); wb.mark_dirty("accounts")
+    assert _pump(lambda: w.calls) and w.calls == [({"accounts", "settings"}, True)]
+    assert not wb.dirty and not _pump(lambda: len(w.calls) > 1, 0.1)
+
+def test_max_delay_caps_continuous_marking():
+    w = Writer(); wb = WriteBehind(w, delay_ms=50, max_delay_ms=120)
+    t0 = time.monotonic()
+    while not w.calls and time.monotonic() - t0 < 1.0:   # markiert öfter, als delay_ms Ruhe lässt
+        wb.mark_dirty("accounts"); _pump(lambda: False, 0.02)
+    assert w.calls and time.monotonic() - t0 < 0.5
+
+def test_failed_write_stays_dirty_and_is_retried():
+    w = Writer(ok=False); wb = WriteBehind(w, delay_ms=20, max_delay_ms=1000)
+    wb.mark_dirty("accounts")
+    assert _pump(lambda: w.calls) and wb.dirty == {"accounts"}
+    w.ok = True
+    assert wb.flush() and not wb.dirty and w.calls[-1] == ({"accounts"}, False)
+
+def test_flush_takes_over_background_save():
+    w = Writer(background=True); wb = WriteBehind(w, delay_ms=20, max_delay_ms=1000)
+    wb.mark_dirty("accounts")
+    assert _pump(lambda: w.pending) and wb.busy
+    epoch = wb.epoch; wb.mark_dirty("settings")
+    assert wb.flush() and w.calls[-1] == ({"accounts", "settings"}, False)   # laufende Bereiche synchron mitgeschrieben
+    assert wb.epoch != epoch and not wb.busy
+    w.pending[0](False)   # verspätetes Ergebnis des überholten Saves
+    assert not wb.dirty and not _pump(lambda: len(w.calls) > 2, 0.1)
+
+def test_background_done_false_rearms_timer():
+    w = Writer(background=True); wb = WriteBehind(w, delay_ms=20, max_delay_ms=1000)
+    wb.mark_dirty("accounts")
+    assert _pump(lambda: w.pending)
+    w.pending.pop()(False)
+    assert wb.dirty == {"accounts"} and _pump(lambda: len(w.calls) == 2)
+
+def test_discard_drops_pending_changes():
+    w = Writer(); wb = WriteBehind(w, delay_ms=20, max_delay_ms=1000)
+    wb.mark_dirty("accounts"); wb.discard()
+    assert not wb.dirty and wb.flush() and not _pump(lambda: w.calls, 0.1)
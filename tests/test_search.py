@@ -0,0 +1,75 @@
+"""Suche: Query-Parser und Token-Index (inkrementell über Store-Events)."""
+from __future__ import annotations
+import time
+import pytest
+from app.core.models import Account, AccountStore, Game
+from app.core.search import QueryError, SearchIndex, Term, parse_duration, parse_query
+
+def _acc(alias: str, tier: str = "", region: str = "", notes: str = "", game: Game = Game.valorant, **kw) -> Account:
+    return Account(alias=alias, game=game, tier=tier, region=region, notes=notes, uid=alias, **kw)
+
+def test_parse_free_text_and_fields():
+    q = parse_query("Gold  region:EUW -smurf -notes:ban")
+    assert q.terms == (Term("", ":", "gold"), Term("region", ":", "euw"), Term("", ":", "smurf", True),
+                       Term("notes", ":", "ban", True))
+    assert q.words == ["gold"]
+    assert parse_query("   ") is None and parse_query("") is None
+
+@pytest.mark.parametrize("text, op, value", [
+    ("tier>=plat", ">=", "plat"), ("tier:>=plat", ">=", "plat"), ("tier:gold", ":", "gold"),
+    ("tier=gold", "=", "gold"), ("tier<diamond", "<", "diamond"),
+])
+def test_parse_tier_comparisons(text, op, value):
+    (t,) = parse_query(text).terms
+    assert (t.field, t.op, t.value) == ("tier", op, value)
+
+def test_parse_stale_and_durations():
+    (t,) = parse_query("stale:>1d").terms
+    assert (t.field, t.op, t.value) == ("stale", ">", "1d")
+    assert parse_duration("12h") == 12 * 3600 and parse_duration("2w") == 14 * 86400 and parse_duration("1.5") == 1.5 * 86400
+
+@pytest.mark.parametrize("text", ["tier>=holz", "stale:>bald", "region>euw"])
+def test_parse_rejects_invalid_filters(text):
+    with pytest.raises(QueryError): parse_query(text)
+
+def test_unknown_field_is_free_text():
+    assert parse_query("foo:bar").terms == (Term("", ":", "foo"), Term("", ":", "bar"))
+
+@pytest.fixture
+def index():
+    store = AccountStore([_acc("main", "Gold 2", "EUW"), _acc("smurf", "Platinum 1", "EUW", "smurf acc"),
+                          _acc("na", "Diamond 3", "NA"), _acc("lol", "GOLD II", "EUW", game=Game.lol), _acc("new")])
+    return SearchIndex(store)
+
+def _run(index: SearchIndex, text: str):
+    return sorted(index.set_query(text) or [])
+
+def test_queries(index):
+    assert _run(index, "eu") == ["lol", "main", "smurf"]   # Präfix
+    assert _run(index, "platinum") == ["smurf"] and _run(index, "plat") == ["smurf"]   # kanonischer Tier-Name
+    assert _run(index, "tier>=plat") == ["na", "smurf"]
+    assert _run(index, "tier:gold") == ["lol", "main"] and _run(index, "tier=gold2") == ["lol", "main"]   # Division je Spiel
+    assert _run(index, "tier:unranked") == ["new"]
+    assert _run(index, "region:euw -smurf") == ["lol", "main"]
+    assert index.set_query("") is None and index.accepts(index.store.get("na"))
+
+def test_stale(index):
+    index.store.get("main").rank_updated = time.time() - 3 * 86400
+    index.store.get("na").rank_updated = time.time()
+    assert _run(index, "stale:>1d") == ["lol", "main", "new", "smurf"]   # nie abgerufen zählt als veraltet
+    assert _run(index, "stale:<1d") == ["na"]
+
+def test_index_follows_store_events(index):
+    store = index.store; index.set_query("euw")
+    with store.batch():
+        store.add(_acc("neu", "Iron 1", "EUW")); store.remove(store.get("main"))
+    assert index.allowed == {"lol", "smurf", "neu"}
+    store.get("na").region = "EUW"; store.touch(store.get("na"))
+    assert "na" in index.allowed and index.set_query("na") == {"na"}
+    store.set_all([_acc("x", region="EUW")])
+    assert index.set_query("euw") == {"x"} and index.set_query("main") == set()
+
+def test_invalid_query_keeps_previous_filter(index):
+    index.set_query("region:na")
+    with pytest.raises(QueryError): index.set_query("tier>=holz")
+    assert index.allowed == {"na"}
@@ -0,0 +1,42 @@
+"""Rang-Parsing: Texte aus Riot-/HenrikDev-Antworten und Handeingaben → Tier."""
+from __future__ import annotations
+import pytest
+from app.core.tiers import parse_tier, rank_delta
+
+VALO, LOL = "Valorant", "League of Legends"
+
+@pytest.mark.parametrize("game, text, tier, division", [
+    (LOL, "Gold II", "gold", 2),                  # league-v4: tier.title() + rank
+    (LOL, "GOLD II (45 LP)", "gold", 2),          # LP-Zusatz ist keine Division
+    (LOL, "Platinum IV 75 LP", "platinum", 4),
+    (LOL, "Emerald I", "emerald", 1),
+    (VALO, "Diamond 3", "diamond", 3),            # HenrikDev v3: tier.name
+    (VALO, "Immortal 3 (120 RR)", "immortal", 3),
+    (VALO, "Silber 1", "silver", 1),
+    (VALO, "gold2", "gold", 2),
+    (LOL, "plativ", "platinum", 4),
+    (VALO, "Ascendant-2", "ascendant", 2),
+])
+def test_division(game, text, tier, division):
+    t = parse_tier(game, text)
+    assert (t.tier, t.division) == (tier, division) and t.ranked
+
+@pytest.mark.parametrize("game, text, division", [(LOL, "Gold (45 LP)", 4), (LOL, "plati", 4), (VALO, "Gold", 1)])
+def test_missing_division_is_lowest(game, text, division):
+    assert parse_tier(game, text).division == division
+
+@pytest.mark.parametrize("game, text", [(VALO, "Radiant"), (LOL, "MASTER"), (LOL, "Grandmaster 512 LP"), (LOL, "Challenger I")])
+def test_apex_has_no_division(game, text):
+    t = parse_tier(game, text)
+    assert t.ranked and t.division == 0
+
+@pytest.mark.parametrize("game, text", [(VALO, "Unrated"), (LOL, "UNRANKED"), (VALO, ""), (VALO, None), (VALO, "Holz 3")])
+def test_unranked(game, text):
+    assert not parse_tier(game, text).ranked
+
+def test_ordering_and_delta():
+    assert parse_tier(LOL, "Gold I").ordinal > parse_tier(LOL, "Gold IV").ordinal   # LoL: I ist oben
+    assert parse_tier(VALO, "Gold 3").ordinal > parse_tier(VALO, "Gold 1").ordinal
+    assert rank_delta(parse_tier(VALO, "Gold 3"), parse_tier(VALO, "Platinum 1")) == 1
+    assert rank_delta(parse_tier(VALO, "Unrated"), parse_tier(VALO, "Gold 1")) is None
+    assert parse_tier(LOL, "GOLD II (45 LP)").label == "Gold II"
@@ -0,0 +1,53 @@
+"""Vault-Format v3: Snapshot + Journal (Deltas, abgerissenes Ende), Migration alter Formate."""
+from __future__ import annotations
+import base64, json, os, secrets
+import pytest
+from app.core import kdf
+from app.core.vault import VaultError
+from vault_util import accounts, create, meta, reopen
+
+def test_journal_roundtrip(vault_path):
+    v = create(vault_path); v.compact()
+    v.data["accounts"][3]["tier"] = "Radiant"; v.data["accounts"].append({"id": "z", "alias": "neu"})
+    v.data["accounts"].pop(0); v.set_settings({"theme": "dark"}); v.save()
+    assert v.journal_info()[0] == 1
+    expected = json.loads(json.dumps(v.data))
+    r = reopen(vault_path)
+    assert r.data == expected
+    r.compact(); assert r.journal_info() == (0, 0)
+    assert reopen(vault_path).data == expected
+
+def test_unchanged_save_is_noop(vault_path):
+    v = create(vault_path); v.compact(); size = os.path.getsize(vault_path)
+    v.save(); assert os.path.getsize(vault_path) == size and v.journal_info()[0] == 0
+
+def test_torn_journal_tail_is_ignored(vault_path):
+    v = create(vault_path); v.compact()
+    v.data["accounts"][0]["tier"] = "Iron 1"; v.save()
+    good = json.loads(json.dumps(v.data))
+    v.data["accounts"][1]["tier"] = "Iron 2"; v.save()
+    with open(vault_path, "r+b") as f:   # Absturz mitten im Anhängen des zweiten Deltas
+        f.truncate(os.path.getsize(vault_path) - 7)
+    r = reopen(vault_path)
+    assert r.data == good and r.journal_info()[0] == 1
+    r.data["accounts"][2]["tier"] = "Iron 3"; r.save()   # überschreibt den kaputten Rest
+    assert reopen(vault_path).data["accounts"][2]["tier"] == "Iron 3"
+
+def test_wrong_password(vault_path):
+    create(vault_path)
+    with pytest.raises(VaultError): reopen(vault_path, "falsch")
+
+def test_v1_migration(vault_path):
+    salt, nonce = secrets.token_bytes(16), secrets.token_bytes(12)
+    from cryptography.hazmat.primitives.ciphers.aead import AESGCM
+    key = kdf.derive("pw", salt, kdf.LEGACY_SCRYPT)
+    state = {"version": 1, "settings": {"a": 1}, "accounts": accounts(3)}
+    ct = AESGCM(key).encrypt(nonce, json.dumps(state).encode(), None)
+    hdr = json.dumps({"version": 1, "kdf": "scrypt", "salt": base64.b64encode(salt).decode(),
+                       "nonce": base64.b64encode(nonce).decode()}).encode()
+    with open(vault_path, "wb") as f: f.write(len(hdr).to_bytes(4, "big") + hdr + ct)
+    v = reopen(vault_path)
+    assert v.data == state and v.kdf == kdf.LEGACY_SCRYPT
+    v.save()   # alte Formate → neuer Snapshot
+    assert meta(vault_path)["version"] == 3
+    assert reopen(vault_path).data == state
@@ -0,0 +1,21 @@
+"""Vault v3: komprimierte Snapshots/Records/Journal (none/zlib/lzma), Umstellung alter Vaults."""
+from __future__ import annotations
+import json
+import pytest
+from app.core.vault import Vault
+from vault_util import accounts, create, meta, reopen
+
+@pytest.mark.parametrize("codec", ["none", "zlib", "lzma"])
+def test_compression_roundtrip(vault_path, codec):
+    v = create(vault_path, compression=codec); v.compact()
+    v.data["accounts"][0]["notes"] = "geändert"; v.save()
+    expected = json.loads(json.dumps(v.data))
+    assert meta(vault_path)["compression"] == codec
+    r = Vault(vault_path); r.compression = codec; r.open("pw")
+    assert r.data == expected
+
+def test_uncompressed_vault_is_converted_on_compact(vault_path):
+    create(vault_path, compression="none")
+    v = reopen(vault_path)
+    assert v.needs_compaction() and v.compact()
+    assert meta(vault_path)["compression"] == "zlib" and reopen(vault_path).get_accounts() == accounts()
@@ -0,0 +1,16 @@
+"""Vault v3: Records bleiben nach dem Entsperren verschlüsselt, bis Accounts gebraucht werden."""
+from __future__ import annotations
+from vault_util import accounts, create, reopen
+
+def test_lazy_records(vault_path):
+    create(vault_path).compact()
+    v = reopen(vault_path)
+    assert v._lazy and v.get_settings() == {} and v._lazy   # Header ohne Records entschlüsselt
+    assert v.get_accounts() == accounts() and not v._lazy
+
+def test_lazy_header_only_save(vault_path):
+    create(vault_path).compact()
+    v = reopen(vault_path); v.set_settings({"x": 1}); v.save()
+    assert v._lazy and v.journal_info()[0] == 1
+    r = reopen(vault_path)
+    assert r.get_settings() == {"x": 1} and r.get_accounts() == accounts()
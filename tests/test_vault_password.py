@@ -0,0 +1,17 @@
+"""Vault v3: Passwortwechsel – alles neu verschlüsselt, auch noch gesperrte Records."""
+from __future__ import annotations
+import pytest
+from app.core.vault import VaultError
+from vault_util import accounts, create, reopen
+
+def test_change_password_roundtrip(vault_path):
+    v = create(vault_path); v.compact(); zdict = v._zdict; v.lock()
+    v = reopen(vault_path); assert v._lazy
+    with pytest.raises(VaultError): v.change_password("falsch", "neu")
+    v.change_password("pw", "neu")
+    assert v._zdict == zdict   # Preset-Dictionary aus Klartext, nicht aus Lazy-Stubs
+    with pytest.raises(VaultError): reopen(vault_path, "pw")
+    r = reopen(vault_path, "neu")
+    assert r.get_accounts() == accounts()
+    r.data["accounts"][0]["tier"] = "Radiant"; r.save()
+    assert reopen(vault_path, "neu").data["accounts"][0]["tier"] == "Radiant"
@@ -0,0 +1,22 @@
+"""Vault: externe Änderungen erkennen – Save schlägt mit VaultConflict fehl, reload() übernimmt die Datei."""
+from __future__ import annotations
+import pytest
+from app.core.vault import VaultConflict
+from vault_util import create, reopen
+
+def test_external_change_conflict_and_reload(vault_path):
+    v = create(vault_path); v.compact()
+    other = reopen(vault_path); other.data["accounts"][0]["tier"] = "Iron 1"; other.save()
+    assert v.changed_on_disk()
+    v.data["accounts"][1]["tier"] = "Iron 2"
+    with pytest.raises(VaultConflict): v.save()
+    v.reload()
+    assert v.get_accounts()[0]["tier"] == "Iron 1" and not v.changed_on_disk()
+
+def test_reload_keeps_key_and_lazy_state(vault_path):
+    v = create(vault_path); v.compact()
+    other = reopen(vault_path); other.set_settings({"theme": "dark"}); other.save(); other.compact()
+    v.reload()
+    assert v.get_settings() == {"theme": "dark"} and v._lazy   # gecachter Key, Records erst bei Bedarf
+    v.data["accounts"][2]["notes"] = "lokal"; v.save()
+    assert reopen(vault_path).data["accounts"][2]["notes"] == "lokal"
@@ -0,0 +1,20 @@
+"""Gemeinsame Helfer der Vault-Tests (kein Testmodul)."""
+from __future__ import annotations
+import json
+from app.core.vault import Vault
+
+def accounts(n: int = 20):
+    return [{"id": f"u{i}", "alias": f"a{i}", "game": "Valorant", "tier": "Gold 2", "riot_id": f"x#{i}", "notes": "n" * i}
+            for i in range(n)]
+
+def create(path: str, accs=None, compression: str = "zlib") -> Vault:
+    v = Vault(path); v.compression = compression; v.create("pw")
+    v.replace_accounts(accs if accs is not None else accounts()); v.save()
+    return v
+
+def reopen(path: str, pw: str = "pw") -> Vault:
+    v = Vault(path); v.open(pw); return v
+
+def meta(path: str) -> dict:
+    with open(path, "rb") as f: data = f.read()
+    n = int.from_bytes(data[:4], "big"); return json.loads(data[4:4+n])
@@ -52,6 +52,9 @@ def main():
         print("   → vault.data ist None / nicht verfügbar."); sys.exit(4)
 
     print("   Keys in vault.data:", list(data.keys()))
+    if hasattr(vault, "journal_info"):
+        n, size = vault.journal_info()
+        print(f"   Journal: {n} Einträge, {size} bytes" + (" (Kompaktierung fällig)" if vault.needs_compaction() else ""))
     accs = data.get("accounts")
     if isinstance(accs, list):
         print(f"   accounts: {len(accs)} Einträge")
@@ -16,11 +16,21 @@ Alternativ ohne Internet (lokal generieren):
 Eigene ZIP-URL:
   python tools/prepare_valo_icons.py --download-url https://.../valorant_ranks.zip --dest app/resources/valo_tracker_icons --size 128 --force-png
 
+Icons für den Build als binäre Qt-Ressource packen (Rank-Icons, Menü-Icons, Logos → app/resources/icons.rcc,
+braucht pyside6-rcc aus PySide6; build.ps1 ruft das auf):
+  python tools/prepare_valo_icons.py --pack-rcc
+  (erzeugt daneben icons.qrc; die App registriert icons.rcc beim Start und liest zuerst daraus;
+   kombinierbar mit --download/--generate; dann wird nach dem Normalisieren gepackt)
+
+Alternative ohne Qt-Tools (nur eines von beiden ausliefern – sonst liegen die Icons doppelt im Bundle):
+  python tools/prepare_valo_icons.py --pack-atlas
+
 Hinweis zur Nutzung Dritter-Packs:
   Prüfe die Lizenz deiner Quelle (emoji.gg, Fandom, Shops, GitHub, ...). Dieses Skript legt optional eine ATTRIBUTION.txt ab.
 """
 
-import argparse, re, sys, shutil, os, io, tempfile, zipfile, urllib.parse, json
+import argparse, re, sys, shutil, os, io, tempfile, zipfile, urllib.parse, json, subprocess
+from xml.sax.saxutils import escape
 from typing import Optional, Tuple, List
 
 # Optional: Pillow für Generierung/Skalierung/PNG
@@ -30,7 +40,12 @@ try:
 except Exception:
     _HAS_PIL = False
 
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+if ROOT not in sys.path: sys.path.insert(0, ROOT)
+
 VALID_EXT = {".png", ".jpg", ".jpeg", ".webp", ".svg"}
+ATLAS_FOLDERS = ["valo_tracker_icons", "menu_icons"]   # was die App lokal liest (LoL-Embleme kommen aus dem Cache)
+ATLAS_TOPLEVEL_EXT = {".png"}  # Logos direkt in app/resources
 
 BASE_MAP = {
     "iron": "iron",
@@ -218,6 +233,75 @@ def process_folder(src_folder: str, dest: str, size: Optional[int], force_png: b
                 print(f"[FEHLER] {fn}: {e}", file=sys.stderr)
     return sorted(set(created))
 
+# -------------------- Atlas --------------------
+
+def collect_resource_names(res_root: str, folders: List[str]) -> List[str]:
+    """Relative Namen der zu packenden Icons (Ordner + Top-Level-Logos), '/' als Trenner."""
+    names: List[str] = []
+    for folder in folders:
+        src = os.path.join(res_root, folder)
+        if not os.path.isdir(src):
+            continue
+        for fn in sorted(os.listdir(src)):
+            if os.path.splitext(fn)[1].lower() in VALID_EXT:
+                names.append(f"{folder}/{fn}")
+    for fn in sorted(os.listdir(res_root)):
+        if os.path.isfile(os.path.join(res_root, fn)) and os.path.splitext(fn)[1].lower() in ATLAS_TOPLEVEL_EXT:
+            names.append(fn)
+    return names
+
+def collect_atlas_entries(res_root: str, folders: List[str]) -> List[Tuple[str, bytes]]:
+    """Sammelt Icons (Ordner + Top-Level-Logos) als (relativer Name, Bytes)."""
+    entries: List[Tuple[str, bytes]] = []
+    for name in collect_resource_names(res_root, folders):
+        with open(os.path.join(res_root, *name.split("/")), "rb") as f:
+            entries.append((name, f.read()))
+    return entries
+
+def pack_atlas(res_root: str, out_path: str, folders: List[str]) -> int:
+    from app.core.atlas import write_atlas
+    entries = collect_atlas_entries(res_root, folders)
+    if not entries:
+        raise RuntimeError(f"Keine Icons unter {res_root} gefunden.")
+    n = write_atlas(out_path, entries)
+    size = os.path.getsize(out_path)
+    print(f"[OK] Atlas: {n} Icons → {out_path} ({size/1024:.1f} KiB)")
+    return n
+
+def _find_rcc() -> List[str]:
+    exe = shutil.which("pyside6-rcc")
+    if exe:
+        return [exe]
+    try:   # venv ohne Scripts im PATH: rcc-Binary liegt im PySide6-Paket
+        import PySide6
+        base = os.path.dirname(PySide6.__file__)
+        for cand in ("rcc.exe", os.path.join("Qt", "libexec", "rcc"), "rcc"):
+            if os.path.isfile(os.path.join(base, cand)):
+                return [os.path.join(base, cand)]
+    except ImportError:
+        pass
+    raise RuntimeError("pyside6-rcc nicht gefunden (PySide6 installiert?).")
+
+def pack_rcc(res_root: str, out_path: str, folders: List[str]) -> int:
+    """Schreibt icons.qrc (Aliase = Namen wie im Atlas) und kompiliert sie mit pyside6-rcc --binary."""
+    names = collect_resource_names(res_root, folders)
+    if not names:
+        raise RuntimeError(f"Keine Icons unter {res_root} gefunden.")
+    qrc_path = os.path.splitext(out_path)[0] + ".qrc"
+    qrc_dir = os.path.dirname(os.path.abspath(qrc_path))
+    lines = ['<!DOCTYPE RCC>', '<RCC version="1.0">', '<qresource prefix="/">']
+    for name in names:
+        rel = os.path.relpath(os.path.join(os.path.abspath(res_root), *name.split("/")), qrc_dir).replace("\\", "/")
+        lines.append(f'  <file alias="{escape(name)}">{escape(rel)}</file>')
+    lines += ['</qresource>', '</RCC>', '']
+    with open(qrc_path, "w", encoding="utf-8") as f:
+        f.write("\n".join(lines))
+    # PNG/WebP sind schon komprimiert → unkomprimiert ablegen, spart das Entpacken beim Laden
+    subprocess.run(_find_rcc() + ["--binary", "--no-compress", "-o", out_path, qrc_path], check=True)
+    size = os.path.getsize(out_path)
+    print(f"[OK] Qt-Ressource: {len(names)} Icons → {out_path} ({size/1024:.1f} KiB)")
+    return len(names)
+
 def main():
     ap = argparse.ArgumentParser(description="Valorant Rank Icons: Download / Generate / Normalize")
     grpD = ap.add_mutually_exclusive_group()
@@ -232,8 +316,24 @@ def main():
     ap.add_argument("--overwrite", action="store_true", help="Existierende Dateien überschreiben.")
     ap.add_argument("--write-attribution", action="store_true", help="ATTRIBUTION.txt im Zielordner ablegen.")
     ap.add_argument("--dry-run", action="store_true", help="Nur anzeigen, was passieren würde.")
+    ap.add_argument("--pack-atlas", nargs="?", const="app/resources/icons.atlas", metavar="OUT",
+                    help="Icons in eine Atlas-Datei packen (Default: app/resources/icons.atlas).")
+    ap.add_argument("--atlas-root", default="app/resources", help="Ressourcen-Wurzel für den Atlas (Default: app/resources)")
+    ap.add_argument("--atlas-folder", action="append", default=None,
+                    help=f"Ordner unter --atlas-root, die gepackt werden (mehrfach; Default: {', '.join(ATLAS_FOLDERS)})")
+    ap.add_argument("--pack-rcc", nargs="?", const="app/resources/icons.rcc", metavar="OUT",
+                    help="Icons als binäre Qt-Ressource kompilieren (Default: app/resources/icons.rcc; Ordner wie beim Atlas).")
     args = ap.parse_args()
 
+    if (args.pack_atlas or args.pack_rcc) and not (args.download or args.download_url or args.generate):
+        if args.dry_run:
+            if args.pack_atlas: print(f"[DRY-RUN] Atlas: {args.atlas_root} → {args.pack_atlas}")
+            if args.pack_rcc: print(f"[DRY-RUN] Qt-Ressource: {args.atlas_root} → {args.pack_rcc}")
+            return 0
+        if args.pack_atlas: pack_atlas(args.atlas_root, args.pack_atlas, args.atlas_folder or ATLAS_FOLDERS)
+        if args.pack_rcc: pack_rcc(args.atlas_root, args.pack_rcc, args.atlas_folder or ATLAS_FOLDERS)
+        return 0
+
     ensure_dir(args.dest)
 
     with tempfile.TemporaryDirectory() as tmp:
@@ -268,5 +368,10 @@ def main():
                 f.write(attribution + "\\n")
             print("[OK] ATTRIBUTION.txt geschrieben.")
 
+    if args.pack_atlas:
+        pack_atlas(args.atlas_root, args.pack_atlas, args.atlas_folder or ATLAS_FOLDERS)
+    if args.pack_rcc:
+        pack_rcc(args.atlas_root, args.pack_rcc, args.atlas_folder or ATLAS_FOLDERS)
+
 if __name__ == "__main__":
     sys.exit(main())